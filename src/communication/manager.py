@@ -6,6 +6,8 @@
 ##
 
 import sys
+import threading
+import time
 from typing import Any, Optional, TextIO
 
 import constants
@@ -42,6 +44,7 @@ class CommunicationManager:
         self.async_reader: Optional[AsyncInputReader] = None
         self.ponder_manager = None  # Set by context if pondering enabled
         self.use_async = game_constants.PONDER_ENABLED
+        self.command_start = time.time()  # Receipt time of the current command
 
     def send_response(self, response: Response) -> None:
         output = response.to_output()
@@ -58,6 +61,7 @@ class CommunicationManager:
             return None
 
     def process_command(self, command: Command) -> list[Response]:
+        self.command_start = time.time()
         if command.type == CommandType.END:
             self.running = False
             return []
@@ -84,6 +88,11 @@ class CommunicationManager:
             size = command.params[constants.PARAM_SIZE]
             if size <= 0:
                 return ErrorResponse("Invalid board size")
+            if size > game_constants.MAX_BOARD_SIZE:
+                return ErrorResponse(
+                    f"{constants.UNSUPPORTED_SIZE}: {size} > "
+                    f"{game_constants.MAX_BOARD_SIZE}"
+                )
             if hasattr(self.context, constants.METHOD_INITIALIZE_BOARD):
                 self.context.initialize_board(size, size)
                 return OkResponse()
@@ -129,7 +138,7 @@ class CommunicationManager:
 
                         threading.Thread(target=background_warm, daemon=True).start()
             elif hasattr(self.context, constants.METHOD_GET_BEST_MOVE):
-                move_x, move_y = self.context.get_best_move()
+                move_x, move_y = self._get_best_move_with_watchdog()
             else:
                 return ErrorResponse(constants.CONTEXT_NO_MOVE_GEN)
 
@@ -150,15 +159,46 @@ class CommunicationManager:
             if hasattr(self.context, constants.METHOD_PROCESS_BOARD):
                 self.context.process_board(command.moves())
             if hasattr(self.context, constants.METHOD_GET_BEST_MOVE):
-                move_x, move_y = self.context.get_best_move()
+                move_x, move_y = self._get_best_move_with_watchdog()
                 return MoveResponse(move_x, move_y)
             return ErrorResponse(constants.CONTEXT_NO_MOVE_GEN)
         except Exception as e:
             return ErrorResponse(f"{constants.BOARD_PROCESSING_FAILED}: {str(e)}")
 
+    def _get_best_move_with_watchdog(self) -> tuple[int, int]:
+        """
+        Get the context's best move, replying by the hard deadline regardless.
+
+        The search runs in a worker thread. If it has not returned by
+        WATCHDOG_DEADLINE after the command was received (hung search, or
+        it raised), the context's emergency move is sent instead.
+        """
+        if not (
+            game_constants.WATCHDOG_ENABLED
+            and hasattr(self.context, constants.METHOD_GET_EMERGENCY_MOVE)
+        ):
+            return self.context.get_best_move()
+
+        result = {}
+
+        def search():
+            try:
+                result["move"] = self.context.get_best_move()
+            except Exception as e:
+                result["error"] = e
+
+        worker = threading.Thread(target=search, daemon=True)
+        worker.start()
+        elapsed = time.time() - self.command_start
+        worker.join(timeout=max(0.0, game_constants.WATCHDOG_DEADLINE - elapsed))
+
+        if "move" in result:
+            return result["move"]
+        return self.context.get_emergency_move()
+
     def read_board_command(self, board_cmd: BoardCommand) -> BoardCommand:
         while True:
-            line = self.read_line()
+            line = self._get_next_line()
             if line is None:
                 break
             result = self.parser.parse_board_line(line)
@@ -210,6 +250,9 @@ class CommunicationManager:
                 )
                 if line is not None:
                     return line
+                # Input closed and fully consumed
+                if not self.async_reader.running and not self.async_reader.has_input():
+                    return None
                 # No input yet - pondering continues in background
             return None
         else:
@@ -24,6 +24,7 @@ OK_RESPONSE = "OK"
 PARSE_ERROR = "Parse error"
 UNEXPECTED_ERROR = "Unexpected error"
 INITIALIZATION_FAILED = "Initialization failed"
+UNSUPPORTED_SIZE = "Unsupported board size"
 CONTEXT_NO_INIT = "Context does not support initialization"
 OPENING_MOVE_FAILED = "Opening move failed"
 CONTEXT_NO_OPENING = "Context does not support opening move"
@@ -46,4 +47,5 @@ METHOD_INITIALIZE_BOARD = "initialize_board"
 METHOD_GET_OPENING_MOVE = "get_opening_move"
 METHOD_PROCESS_OPPONENT_MOVE = "process_opponent_move"
 METHOD_GET_BEST_MOVE = "get_best_move"
+METHOD_GET_EMERGENCY_MOVE = "get_emergency_move"
 METHOD_PROCESS_BOARD = "process_board"
@@ -8,7 +8,20 @@
 from . import constants
 from .ai import MinMaxAI
 from .board import Board
+from .calibration import Calibration, calibrate
 from .opening_book import OpeningBook, get_opening_book
 from .ponder import PonderManager
+from .search_context import SearchContext, StopToken
 
-__all__ = ["constants", "MinMaxAI", "Board", "OpeningBook", "get_opening_book", "PonderManager"]
+__all__ = [
+    "constants",
+    "MinMaxAI",
+    "Board",
+    "Calibration",
+    "calibrate",
+    "OpeningBook",
+    "get_opening_book",
+    "PonderManager",
+    "SearchContext",
+    "StopToken",
+]
@@ -8,10 +8,18 @@
 import threading
 import time
 from collections import OrderedDict
-from typing import List, Optional, Tuple
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Iterator, List, Optional, Tuple
 
 from . import constants
+from .calibration import Calibration
+from .history import HistoryTable
 from .opening_book import get_opening_book
+from .pattern_scanner import scan_grid
+from .search_context import SearchContext
+from .threats import best_kind, threats_at
+from .time_manager import IterationTimer
+from .vct_pool import VCTPool, prove_move, refute_move
 from utils.logger import get_logger
 
 
@@ -59,23 +67,91 @@ class MinMaxAI:
         self.max_depth = max_depth
         self.time_limit = time_limit
         self.use_iterative_deepening = use_iterative_deepening
-        self.stop_search = False
-        self.nodes = 0
+        self.ctx = SearchContext()  # Context of the current turn's search
+        self.warm_ctx = SearchContext()  # Background TT warming after a ponder hit
         self.transposition_table = LRUTranspositionTable(max_size=constants.TT_MAX_SIZE)
-        self.killer_moves = {}
-        self.history_table = {1: {}, 2: {}}  # player -> {(x,y): score}
+        # board_hash -> evaluate() score, shared by every board copy
+        self.position_evals = LRUTranspositionTable(max_size=constants.EVAL_CACHE_SIZE)
+        self.eval_probes = 0
+        self.eval_hits = 0
+        # (board_hash, move, player) -> _move_heuristic score (never stale)
+        self.heuristic_cache = LRUTranspositionTable(
+            max_size=constants.HEURISTIC_CACHE_SIZE
+        )
+        # (board_hash, player) -> tactical moves (position-only, never stale)
+        self.qs_move_cache = LRUTranspositionTable(
+            max_size=constants.QUIESCENCE_MOVE_CACHE_SIZE
+        )
+        self.history = HistoryTable()  # Cell-indexed history and countermoves
+        # Forward pruning techniques in use (A/B switches, see game.bench)
+        self.pruning = {
+            "futility": constants.FUTILITY_ENABLED,
+            "lmp": constants.LMP_ENABLED,
+            "probcut": constants.PROBCUT_ENABLED,
+        }
+        self.extend_threats = constants.EXTENSIONS_ENABLED  # Four/block extensions
+        # Inner-node candidates
+        self.adaptive_radius = constants.ADAPTIVE_RADIUS_ENABLED
         self.threat_cache = {}  # (board_hash, x, y, player) -> threats dict
+        # Root threat moves of the VCT search proven in parallel, if enabled
+        self.vct_pool = VCTPool() if constants.VCT_WORKERS > 0 else None
+        self.portfolio = constants.PORTFOLIO_ENABLED  # Race solvers and full search
+        self.vcf_check = constants.VCF_CHECK_ENABLED  # Opponent VCF vs chosen move
+        self.symmetry = constants.SYMMETRY_ENABLED  # Canonical hashes when symmetric
+        # (board_hash, attacker) -> (first move of a VCF, or None when refuted,
+        # fours left to the search), kept across turns
+        self.vcf_cache = LRUTranspositionTable(max_size=constants.VCF_CACHE_SIZE)
+        # (board_hash, to_move, attacker) -> (True, winning move) or
+        # (False, depth left when refuted), kept across turns
+        self.vct_table = LRUTranspositionTable(max_size=constants.VCT_TABLE_SIZE)
         self.age = 0
+        self.calibration = Calibration()  # Hand-tuned margins until calibrate()
+        # board_hash -> best move known so far (read by the watchdog)
+        self.emergency_moves = LRUTranspositionTable(
+            max_size=constants.EMERGENCY_CACHE_SIZE
+        )
+
+    @property
+    def nodes(self) -> int:
+        """Nodes searched by the current turn's context."""
+        return self.ctx.nodes
+
+    @nodes.setter
+    def nodes(self, value: int) -> None:
+        self.ctx.nodes = value
 
-    def get_best_move(self, board, player: int) -> Optional[Tuple[int, int]]:
-        self.stop_search = False
-        self.nodes = 0
-        self.age += 1
-        self._decay_history()  # Decay history scores each search
-        self.threat_cache.clear()  # Clear threat cache for new search
+    def stop(self) -> None:
+        """Cancel the current turn's search and background warming."""
+        self.ctx.cancel()
+        self.warm_ctx.cancel()
+
+    def get_best_move(
+        self, board, player: int, ctx: Optional[SearchContext] = None
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Find our move for board.
+
+        Without ctx this is the turn's search: it cancels whatever is left
+        of the previous turn, ages the tables and becomes self.ctx. Pondering
+        passes its own ctx so it can be cancelled without touching the turn.
+        """
+        if ctx is None:
+            self.stop()
+            ctx = SearchContext()
+            self.ctx = ctx
+            self.age += 1
+            self.eval_probes = self.eval_hits = 0
+            self._decay_history()  # Decay history scores each search
+            self.threat_cache.clear()  # Clear threat cache for new search
         start_time = time.time()
         logger = get_logger()
         opponent = 3 - player
+        root_hash = board.current_hash
+
+        # Always keep a valid reply ready for the watchdog
+        valid_moves = board.get_valid_moves()
+        if valid_moves:
+            self._set_emergency_move(root_hash, valid_moves[0])
 
         # Check opening book first (for early game moves)
         if board.move_count <= constants.OPENING_BOOK_MAX_MOVES:
@@ -83,13 +159,17 @@ class MinMaxAI:
             book_move = opening_book.lookup(board)
             if book_move is not None:
                 logger.info(f"Opening book move: {book_move}")
+                self._set_emergency_move(root_hash, book_move)
                 return book_move
 
+        self._set_symmetry(board)
+
         # Ultra-fast critical check (< 1ms) - detects win/block moves
         # Don't return immediately - use time banking to warm TT
         critical_move = self._check_immediate_critical(board, player)
         if critical_move is not None:
             logger.info(f"Critical move (win/block5): {critical_move}")
+            self._set_emergency_move(root_hash, critical_move)
             # Will be handled via time banking below
 
         # Phase 0: Global threat scan - find critical opponent threats
@@ -225,43 +305,133 @@ class MinMaxAI:
         if force_block_move is None:
             immediate_move = self._get_immediate_move(board, player)
 
+        # Portfolio: the solvers run beside the full search (Phase 3) instead
+        portfolio = (
+            self.portfolio and self.vct_pool is not None and not self.vct_pool.broken
+        )
+
         # Phase 2: Threat Space Search (VCT) if no immediate move
         vct_move = None
-        if force_block_move is None and immediate_move is None:
-            vct_move = self._threat_space_search(board, player, max_depth=14, time_limit=1.5)
+        if force_block_move is None and immediate_move is None and not portfolio:
+            vct_move = self._threat_space_search(
+                board, player, max_depth=constants.VCT_MAX_DEPTH,
+                time_limit=1.5, ctx=ctx
+            )
             if vct_move is not None:
                 logger.info(f"VCT found: {vct_move}")
 
         # Determine if we have a decided move (prioritize: critical > force_block > immediate > vct)
         decided_move = critical_move or force_block_move or immediate_move or vct_move
+        if decided_move is not None:
+            self._set_emergency_move(root_hash, decided_move)
 
         # Phase 3: Time Banking on ALL decided moves, or Full Search
         result = None
         if decided_move is not None and constants.TIME_BANK_ENABLED:
             # We have a decided move - use remaining time to warm TT
-            result = self._time_banked_return(board, player, decided_move, start_time)
+            result = self._time_banked_return(
+                board, player, decided_move, start_time, ctx
+            )
         elif decided_move is not None:
             # Time banking disabled - return immediately
             result = decided_move
+        elif portfolio:
+            # No decided move - full search racing our and the opponent's solvers
+            result = self._portfolio_search(board, player, start_time, ctx)
         else:
             # No decided move - do full iterative deepening search
-            result = self._full_iterative_search(board, player, start_time)
+            result = self._full_iterative_search(board, player, start_time, ctx)
+
+        # The chosen move must not leave the opponent a VCF (forced moves aside)
+        if result is not None and result not in (critical_move, force_block_move):
+            result = self._vcf_safety_check(board, player, result, ctx)
+            self._set_emergency_move(root_hash, result)
 
         # Final fallback: ensure we ALWAYS return a valid move (prevents timeout)
         if result is None:
-            valid_moves = board.get_valid_moves()
             if valid_moves:
                 result = valid_moves[0]
-                logger.warning(f"Final fallback to first valid move: {result}")
+                logger.warn(f"Final fallback to first valid move: {result}")
 
         return result
 
+    def _set_symmetry(self, board) -> None:
+        """
+        Turn symmetry tracking on or off for this turn's root position.
+
+        Canonical TT keys and symmetric root pruning are used while the
+        early-game position maps onto itself; off (no cost per move) from
+        the first asymmetric position on.
+        """
+        if (
+            self.symmetry and board.move_count <= constants.SYMMETRY_MAX_MOVES
+            and board.stabilizer()
+        ):
+            if board.sym_hashes is None:
+                board.enable_symmetry()
+        else:
+            board.disable_symmetry()
+
+    def _unique_root_moves(
+        self, board, moves: List[Tuple[int, int]]
+    ) -> List[Tuple[int, int]]:
+        """
+        Keep one move per class of moves equivalent under symmetry.
+
+        The classes are those of the position's symmetries; all moves are
+        kept when symmetry tracking is off.
+        """
+        if board.sym_hashes is None:
+            return moves
+        stabilizer = board.stabilizer()
+        if not stabilizer:
+            return moves
+        seen = set()
+        unique = []
+        for move in moves:
+            cell = board.encode(move[0], move[1])
+            if cell in seen:
+                continue
+            unique.append(move)
+            seen.update(board.to_symmetry(cell, t) for t in stabilizer)
+        return unique
+
+    def _response_deadline(self) -> float:
+        """
+        Seconds of the turn left to search and time banking.
+
+        The VCF check runs after both, so its budget is reserved up front.
+        """
+        deadline = self.calibration.response_deadline
+        if self.vcf_check:
+            deadline -= constants.VCF_CHECK_BUDGET
+        return deadline
+
+    def _set_emergency_move(self, board_hash: int, move: Tuple[int, int]) -> None:
+        """Record the best move known so far for a root position."""
+        self.emergency_moves[board_hash] = move
+
+    def get_emergency_move(self, board) -> Optional[Tuple[int, int]]:
+        """
+        Return an always-valid move for board without searching.
+
+        Used by the watchdog when the search misses the hard deadline:
+        the best move recorded so far for this position (critical checks,
+        decided moves, completed iterations), else the first valid move.
+        """
+        move = self.emergency_moves.get(board.current_hash)
+        if move is not None and board.is_valid_position(move[0], move[1]):
+            return move
+        valid_moves = board.get_valid_moves()
+        return valid_moves[0] if valid_moves else None
+
     def _time_banked_return(
         self,
         board,
         player: int,
         decided_move: Tuple[int, int],
-        start_time: float
+        start_time: float,
+        ctx: SearchContext
     ) -> Tuple[int, int]:
         """
         Return decided move at deadline, using remaining time productively.
@@ -273,8 +443,9 @@ class MinMaxAI:
         This ensures we use the full 4.5s even when we found a fast move.
         """
         logger = get_logger()
+        root_hash = board.current_hash
         elapsed = time.time() - start_time
-        remaining = constants.RESPONSE_DEADLINE - elapsed
+        remaining = self._response_deadline() - elapsed
 
         logger.debug(f"Time bank: elapsed={elapsed:.3f}s, remaining={remaining:.3f}s")
 
@@ -285,6 +456,9 @@ class MinMaxAI:
         # Create board with our decided move played
         future_board = board.copy()
         future_board.place_stone(decided_move[0], decided_move[1], player)
+        # Phase 2 places and undoes probe stones: it gets its own copy, so
+        # the caller's board is never written while the thread may run on
+        attack_board = board.copy()
 
         # Predict opponent responses for TT warming
         opponent = 3 - player
@@ -294,6 +468,8 @@ class MinMaxAI:
 
         # Storage for potential better move found during counter-attack search
         better_move = [None]
+        warmup_depth = self.calibration.warmup_depth(constants.TT_WARMUP_DEPTH)
+        bank_ctx = ctx.fork()
 
         def productive_thread():
             """Use time for TT warming AND counter-attack search."""
@@ -304,21 +480,21 @@ class MinMaxAI:
             warm_start = time.time()
 
             for pred_move in predicted_responses:
-                if self.stop_search or (time.time() - warm_start) > warm_budget:
+                if bank_ctx.stopped or (time.time() - warm_start) > warm_budget:
                     break
 
                 pred_board = future_board.copy()
                 pred_board.place_stone(pred_move[0], pred_move[1], opponent)
 
                 # Iterative deepening on each position for deeper TT entries
-                for d in range(2, constants.TT_WARMUP_DEPTH + 1, 2):
-                    if self.stop_search or (time.time() - warm_start) > warm_budget:
+                for d in range(2, warmup_depth + 1, 2):
+                    if bank_ctx.stopped or (time.time() - warm_start) > warm_budget:
                         break
-                    self._search_at_depth(pred_board, player, depth=d)
+                    self._search_at_depth(pred_board, player, depth=d, ctx=bank_ctx)
 
             # Phase 2: Counter-attack search (~35% of remaining time)
             # Skip if stopped or if decided_move is already a winning move
-            if self.stop_search:
+            if bank_ctx.stopped:
                 return
 
             # Only search for counter-attack if we're defending (not winning)
@@ -328,30 +504,31 @@ class MinMaxAI:
             # Quick VCT search to see if we have a winning sequence
             try:
                 vct = self._threat_space_search(
-                    board, player, max_depth=10, time_limit=attack_budget
+                    attack_board, player, max_depth=10, time_limit=attack_budget,
+                    ctx=bank_ctx
                 )
-                if vct and vct != decided_move:
+                if vct and vct != decided_move and not bank_ctx.stopped:
                     # Found a potentially better offensive move
                     better_move[0] = vct
+                    self._set_emergency_move(root_hash, vct)
                     logger.info(f"Counter-attack found: {vct} (was defending: {decided_move})")
             except Exception:
                 # Ignore errors in counter-attack search
                 pass
 
-        # Spawn thread and reset stop flag
-        self.stop_search = False
         thread = threading.Thread(target=productive_thread, daemon=True)
         thread.start()
 
         current_elapsed = time.time() - start_time
-        actual_remaining = constants.RESPONSE_DEADLINE - current_elapsed
-        sleep_time = max(0, actual_remaining - 0.30)
+        actual_remaining = self._response_deadline() - current_elapsed
+        sleep_time = max(0, actual_remaining - self.calibration.bank_margin)
         if sleep_time > 0:
             time.sleep(sleep_time)
 
         # Signal stop and wait for cleanup
-        self.stop_search = True
+        bank_ctx.cancel()
         thread.join(timeout=0.03)
+        ctx.merge(bank_ctx)
 
         # Return better move if found, otherwise decided move
         final_move = better_move[0] if better_move[0] else decided_move
@@ -364,7 +541,8 @@ class MinMaxAI:
         board,
         player: int,
         our_move: Tuple[int, int],
-        time_budget: float
+        time_budget: float,
+        ctx: SearchContext
     ) -> None:
         """
         Quick TT warming after iterative search.
@@ -386,31 +564,35 @@ class MinMaxAI:
         opponent = 3 - player
         predictions = self._get_top_opponent_moves(future_board, opponent, count=2)
 
-        self.stop_search = False
+        warm_ctx = ctx.fork(deadline=start + time_budget)
         warmed = 0
 
         for pred_move in predictions:
             # Check time BEFORE starting search
-            if time.time() - start > time_budget * 0.8:
+            if warm_ctx.stopped or time.time() - start > time_budget * 0.8:
                 break
 
             pred_board = future_board.copy()
             pred_board.place_stone(pred_move[0], pred_move[1], opponent)
 
             # Very shallow search to stay fast (depth 2 instead of 4)
-            self._search_at_depth(pred_board, player, depth=2)
+            self._search_at_depth(pred_board, player, depth=2, ctx=warm_ctx)
             warmed += 1
 
+        ctx.merge(warm_ctx)
+
         logger.debug(f"Quick TT warm: {warmed}/{len(predictions)} in {time.time()-start:.2f}s")
 
     def _warm_tt_background(self, board, player: int) -> None:
         """
         Non-blocking TT warming (runs in background after ponder hit).
-        Continues until stop_search is set or work is done.
+        Continues until stop() or the next turn's search cancels it.
         Called from a daemon thread, so it won't block the response.
         """
         logger = get_logger()
-        self.stop_search = False
+        self.warm_ctx.cancel()
+        ctx = SearchContext()
+        self.warm_ctx = ctx
         opponent = 3 - player
 
         # Predict opponent responses and search them
@@ -418,11 +600,15 @@ class MinMaxAI:
 
         warmed = 0
         for pred_move in predicted_responses:
-            if self.stop_search:
+            if ctx.stopped:
                 break
             pred_board = board.copy()
             pred_board.place_stone(pred_move[0], pred_move[1], opponent)
-            self._search_at_depth(pred_board, player, depth=constants.TT_WARMUP_DEPTH)
+            self._search_at_depth(
+                pred_board, player,
+                depth=self.calibration.warmup_depth(constants.TT_WARMUP_DEPTH),
+                ctx=ctx
+            )
             warmed += 1
 
         logger.debug(f"Background TT warm: {warmed}/{len(predicted_responses)} done")
@@ -431,71 +617,251 @@ class MinMaxAI:
         self,
         board,
         player: int,
-        start_time: float
+        start_time: float,
+        ctx: SearchContext
     ) -> Optional[Tuple[int, int]]:
-        """Full iterative deepening search with time control and aspiration windows."""
+        """
+        Full iterative deepening search with time control and aspiration windows.
+
+        The driver polls an IterationTimer: a stable root stops the search
+        early, a root that just changed its mind extends it up to the deadline.
+        """
         logger = get_logger()
+        root_hash = board.current_hash
         best_move = [None]
-        final_depth = [1]
-        search_finished = [False]
+        final_depth = [0]
+        search_ctx = ctx.fork()
+        timer = IterationTimer(
+            search_start=time.time() - start_time,
+            hard_limit=(
+                self._response_deadline() - self.calibration.search_margin
+            ),
+        )
 
         def search_thread():
             current_depth = 1
             previous_value = 0  # Initial guess for aspiration windows
 
-            while not self.stop_search and current_depth <= constants.MAX_DEPTH:
+            while not search_ctx.stopped and current_depth <= constants.MAX_DEPTH:
                 # Use aspiration windows for depth >= ASPIRATION_MIN_DEPTH
                 if current_depth >= constants.ASPIRATION_MIN_DEPTH:
                     alpha = previous_value - constants.ASPIRATION_DELTA
                     beta = previous_value + constants.ASPIRATION_DELTA
 
                     move, value = self._search_at_depth_with_window(
-                        board, player, current_depth, alpha, beta
+                        board, player, current_depth, alpha, beta, ctx=search_ctx
                     )
 
                     # Re-search with full window if outside aspiration bounds
                     if value <= alpha or value >= beta:
-                        move, value = self._search_at_depth(board, player, current_depth)
+                        move, value = self._search_at_depth(
+                            board, player, current_depth, ctx=search_ctx
+                        )
                 else:
-                    move, value = self._search_at_depth(board, player, current_depth)
+                    move, value = self._search_at_depth(
+                        board, player, current_depth, ctx=search_ctx
+                    )
+
+                # An interrupted iteration scored its unsearched moves as 0,
+                # only use it when no iteration has completed yet
+                if search_ctx.stopped:
+                    if best_move[0] is None:
+                        best_move[0] = move
+                    break
 
                 if move is not None:
                     best_move[0] = move
                     previous_value = value
+                    timer.record(current_depth, move, value, time.time() - start_time)
+                    self._set_emergency_move(root_hash, move)
 
                 final_depth[0] = current_depth
                 current_depth += 1
 
-            search_finished[0] = True
-
         thread = threading.Thread(target=search_thread, daemon=True)
         thread.start()
 
-        # Wait for search time (leave 0.3s safety margin)
-        search_time = constants.RESPONSE_DEADLINE - 0.3
-        elapsed = time.time() - start_time
-        time.sleep(max(0, search_time - elapsed))
+        # Poll until the timer says stop (or every depth has been searched)
+        while thread.is_alive():
+            if timer.should_stop(time.time() - start_time):
+                break
+            thread.join(timeout=constants.SEARCH_POLL_INTERVAL)
+        else:
+            timer.stop_reason = "complete"
 
-        self.stop_search = True
-        thread.join(timeout=0.1)
+        search_ctx.cancel()
+        thread.join(timeout=self.calibration.join_timeout)
+        ctx.merge(search_ctx)
 
         total_elapsed = time.time() - start_time
-        logger.search(final_depth[0], self.nodes, total_elapsed, best_move[0])
+        stats = timer.stats()
+        stats["eval_hits"] = f"{self.eval_hits / max(self.eval_probes, 1):.0%}"
+        stats["ply_nodes"] = "/".join(map(str, search_ctx.ply_nodes()))
+        stats["pruned"] = "/".join(
+            f"{technique}:{count}" for technique, count in search_ctx.pruned.items()
+        )
+        stats["extensions"] = (
+            f"{search_ctx.extensions}/{search_ctx.extension_nodes} nodes"
+        )
+        logger.search(final_depth[0], ctx.nodes, total_elapsed, best_move[0], stats)
 
         # Time banking: use remaining time to warm TT for next turn (only if enough time)
-        remaining = constants.RESPONSE_DEADLINE - (time.time() - start_time)
-        if best_move[0] is not None and constants.TIME_BANK_ENABLED and remaining > 0.2:
-            self._quick_tt_warm(board, player, best_move[0], remaining - 0.15)
+        # An early stop banks its time instead; pondering warms the TT anyway
+        remaining = self._response_deadline() - (time.time() - start_time)
+        if (
+            best_move[0] is not None
+            and constants.TIME_BANK_ENABLED
+            and timer.stop_reason == "deadline"
+            and remaining > 0.2
+        ):
+            self._quick_tt_warm(board, player, best_move[0], remaining - 0.15, ctx)
 
         # Fallback: if no move found, return first valid move (prevents timeout/None)
         if best_move[0] is None:
             valid_moves = board.get_valid_moves()
             if valid_moves:
                 best_move[0] = valid_moves[0]
-                logger.warning(f"Fallback to first valid move in iterative search: {best_move[0]}")
+                logger.warn(
+                    f"Fallback to first valid move in iterative search: {best_move[0]}"
+                )
 
         return best_move[0]
 
+    def _portfolio_search(
+        self,
+        board,
+        player: int,
+        start_time: float,
+        ctx: SearchContext
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Full search racing the VCT pool's solvers for the whole turn.
+
+        The workers try to prove each of our root threat moves and look for
+        the opponent's VCT against our best-ordered root moves and against
+        every move the full search prefers. This coordinator returns a
+        proven win at once and vetoes refuted root moves in the full
+        search. Otherwise the full search's move is used at the deadline.
+        While another search holds the pool, only the full search runs.
+        """
+        pool = self.vct_pool
+        if not pool.lock.acquire(blocking=False):
+            return self._full_iterative_search(board, player, start_time, ctx)
+        try:
+            return self._portfolio_race(board, player, start_time, ctx)
+        finally:
+            pool.lock.release()
+
+    def _portfolio_race(
+        self,
+        board,
+        player: int,
+        start_time: float,
+        ctx: SearchContext
+    ) -> Optional[Tuple[int, int]]:
+        """_portfolio_search once it holds the pool's lock."""
+        logger = get_logger()
+        pool = self.vct_pool
+        root_hash = board.current_hash
+        deadline = start_time + (
+            self._response_deadline() - self.calibration.search_margin
+        )
+        search_ctx = ctx.fork()
+        vetoed = search_ctx.vetoed
+
+        proofs = {}  # future -> (rank, our root threat move)
+        refutations = {}  # future -> our root move it answers
+        generation = 0
+
+        def check(move):
+            future = pool.submit(
+                generation, refute_move, board, player, move,
+                constants.PORTFOLIO_REFUTE_DEPTH, deadline
+            )
+            refutations[future] = move
+            return future
+
+        try:
+            generation = pool.begin()
+            if not self._has_winning_move(board, player):
+                threat_moves = self._score_moves(
+                    board, self._get_threat_moves(board, player), player
+                )
+                for rank, (move, _) in enumerate(
+                    threat_moves[:constants.VCT_POOL_ROOT_MOVES]
+                ):
+                    future = pool.submit(
+                        generation, prove_move, board, player, move,
+                        constants.VCT_MAX_DEPTH, deadline
+                    )
+                    proofs[future] = (rank, move)
+            root_moves = self._score_moves(board, board.get_valid_moves(), player)
+            for move, _ in root_moves[:constants.PORTFOLIO_VETO_MOVES]:
+                check(move)
+        except Exception as e:
+            pool.fail(e)
+
+        result = [None]
+
+        def search_thread():
+            result[0] = self._full_iterative_search(
+                board, player, start_time, search_ctx
+            )
+
+        thread = threading.Thread(target=search_thread, daemon=True)
+        thread.start()
+
+        win = None
+        pending = set(proofs) | set(refutations)
+        while thread.is_alive() and not pool.broken:
+            if not pending:
+                thread.join(timeout=constants.VCT_POOL_POLL)
+            done, pending = wait(
+                pending, timeout=constants.VCT_POOL_POLL,
+                return_when=FIRST_COMPLETED
+            )
+            try:
+                proven = [proofs[f] for f in done if f in proofs and pool.result(f)]
+                if proven:
+                    win = min(proven)[1]
+                    break
+                for future in done:
+                    reply = refutations.get(future) and pool.result(future)
+                    if reply:
+                        vetoed.add(refutations[future])
+                        logger.info(
+                            f"Portfolio veto: {refutations[future]} refuted by {reply}"
+                        )
+                # Also check the full search's current choice
+                current = self.emergency_moves.get(root_hash)
+                if current is not None and current not in refutations.values():
+                    pending.add(check(current))
+            except Exception as e:
+                pool.fail(e)
+        pool.cancel(generation, pending)
+
+        if win is not None:
+            logger.info(f"Portfolio: VCT found {win}")
+            search_ctx.cancel()
+            thread.join(timeout=self.calibration.join_timeout)
+            self._set_emergency_move(root_hash, win)
+            return win
+
+        thread.join()
+        ctx.merge(search_ctx)
+        move = result[0]
+        if move in vetoed:
+            # The veto came after the last completed iteration
+            alternatives = [
+                m for m, _ in self._score_moves(board, board.get_valid_moves(), player)
+                if m not in vetoed
+            ]
+            if alternatives:
+                logger.info(f"Portfolio: {move} vetoed, playing {alternatives[0]}")
+                move = alternatives[0]
+                self._set_emergency_move(root_hash, move)
+        return move
+
     def _get_top_opponent_moves(
         self,
         board,
@@ -503,12 +869,7 @@ class MinMaxAI:
         count: int = 5
     ) -> List[Tuple[int, int]]:
         """Get top N predicted opponent moves by heuristic."""
-        moves = board.get_valid_moves()
-        scored_moves = []
-        for move in moves:
-            score = self._move_heuristic(board, move, opponent)
-            scored_moves.append((move, score))
-        scored_moves.sort(key=lambda x: -x[1])
+        scored_moves = self._score_moves(board, board.get_valid_moves(), opponent)
         return [m[0] for m in scored_moves[:count]]
 
     def _get_best_move_fixed_depth(
@@ -536,27 +897,6 @@ class MinMaxAI:
 
         return best_move
 
-    def _search_at_depth(
-        self, board, player: int, depth: int
-    ) -> Tuple[Optional[Tuple[int, int]], int]:
-        opponent = 3 - player
-        best_move = None
-        best_value = -constants.INFINITY
-
-        moves = board.get_valid_moves()
-
-        for move in moves:
-            board.place_stone(move[0], move[1], player)
-            value = -self.negamax(
-                board, depth - 1, -constants.INFINITY, constants.INFINITY, opponent
-            )
-            board.undo_stone(move[0], move[1], player)
-            if value > best_value:
-                best_value = value
-                best_move = move
-
-        return best_move, best_value
-
     def _get_depth(self, move_count: int) -> int:
         if move_count < 10:
             return constants.DEPTH_EARLY
@@ -566,18 +906,36 @@ class MinMaxAI:
             return constants.DEPTH_LATE
 
     def negamax(
-        self, board, depth: int, alpha: int, beta: int, current_player: int
+        self, board, depth: int, alpha: int, beta: int, current_player: int,
+        ctx: Optional[SearchContext] = None, ply: int = 0, extensions: int = 0
     ) -> int:
-        if self.stop_search:
+        """
+        Alpha-beta search of board to depth, from current_player's side.
+
+        Forcing moves are extended by one ply: a move making a four, and
+        any reply to the opponent's four (a forced block). extensions
+        counts the plies already extended on this path; once it reaches
+        EXTENSION_MAX_PLIES nothing more is extended, which bounds ply by
+        MAX_PLY.
+        """
+        if ctx is None:
+            ctx = self.ctx
+        if ctx.stopped:
             return 0
-        self.nodes += 1
+        ctx.nodes += 1
+        frame = ctx.stack[ply]
+        frame.nodes += 1
 
         hash_key = board.current_hash
+        sym = 0
+        if board.sym_hashes is not None:
+            # Symmetric images share the entry; its move is stored canonical
+            hash_key, sym = board.canonical_hash()
         tt_best_move = None
 
         if hash_key in self.transposition_table:
             entry = self.transposition_table[hash_key]
-            tt_best_move = entry.get("best_move")
+            tt_best_move = board.from_symmetry(entry.get("best_move"), sym)
             if entry["age"] == self.age and entry["depth"] >= depth:
                 if entry["flag"] == constants.EXACT:
                     return entry["value"]
@@ -590,69 +948,121 @@ class MinMaxAI:
             return self.evaluate(board) * (1 if current_player == 1 else -1)
 
         if depth == 0:
-            return self.quiescence_search(board, alpha, beta, current_player)
+            return self.quiescence_search(
+                board, alpha, beta, current_player, ctx=ctx, ply=ply
+            )
 
         max_eval = -constants.INFINITY
         best_move = None
-        moves = board.get_valid_moves()
         opponent = 3 - current_player
         original_alpha = alpha
 
-        # Move ordering: TT best move first, then killer moves, then by history
-        if tt_best_move and tt_best_move in moves:
-            moves.remove(tt_best_move)
-            moves.insert(0, tt_best_move)
-
-        killers = self.killer_moves.get(depth, [])
-        for killer in reversed(killers):
-            if killer in moves and killer != tt_best_move:
-                moves.remove(killer)
-                moves.insert(1 if tt_best_move else 0, killer)
+        # Forward pruning: null-window nodes only (see constants)
+        futile = False
+        lmp_limit = constants.INFINITY
+        if beta - alpha == 1:
+            pruning = self.pruning
+            if pruning["futility"] and depth <= constants.FUTILITY_MAX_DEPTH:
+                static_eval = self.evaluate(board) * (1 if current_player == 1 else -1)
+                frame.static_eval = static_eval
+                futile = static_eval + constants.FUTILITY_MARGINS[depth] <= alpha
+            if pruning["lmp"] and depth <= constants.LMP_MAX_DEPTH:
+                lmp_limit = constants.LMP_MOVE_COUNTS[depth]
+            if (
+                pruning["probcut"]
+                and depth >= constants.PROBCUT_MIN_DEPTH
+                and abs(beta) < constants.SCORE_FIVE
+            ):
+                value = self._probcut(
+                    board, depth, beta, current_player, ctx, ply, extensions
+                )
+                if value is not None:
+                    ctx.pruned["probcut"] += 1
+                    return value
 
-        # Sort remaining moves by history heuristic
-        # Keep TT and killer moves at front by giving them high scores
-        def history_sort_key(m):
-            if m == tt_best_move:
-                return constants.INFINITY
-            if m in killers:
-                return constants.INFINITY - 1
-            return self._get_history_score(m, current_player)
+        # Moves are generated stage by stage: a cutoff on the TT move or a
+        # killer never pays for generating and ordering the quiet moves
+        moves = self._staged_moves(board, current_player, ply, tt_best_move, ctx)
 
-        moves.sort(key=history_sort_key, reverse=True)
+        width = board.width
+        # Forcing moves are searched one ply deeper while the path's budget lasts
+        can_extend = self.extend_threats and extensions < constants.EXTENSION_MAX_PLIES
+        blocking = bool(ply) and ctx.stack[ply - 1].four
 
         for move_index, move in enumerate(moves):
-            if self.stop_search:
+            if ctx.stopped:
                 break
 
-            board.place_stone(move[0], move[1], current_player)
+            y, x = divmod(move, width)
+            four = can_extend and self._makes_four(board, x, y, current_player)
+            board.place_stone(x, y, current_player)
+            frame.move = move
+            frame.four = four
+
+            # Futility / late move pruning of quiet moves, never the first
+            # move and never in a forcing position
+            tactical = None
+            if move_index and (futile or move_index >= lmp_limit) and not frame.forced:
+                tactical = self._is_tactical_move(board, (x, y), current_player)
+                if not tactical:
+                    board.undo_stone(x, y, current_player)
+                    ctx.pruned["futility" if futile else "lmp"] += 1
+                    continue
+
+            extend = can_extend and (four or blocking)
+            child_depth = depth if extend else depth - 1
+            child_extensions = extensions + 1 if extend else extensions
+            if extend:
+                ctx.extensions += 1
+                nodes_before = ctx.nodes
 
             # Determine if LMR applies to this move
             use_lmr = (
+                not extend and
                 move_index >= constants.LMR_FULL_MOVES and
                 depth >= constants.LMR_MIN_DEPTH and
-                not self._is_tactical_move(board, move, current_player)
+                tactical is None and
+                not self._is_tactical_move(board, (x, y), current_player)
             )
 
             if move_index == 0:
                 # PV move: full window, full depth
-                eval = -self.negamax(board, depth - 1, -beta, -alpha, opponent)
+                eval = -self.negamax(
+                    board, child_depth, -beta, -alpha, opponent, ctx, ply + 1,
+                    child_extensions
+                )
             elif use_lmr:
                 # LMR: reduced depth, null window
                 reduced_depth = max(1, depth - 1 - constants.LMR_REDUCTION)
-                eval = -self.negamax(board, reduced_depth, -alpha - 1, -alpha, opponent)
+                eval = -self.negamax(
+                    board, reduced_depth, -alpha - 1, -alpha, opponent, ctx, ply + 1,
+                    extensions
+                )
 
                 # Re-search with full depth if improved
                 if eval > alpha:
-                    eval = -self.negamax(board, depth - 1, -beta, -alpha, opponent)
+                    eval = -self.negamax(
+                        board, depth - 1, -beta, -alpha, opponent, ctx, ply + 1,
+                        extensions
+                    )
             else:
                 # Non-PV without LMR: null window, full depth (PVS)
-                eval = -self.negamax(board, depth - 1, -alpha - 1, -alpha, opponent)
+                eval = -self.negamax(
+                    board, child_depth, -alpha - 1, -alpha, opponent, ctx, ply + 1,
+                    child_extensions
+                )
 
                 # Re-search with full window if improved
                 if alpha < eval < beta:
-                    eval = -self.negamax(board, depth - 1, -beta, -alpha, opponent)
+                    eval = -self.negamax(
+                        board, child_depth, -beta, -alpha, opponent, ctx, ply + 1,
+                        child_extensions
+                    )
 
-            board.undo_stone(move[0], move[1], current_player)
+            board.undo_stone(x, y, current_player)
+            if extend and not extensions:
+                # Outermost extension of the path: nested ones are included
+                ctx.extension_nodes += ctx.nodes - nodes_before
 
             if eval > max_eval:
                 max_eval = eval
@@ -660,8 +1070,12 @@ class MinMaxAI:
 
             alpha = max(alpha, eval)
             if alpha >= beta:
-                self._add_killer_move(depth, move)
+                self._add_killer_move(ply, move, ctx)
                 self._update_history(move, current_player, depth)
+                if ply:
+                    self.history.set_counter(
+                        current_player, ctx.stack[ply - 1].move, move
+                    )
                 break
 
         if max_eval <= original_alpha:
@@ -675,27 +1089,202 @@ class MinMaxAI:
             "depth": depth,
             "flag": flag,
             "age": self.age,
-            "best_move": best_move,
+            "best_move": board.to_symmetry(best_move, sym),
         }
 
         return max_eval
 
-    def _add_killer_move(self, depth: int, move: Tuple[int, int]) -> None:
-        """Track killer moves (moves that cause beta cutoffs)."""
-        if depth not in self.killer_moves:
-            self.killer_moves[depth] = []
-        killers = self.killer_moves[depth]
-        if move not in killers:
-            killers.insert(0, move)
-            if len(killers) > 2:
-                killers.pop()
+    def _probcut(
+        self, board, depth: int, beta: int, player: int,
+        ctx: SearchContext, ply: int, extensions: int = 0
+    ) -> Optional[int]:
+        """
+        Try a ProbCut cutoff with tactical moves in a reduced search.
+
+        A tactical move that beats beta + PROBCUT_MARGIN in a search
+        reduced by PROBCUT_REDUCTION is assumed to make the full depth
+        search fail high too.
+
+        Returns:
+            The fail-high value, or None when no move proves the cut.
+        """
+        raised_beta = beta + constants.PROBCUT_MARGIN
+        opponent = 3 - player
+        frame = ctx.stack[ply]
+        moves = self._tactical_moves(board, player)
+        for move in moves[:constants.PROBCUT_MAX_MOVES]:
+            frame.four = self._makes_four(board, move[0], move[1], player)
+            board.place_stone(move[0], move[1], player)
+            frame.move = board.encode(move[0], move[1])
+            value = -self.negamax(
+                board, depth - 1 - constants.PROBCUT_REDUCTION,
+                -raised_beta, -raised_beta + 1, opponent, ctx, ply + 1, extensions
+            )
+            board.undo_stone(move[0], move[1], player)
+            if ctx.stopped:
+                return None
+            if value >= raised_beta:
+                return value
+        return None
+
+    def _staged_moves(
+        self, board, player: int, ply: int,
+        tt_move: Optional[int], ctx: SearchContext
+    ) -> Iterator[int]:
+        """
+        Staged move picker for negamax.
+
+        Yields, without duplicates:
+        1. the TT move, unless the position is forcing and the TT move
+           lies outside its relevance zone (see _forced_replies)
+        2. if the position is forcing, the rest of its relevance zone by
+           history score, and nothing else
+        3. killer moves of this ply that are legal here
+        4. the countermove to the opponent's previous move
+        5. quiet moves by history score, sorted in the ply's move buffer
+
+        The forcing check sees every square in MOVE_RADIUS; stages 3 to 5
+        only pick from Board.get_candidate_cells when the adaptive radius
+        is on.
+
+        Moves are encoded cells (see Board.encode). The board must be
+        restored between two next() calls (negamax undoes each move before
+        asking for the next one).
+        """
+        moves = board.get_valid_cells()
+        # Raw epoch-weighted scores: same order as the decayed ones
+        history = self.history.raw[player]
+
+        # The forcing check comes first: a TT move stored by a non-forcing
+        # search of this position must not widen a forcing node
+        frame = ctx.stack[ply]
+        forced = self._forced_replies(board, player, moves)
+        frame.forced = forced is not None
+        if (
+            tt_move is not None
+            and board.cells[tt_move] == 0
+            and (forced is None or tt_move in forced)
+        ):
+            yield tt_move
+        else:
+            tt_move = None
+
+        if forced is not None:
+            forced.sort(key=lambda m: -history[m])
+            for move in forced:
+                if move != tt_move:
+                    yield move
+            return
+
+        if self.adaptive_radius:
+            moves = board.get_candidate_cells()
+        remaining = set(moves)
+        remaining.discard(tt_move)
+
+        for killer in frame.killers:
+            if killer in remaining:
+                remaining.discard(killer)
+                yield killer
+
+        if ply:
+            counter = self.history.counter(player, ctx.stack[ply - 1].move)
+            if counter in remaining:
+                remaining.discard(counter)
+                yield counter
+
+        # Sorting in C beats popping a heap of (score, move) tuples, and
+        # the buffer is reused by every node of this ply
+        quiet = frame.moves
+        quiet[:] = remaining
+        quiet.sort(key=history.__getitem__, reverse=True)
+        yield from quiet
+
+    def _forced_replies(
+        self, board, player: int, moves: List[int]
+    ) -> Optional[List[int]]:
+        """
+        Relevance zone of the side to move, or None when nothing is forced.
+
+        In order:
+        - an immediate win: that move alone (Board.win_squares)
+        - the opponent's fours: only the squares blocking them (idem)
+        - the opponent's open threes, from one run-length pass over the
+          candidate squares: the squares where they would make an
+          open four, the two ends of that four, and our own four-making
+          counter-threats (the classic defences against a three)
 
-    def _update_history(self, move: Tuple[int, int], player: int, depth: int) -> None:
+        Returns:
+            The replies worth searching (encoded cells, like moves), or None
+            to search every move.
+        """
+        opponent = 3 - player
+        wins = board.win_squares[player]
+        if wins:
+            return [min(wins)]
+        blocks = board.win_squares[opponent]
+        if blocks:
+            return sorted(blocks)
+
+        grid = board.grid
+        width, height = board.width, board.height
+        win_length = constants.WIN_LENGTH
+        zone = set()
+
+        for move in moves:
+            y, x = divmod(move, width)
+            for dx, dy in constants.DIRECTIONS:
+                count = 1
+                nx, ny = x + dx, y + dy
+                while 0 <= nx < width and 0 <= ny < height and grid[ny][nx] == opponent:
+                    count += 1
+                    nx += dx
+                    ny += dy
+                px, py = x - dx, y - dy
+                while 0 <= px < width and 0 <= py < height and grid[py][px] == opponent:
+                    count += 1
+                    px -= dx
+                    py -= dy
+
+                if (
+                    count == win_length - 1
+                    and 0 <= nx < width and 0 <= ny < height and grid[ny][nx] == 0
+                    and 0 <= px < width and 0 <= py < height and grid[py][px] == 0
+                ):
+                    # Opponent would make an open four here
+                    zone.update((move, ny * width + nx, py * width + px))
+
+        if not zone:
+            return None
+
+        for move in moves:
+            if move not in zone and self._makes_four(
+                board, move % width, move // width, player
+            ):
+                zone.add(move)
+        return [move for move in moves if move in zone]
+
+    def _makes_four(self, board, x: int, y: int, player: int) -> bool:
+        """Check if playing the empty square (x, y) gives player a four."""
+        return y * board.width + x in board.four_squares[player]
+
+    def _add_killer_move(
+        self, ply: int, move: int,
+        ctx: Optional[SearchContext] = None
+    ) -> None:
+        """Track killer moves (moves that cause beta cutoffs) of a search."""
+        if ctx is None:
+            ctx = self.ctx
+        killers = ctx.stack[ply].killers
+        if killers[0] != move:
+            killers[1] = killers[0]
+            killers[0] = move
+
+    def _update_history(self, move: int, player: int, depth: int) -> None:
         """
         Update history score for a move that caused a beta cutoff.
 
         Args:
-            move: The move (x, y)
+            move: The encoded move (see Board.encode)
             player: Player who made the move
             depth: Search depth where cutoff occurred (deeper = more valuable)
         """
@@ -705,36 +1294,23 @@ class MinMaxAI:
         else:
             bonus = 1
 
-        if move not in self.history_table[player]:
-            self.history_table[player][move] = 0
-
-        self.history_table[player][move] += bonus
-
-        # Cap to prevent overflow
-        if self.history_table[player][move] > constants.HISTORY_MAX_VALUE:
-            self.history_table[player][move] = constants.HISTORY_MAX_VALUE
+        self.history.update(move, player, bonus)
 
     def _decay_history(self) -> None:
         """
         Decay all history scores to prevent stale data from dominating.
-        Called at the start of each new search (when age increments).
+        Called at the start of each new search (when age increments); O(1)
+        since the table only advances its epoch weight.
         """
-        for player in [1, 2]:
-            for move in list(self.history_table[player].keys()):
-                self.history_table[player][move] = int(
-                    self.history_table[player][move] * constants.HISTORY_DECAY_FACTOR
-                )
-            # Remove entries that decayed to 0
-            self.history_table[player] = {
-                m: s for m, s in self.history_table[player].items() if s > 0
-            }
+        self.history.decay()
 
-    def _get_history_score(self, move: Tuple[int, int], player: int) -> int:
+    def _get_history_score(self, move: int, player: int) -> int:
         """Get history score for a move."""
-        return self.history_table[player].get(move, 0)
+        return self.history.score(move, player)
 
     def quiescence_search(
-        self, board, alpha: int, beta: int, current_player: int, qs_depth: int = 0
+        self, board, alpha: int, beta: int, current_player: int, qs_depth: int = 0,
+        ctx: Optional[SearchContext] = None, ply: int = 0
     ) -> int:
         """
         Quiescence search - continue searching only tactical moves at leaf nodes.
@@ -743,22 +1319,53 @@ class MinMaxAI:
         the horizon effect where a critical threat is missed just beyond
         the search depth.
 
+        Quiescence nodes share the transposition table with a negative depth
+        (-1 at the first quiescence ply, -2 at the next...), so main-search
+        probes never take a quiescence value and quiescence never overwrites
+        a main-search entry of the same age.
+
         Args:
             board: Current board state
             alpha: Alpha bound
             beta: Beta bound
             current_player: Player to move (1 or 2)
             qs_depth: Current quiescence depth (starts at 0)
+            ctx: Search context (defaults to the current turn's)
+            ply: Distance from the root, indexing ctx.stack
 
         Returns:
             Evaluation score for the position
         """
-        if self.stop_search:
+        if ctx is None:
+            ctx = self.ctx
+        if ctx.stopped:
             return 0
-        self.nodes += 1
+        ctx.nodes += 1
+        frame = ctx.stack[ply]
+        frame.nodes += 1
+
+        hash_key = board.current_hash
+        sym = 0
+        if board.sym_hashes is not None:
+            hash_key, sym = board.canonical_hash()
+        tt_depth = -(qs_depth + 1)
+        entry = self.transposition_table.get(hash_key)
+        if (
+            entry is not None
+            and entry["age"] == self.age
+            and entry["depth"] >= tt_depth
+        ):
+            if entry["flag"] == constants.EXACT:
+                return entry["value"]
+            elif entry["flag"] == constants.LOWER and entry["value"] >= beta:
+                return entry["value"]
+            elif entry["flag"] == constants.UPPER and entry["value"] <= alpha:
+                return entry["value"]
+        original_alpha = alpha
 
         # Stand-pat evaluation: the score if we choose not to make any tactical move
         stand_pat = self.evaluate(board) * (1 if current_player == 1 else -1)
+        frame.static_eval = stand_pat
 
         # Beta cutoff: position is already too good for opponent
         if stand_pat >= beta:
@@ -775,30 +1382,68 @@ class MinMaxAI:
         if stand_pat + constants.QUIESCENCE_DELTA < alpha:
             return alpha
 
-        tactical_moves = self._get_quiescence_moves(board, current_player)
-
+        tactical_moves = self._tactical_moves(board, current_player)
         if not tactical_moves:
             return stand_pat
 
         opponent = 3 - current_player
+        best_move = None
 
         for move in tactical_moves:
-            if self.stop_search:
-                break
+            if ctx.stopped:
+                return alpha
 
             board.place_stone(move[0], move[1], current_player)
 
-            score = -self.quiescence_search(board, -beta, -alpha, opponent, qs_depth + 1)
+            score = -self.quiescence_search(
+                board, -beta, -alpha, opponent, qs_depth + 1, ctx, ply + 1
+            )
 
             board.undo_stone(move[0], move[1], current_player)
 
             if score >= beta:
+                if not ctx.stopped:
+                    self._store_quiescence(
+                        hash_key, beta, tt_depth, constants.LOWER,
+                        board.to_symmetry(board.encode(move[0], move[1]), sym)
+                    )
                 return beta  # Beta cutoff
             if score > alpha:
                 alpha = score
+                best_move = board.encode(move[0], move[1])
 
+        if not ctx.stopped:
+            flag = constants.EXACT if alpha > original_alpha else constants.UPPER
+            self._store_quiescence(
+                hash_key, alpha, tt_depth, flag, board.to_symmetry(best_move, sym)
+            )
         return alpha
 
+    def _store_quiescence(
+        self, hash_key: int, value: int, depth: int, flag: int,
+        best_move: Optional[int]
+    ) -> None:
+        """Store a quiescence result unless a deeper entry of this age exists."""
+        entry = self.transposition_table.get(hash_key)
+        if entry is not None and entry["age"] == self.age and entry["depth"] > depth:
+            return
+        self.transposition_table[hash_key] = {
+            "value": value,
+            "depth": depth,
+            "flag": flag,
+            "age": self.age,
+            "best_move": best_move,
+        }
+
+    def _tactical_moves(self, board, player: int) -> List[Tuple[int, int]]:
+        """_get_quiescence_moves, cached by (position, player)."""
+        move_key = (board.current_hash, player)
+        tactical_moves = self.qs_move_cache.get(move_key)
+        if tactical_moves is None:
+            tactical_moves = self._get_quiescence_moves(board, player)
+            self.qs_move_cache[move_key] = tactical_moves
+        return tactical_moves
+
     def _get_quiescence_moves(
         self, board, player: int
     ) -> List[Tuple[int, int]]:
@@ -810,16 +1455,16 @@ class MinMaxAI:
         """
         tactical = []
         opponent = 3 - player
+        wins = board.win_squares[player]
+        if wins:
+            return [board.decode(min(wins))]
+        opponent_wins = board.win_squares[opponent]
         all_moves = board.get_valid_moves()
 
         for move in all_moves:
             x, y = move
 
             board.place_stone(x, y, player)
-            if board.check_win(x, y, player):
-                board.undo_stone(x, y, player)
-                return [move]
-
             our_threats = self._count_threats_cached(board, x, y, player)
             board.undo_stone(x, y, player)
 
@@ -831,12 +1476,11 @@ class MinMaxAI:
                 tactical.append((move, 50))
                 continue
 
-            board.place_stone(x, y, opponent)
-            if board.check_win(x, y, opponent):
-                board.undo_stone(x, y, opponent)
+            if y * board.width + x in opponent_wins:
                 tactical.append((move, 200))
                 continue
 
+            board.place_stone(x, y, opponent)
             opp_threats = self._count_threats_cached(board, x, y, opponent)
             board.undo_stone(x, y, opponent)
 
@@ -874,6 +1518,19 @@ class MinMaxAI:
         return False
 
     def evaluate(self, board) -> int:
+        """
+        Evaluate the position statically from player 1's point of view.
+
+        Positions already scored through any board copy (root, ponder and
+        time-bank copies) come from the shared hash-keyed cache; otherwise
+        the board's incremental per-stone cache is brought up to date.
+        """
+        self.eval_probes += 1
+        score = self.position_evals.get(board.current_hash)
+        if score is not None:
+            self.eval_hits += 1
+            return score
+
         # If cache is empty and board has stones, do full evaluation
         if not board.eval_cache and board.move_count > 0:
             for y in range(board.height):
@@ -901,10 +1558,12 @@ class MinMaxAI:
                     board.eval_totals[stone] += score
             board.eval_dirty.clear()
 
-        return int(
+        score = int(
             constants.ATTACK_MULTIPLIER * board.eval_totals[1]
             - constants.DEFENSE_MULTIPLIER * board.eval_totals[2]
         )
+        self.position_evals[board.current_hash] = score
+        return score
 
     def _evaluate_position(self, board, x: int, y: int, player: int) -> int:
         score = 0
@@ -968,23 +1627,43 @@ class MinMaxAI:
         return score
 
     def _search_at_depth(
-        self, board, player: int, depth: int
+        self, board, player: int, depth: int,
+        ctx: Optional[SearchContext] = None
     ) -> Tuple[Optional[Tuple[int, int]], int]:
+        if ctx is None:
+            ctx = self.ctx
         board_copy = board.copy()
         opponent = 3 - player
         best_move = None
         best_value = -constants.INFINITY
 
         moves = board_copy.get_valid_moves()
-        moves = sorted(
-            moves, key=lambda m: -self._move_heuristic(board_copy, m, player)
-        )[:12]
+        moves = [m for m in moves if m not in ctx.vetoed] or moves
+        moves = [m for m, _ in self._score_moves(board_copy, moves, player)[:12]]
+        moves = self._unique_root_moves(board_copy, moves)
 
         for move in moves:
+            ctx.stack[0].four = self._makes_four(board_copy, move[0], move[1], player)
             board_copy.place_stone(move[0], move[1], player)
-            value = -self.negamax(
-                board_copy, depth - 1, -constants.INFINITY, constants.INFINITY, opponent
-            )
+            ctx.stack[0].move = board_copy.encode(move[0], move[1])
+            if best_move is None:
+                value = -self.negamax(
+                    board_copy, depth - 1, -constants.INFINITY, constants.INFINITY,
+                    opponent, ctx, 1
+                )
+            else:
+                # PVS at the root: prove the move worse than the best one
+                # with a null window (where forward pruning applies), and
+                # re-search only the moves that beat it
+                value = -self.negamax(
+                    board_copy, depth - 1, -best_value - 1, -best_value,
+                    opponent, ctx, 1
+                )
+                if value > best_value:
+                    value = -self.negamax(
+                        board_copy, depth - 1, -constants.INFINITY, -best_value,
+                        opponent, ctx, 1
+                    )
             board_copy.undo_stone(move[0], move[1], player)
             if value > best_value:
                 best_value = value
@@ -993,23 +1672,28 @@ class MinMaxAI:
         return best_move, best_value
 
     def _search_at_depth_with_window(
-        self, board, player: int, depth: int, alpha: int, beta: int
+        self, board, player: int, depth: int, alpha: int, beta: int,
+        ctx: Optional[SearchContext] = None
     ) -> Tuple[Optional[Tuple[int, int]], int]:
         """Search at fixed depth with custom alpha-beta window (for aspiration windows)."""
+        if ctx is None:
+            ctx = self.ctx
         board_copy = board.copy()
         opponent = 3 - player
         best_move = None
         best_value = -constants.INFINITY
 
         moves = board_copy.get_valid_moves()
-        moves = sorted(
-            moves, key=lambda m: -self._move_heuristic(board_copy, m, player)
-        )[:12]
+        moves = [m for m in moves if m not in ctx.vetoed] or moves
+        moves = [m for m, _ in self._score_moves(board_copy, moves, player)[:12]]
+        moves = self._unique_root_moves(board_copy, moves)
 
         for move in moves:
+            ctx.stack[0].four = self._makes_four(board_copy, move[0], move[1], player)
             board_copy.place_stone(move[0], move[1], player)
+            ctx.stack[0].move = board_copy.encode(move[0], move[1])
             value = -self.negamax(
-                board_copy, depth - 1, -beta, -alpha, opponent
+                board_copy, depth - 1, -beta, -alpha, opponent, ctx, 1
             )
             board_copy.undo_stone(move[0], move[1], player)
 
@@ -1024,16 +1708,52 @@ class MinMaxAI:
         return best_move, best_value
 
     def _move_heuristic(self, board, move, player: int) -> int:
+        """
+        Ordering score of move for player, cached by (position, move, player).
+
+        The score depends on the position only, so entries never go stale
+        and are shared by root ordering, ponder prediction and VCT.
+        """
+        key = (board.current_hash, move, player)
+        score = self.heuristic_cache.get(key)
+        if score is None:
+            score = self._compute_move_heuristic(board, move, player)
+            self.heuristic_cache[key] = score
+        return score
+
+    def _score_moves(
+        self, board, moves: List[Tuple[int, int]], player: int
+    ) -> List[Tuple[Tuple[int, int], int]]:
+        """
+        Batch _move_heuristic over the candidate moves of one position.
+
+        Returns:
+            (move, score) pairs, best first (ties keep the input order)
+        """
+        board_hash = board.current_hash
+        cache = self.heuristic_cache
+        scored = []
+        for move in moves:
+            key = (board_hash, move, player)
+            score = cache.get(key)
+            if score is None:
+                score = self._compute_move_heuristic(board, move, player)
+                cache[key] = score
+            scored.append((move, score))
+        scored.sort(key=lambda item: -item[1])
+        return scored
+
+    def _compute_move_heuristic(self, board, move, player: int) -> int:
         x, y = move
         opponent = 3 - player
+        cell = board.encode(x, y)
+
+        if cell in board.win_squares[player]:
+            return constants.MOVE_WIN
 
         # Phase 1: Evaluate our move (stone placed)
         board.place_stone(x, y, player)
 
-        if board.check_win(x, y, player):
-            board.undo_stone(x, y, player)
-            return constants.MOVE_WIN
-
         # Compute our threats ONCE and cache score
         our_threats = self._count_threats_cached(board, x, y, player)
         our_score = self._evaluate_position(board, x, y, player)
@@ -1059,11 +1779,7 @@ class MinMaxAI:
         board.undo_stone(x, y, player)
 
         # Phase 2: Evaluate blocking opponent
-        board.place_stone(x, y, opponent)
-        blocks_win = board.check_win(x, y, opponent)
-
-        if blocks_win:
-            board.undo_stone(x, y, opponent)
+        if cell in board.win_squares[opponent]:
             board.place_stone(x, y, player)
             opp_still_wins = self._has_winning_move(board, opponent)
             board.undo_stone(x, y, player)
@@ -1071,6 +1787,7 @@ class MinMaxAI:
                 return constants.MOVE_BLOCK_WIN // 2
             return constants.MOVE_BLOCK_WIN
 
+        board.place_stone(x, y, opponent)
         opp_threats = self._count_threats_cached(board, x, y, opponent)
         board.undo_stone(x, y, opponent)
 
@@ -1108,35 +1825,27 @@ class MinMaxAI:
 
     def _has_winning_move(self, board, player: int) -> bool:
         """Check if player has a winning move."""
-        valid_moves = board.get_valid_moves()
-        for mx, my in valid_moves:
-            board.place_stone(mx, my, player)
-            if board.check_win(mx, my, player):
-                board.undo_stone(mx, my, player)
-                return True
-            board.undo_stone(mx, my, player)
-        return False
+        return bool(board.win_squares[player])
 
     def _count_critical_threats(self, board, player: int) -> dict:
         """Count critical threats for a player across the entire board."""
         critical = {"winning": 0, "four_three": 0, "double_four": 0}
         valid_moves = board.get_valid_moves()
 
+        wins = board.win_squares[player]
         for mx, my in valid_moves:
-            board.place_stone(mx, my, player)
-
-            if board.check_win(mx, my, player):
+            if my * board.width + mx in wins:
                 critical["winning"] += 1
             else:
+                board.place_stone(mx, my, player)
                 threats = self._count_threats_cached(board, mx, my, player)
+                board.undo_stone(mx, my, player)
                 total_fours = threats["open_fours"] + threats["closed_fours"]
                 if total_fours >= 2:
                     critical["double_four"] += 1
                 elif total_fours >= 1 and threats["open_threes"] >= 1:
                     critical["four_three"] += 1
 
-            board.undo_stone(mx, my, player)
-
             # Early exit if already too many threats
             if critical["winning"] >= 2 or critical["four_three"] >= 2:
                 break
@@ -1150,46 +1859,40 @@ class MinMaxAI:
 
         Checks:
         1. Immediate winning move (5 in a row)
-        2. Block opponent's immediate win
+        2. Block opponent's immediate win; with several (open four), the
+           block closest to our own stones
 
         Returns move if found, None otherwise.
         """
         opponent = 3 - player
-        valid_moves = board.get_valid_moves()
-
-        # Limit to top 20 moves for speed (center-biased by get_valid_moves)
-        check_moves = valid_moves[:20]
 
         # 1. Check if we can win immediately
-        for move in check_moves:
-            x, y = move
-            board.place_stone(x, y, player)
-            if board.check_win(x, y, player):
-                board.undo_stone(x, y, player)
-                return move  # Winning move!
-            board.undo_stone(x, y, player)
+        wins = board.win_squares[player]
+        if wins:
+            return board.decode(min(wins))
 
         # 2. Check if opponent wins with any move (we must block)
-        for move in check_moves:
-            x, y = move
-            board.place_stone(x, y, opponent)
-            if board.check_win(x, y, opponent):
-                board.undo_stone(x, y, opponent)
-                return move  # Block opponent's win!
-            board.undo_stone(x, y, opponent)
+        blocks = [board.decode(move) for move in sorted(board.win_squares[opponent])]
+        if not blocks:
+            return None
+        return max(blocks, key=lambda m: self._own_stones_near(board, m, player))
 
-        return None
+    def _own_stones_near(self, board, move: Tuple[int, int], player: int) -> int:
+        """Count player's stones within 2 squares of move."""
+        x, y = move
+        count = 0
+        for ny in range(max(0, y - 2), min(board.height, y + 3)):
+            row = board.grid[ny]
+            for nx in range(max(0, x - 2), min(board.width, x + 3)):
+                if row[nx] == player:
+                    count += 1
+        return count
 
     def _get_immediate_move(self, board, player: int) -> Optional[Tuple[int, int]]:
-        moves = board.get_valid_moves()
-        best_move = None
-        best_score = -1
-
-        for move in moves:
-            score = self._move_heuristic(board, move, player)
-            if score > best_score:
-                best_score = score
-                best_move = move
+        scored_moves = self._score_moves(board, board.get_valid_moves(), player)
+        if not scored_moves:
+            return None
+        best_move, best_score = scored_moves[0]
 
         # Use lower threshold to catch split_three blocks too
         if best_score >= constants.IMMEDIATE_MOVE_THRESHOLD:
@@ -1335,278 +2038,313 @@ class MinMaxAI:
         """
         Scan entire board for opponent threat patterns.
         Returns dict of critical threats requiring immediate action.
-        """
-        threats = {
-            "fours": [],        # Four in a row (or split four)
-            "open_threes": [],  # Open three (.XXX.)
-            "split_threes": [], # Split three (XX.X, X.XX)
-            "building_twos": [], # Two stones that can become three (.XX.)
-        }
-
-        for dx, dy in constants.DIRECTIONS:
-            direction_name = self._direction_name(dx, dy)
-
-            if dx == 1 and dy == 0:  # Horizontal
-                for y in range(board.height):
-                    self._scan_line(
-                        board, 0, y, dx, dy, opponent, threats, direction_name
-                    )
-            elif dx == 0 and dy == 1:  # Vertical
-                for x in range(board.width):
-                    self._scan_line(
-                        board, x, 0, dx, dy, opponent, threats, direction_name
-                    )
-            elif dx == 1 and dy == 1:  # Diagonal backslash
-                for start in range(board.width + board.height - 1):
-                    x = max(0, start - board.height + 1)
-                    y = max(0, board.height - 1 - start)
-                    self._scan_line(
-                        board, x, y, dx, dy, opponent, threats, direction_name
-                    )
-            elif dx == 1 and dy == -1:  # Diagonal slash
-                for start in range(board.width + board.height - 1):
-                    x = max(0, start - board.height + 1)
-                    y = min(board.height - 1, start)
-                    self._scan_line(
-                        board, x, y, dx, dy, opponent, threats, direction_name
-                    )
 
-        return threats
-
-    def _scan_line(
-        self,
-        board,
-        start_x: int,
-        start_y: int,
-        dx: int,
-        dy: int,
-        opponent: int,
-        threats: dict,
-        direction: str
-    ):
-        """Scan a single line for threat patterns."""
-        opp_str = str(opponent)
-        line = []
-        positions = []
-
-        x, y = start_x, start_y
-        while 0 <= x < board.width and 0 <= y < board.height:
-            stone = board.grid[y][x]
-            line.append(str(stone) if stone else ".")
-            positions.append((x, y))
-            x += dx
-            y += dy
-
-        if len(positions) < 4:
-            return
-
-        line_str = "".join(line)
-
-        # Check for four (XXXX or XXX.X, etc)
-        four_patterns = [
-            (opp_str * 4, None),
-            (f"{opp_str * 3}.{opp_str}", 3),
-            (f"{opp_str}.{opp_str * 3}", 1),
-            (f"{opp_str * 2}.{opp_str * 2}", 2),
-        ]
-        for pat, gap_offset in four_patterns:
-            idx = 0
-            while True:
-                idx = line_str.find(pat, idx)
-                if idx == -1:
-                    break
-                threat_positions = positions[idx:idx + len(pat)]
-                gap_pos = positions[idx + gap_offset] if gap_offset is not None else None
-                threats["fours"].append({
-                    "positions": threat_positions,
-                    "direction": direction,
-                    "gap": gap_pos,
-                    "pattern": pat
-                })
-                idx += 1
-
-        # Check for open three .XXX.
-        open_three = f".{opp_str * 3}."
-        idx = 0
-        while True:
-            idx = line_str.find(open_three, idx)
-            if idx == -1:
-                break
-            threats["open_threes"].append({
-                "positions": positions[idx:idx + 5],
-                "direction": direction,
-                "blocks": [positions[idx], positions[idx + 4]]
-            })
-            idx += 1
-
-        # Check for split three patterns (XX.X, X.XX)
-        split_patterns = [
-            (f"{opp_str * 2}.{opp_str}", 2),  # XX.X
-            (f"{opp_str}.{opp_str * 2}", 1),  # X.XX
-        ]
-        for pat, gap_offset in split_patterns:
-            idx = 0
-            while True:
-                idx = line_str.find(pat, idx)
-                if idx == -1:
-                    break
-                threats["split_threes"].append({
-                    "positions": positions[idx:idx + len(pat)],
-                    "direction": direction,
-                    "gap": positions[idx + gap_offset]
-                })
-                idx += 1
-
-        # Check for building twos (.XX. patterns that can become open three)
-        # This is proactive defense - stop threats before they become critical
-        building_two = f".{opp_str * 2}."
-        idx = 0
-        while True:
-            idx = line_str.find(building_two, idx)
-            if idx == -1:
-                break
-            # Extension points are the dots on either side
-            threats["building_twos"].append({
-                "positions": positions[idx:idx + 4],
-                "direction": direction,
-                "extensions": [positions[idx], positions[idx + 3]]
-            })
-            idx += 1
-
-    def _direction_name(self, dx: int, dy: int) -> str:
-        """Get human-readable direction name."""
-        if dx == 1 and dy == 0:
-            return "horizontal"
-        elif dx == 0 and dy == 1:
-            return "vertical"
-        elif dx == 1 and dy == 1:
-            return "diagonal_\\"
-        else:
-            return "diagonal_/"
+        Fours (or split fours), open threes (.XXX.), split threes (XX.X,
+        X.XX) and building twos (.XX.) come from one automaton pass per line.
+        """
+        return scan_grid(board.grid, opponent)
 
     def _get_threat_moves(self, board, player: int) -> List[Tuple[int, int]]:
-        """Return moves that create threats (fours, threes)."""
-        threat_moves = []
-        valid_moves = board.get_valid_moves()
-
-        for x, y in valid_moves:
-            board.place_stone(x, y, player)
-            threats = self._count_threats_cached(board, x, y, player)
-            board.undo_stone(x, y, player)
-
-            if (threats["open_fours"] > 0 or
-                threats["closed_fours"] > 0 or
-                threats["open_threes"] > 0):
-                threat_moves.append((x, y))
+        """Return moves that create threats (fives, fours, threes)."""
+        return [
+            board.decode(move) for move in board.get_valid_cells()
+            if best_kind(board, move, player)
+        ]
 
-        return threat_moves
+    def _get_defense_moves(
+        self, board, attacker: int, last_threats: Optional[list] = None
+    ) -> List[Tuple[int, int]]:
+        """
+        Return moves that answer attacker's threats.
 
-    def _get_defense_moves(self, board, attacker: int) -> List[Tuple[int, int]]:
-        """Return moves that block attacker's threats."""
+        With last_threats (the threats of attacker's last move, read before
+        it was played), the cost squares of its fours, or of its threes when
+        it made no four; otherwise every gain square of attacker.
+        Counter-fours are added to both.
+        """
         defender = 3 - attacker
         defense_moves = set()
-        valid_moves = board.get_valid_moves()
-
-        for x, y in valid_moves:
-            # 1. Directly block a threat
-            board.place_stone(x, y, attacker)
-            threats = self._count_threats_cached(board, x, y, attacker)
-            board.undo_stone(x, y, attacker)
 
-            if (threats["fives"] > 0 or
-                threats["open_fours"] > 0 or
-                threats["closed_fours"] > 0 or
-                threats["open_threes"] > 0):
-                defense_moves.add((x, y))
-
-            # 2. Create a counter-threat
-            board.place_stone(x, y, defender)
-            counter = self._count_threats_cached(board, x, y, defender)
-            board.undo_stone(x, y, defender)
-
-            if counter["open_fours"] > 0 or counter["closed_fours"] > 0:
-                defense_moves.add((x, y))
+        if last_threats:
+            # A four must be answered before any three
+            fours = [t for t in last_threats if t.kind >= constants.THREAT_FOUR]
+            for threat in fours or last_threats:
+                defense_moves.update(threat.costs)
+        else:
+            defense_moves.update(
+                move for move in board.get_valid_cells()
+                if best_kind(board, move, attacker)
+            )
 
-        return list(defense_moves)
+        defense_moves.update(board.four_squares[defender])
+        return [board.decode(move) for move in defense_moves]
 
     def _vct_search(
         self, board, current_player: int, attacker: int,
-        depth: int, max_depth: int
+        depth: int, max_depth: int, ctx: Optional[SearchContext] = None,
+        last_threats: Optional[list] = None
     ) -> bool:
         """
         DFS search for Victory by Continuous Threats.
 
+        last_threats are the threats made by attacker's last move: the
+        defender then only tries their cost squares and counter-fours.
+
         Returns:
-            True if VCT found for attacker.
+            True if VCT found for attacker (False once ctx is stopped).
         """
-        # Immediate win?
-        if self._has_winning_move(board, attacker):
-            return True
+        if ctx is None:
+            ctx = self.ctx
+        if ctx.stopped:
+            return False
+
+        # Immediate win for the side to move decides it; a four of the side
+        # not to move can still be blocked
+        if self._has_winning_move(board, current_player):
+            return current_player == attacker
 
         # Depth limit
         if depth >= max_depth:
             return False
 
+        # Proofs hold at any depth (truncated ones only this turn),
+        # disproofs up to the depth they searched
+        key = (board.current_hash, current_player, attacker)
+        entry = self.vct_table.get(key)
+        if entry is not None:
+            if entry[0] and entry[2] in (None, self.age):
+                return True
+            if not entry[0] and entry[1] >= max_depth - depth:
+                return False
+
         if current_player == attacker:
+            # Facing a four, the attacker would have to block: no VCT here
+            if self._has_winning_move(board, 3 - attacker):
+                return False
+
             # Attacker's turn: find ONE threat move leading to VCT
-            threat_moves = self._get_threat_moves(board, attacker)
-            threat_moves.sort(
-                key=lambda m: -self._move_heuristic(board, m, attacker)
-            )
+            threat_moves = [
+                m for m, _ in self._score_moves(
+                    board, self._get_threat_moves(board, attacker), attacker
+                )
+            ]
 
             for move in threat_moves[:8]:
+                if ctx.stopped:
+                    return False
                 x, y = move
+                made = threats_at(board, board.encode(x, y), attacker)
                 board.place_stone(x, y, attacker)
 
                 result = self._vct_search(
                     board, 3 - attacker, attacker,
-                    depth + 1, max_depth
+                    depth + 1, max_depth, ctx, made
                 )
+                if result:
+                    turn = self._vct_proof_turn(board, 3 - attacker, attacker)
 
                 board.undo_stone(x, y, attacker)
 
                 if result:
+                    self.vct_table[key] = (True, move, turn)
                     return True
 
+            if not ctx.stopped:
+                self.vct_table[key] = (False, max_depth - depth)
             return False
 
         else:
-            # Defender's turn: must block ALL threats
-            defense_moves = self._get_defense_moves(board, attacker)
+            # Defender's turn: must block ALL threats. The cost squares of
+            # the last threat are exact; without them, against a four or an
+            # open three, so is the relevance zone (incl. counter-fours)
+            if last_threats:
+                defense_moves = self._get_defense_moves(
+                    board, attacker, last_threats
+                )
+            else:
+                defense_moves = self._forced_replies(
+                    board, current_player, board.get_valid_cells()
+                )
+                if defense_moves is not None:
+                    defense_moves = [board.decode(m) for m in defense_moves]
+                else:
+                    defense_moves = self._get_defense_moves(board, attacker)
 
             if not defense_moves:
+                self.vct_table[key] = (True, None, None)
                 return True
 
-            defense_moves.sort(
-                key=lambda m: -self._move_heuristic(board, m, current_player)
-            )
+            defense_moves = [
+                m for m, _ in self._score_moves(board, defense_moves, current_player)
+            ]
+            # Only a proof against every defence is kept for later turns
+            complete = len(defense_moves) <= 6
 
             for move in defense_moves[:6]:
+                if ctx.stopped:
+                    return False
                 x, y = move
                 board.place_stone(x, y, current_player)
 
                 result = self._vct_search(
                     board, attacker, attacker,
-                    depth + 1, max_depth
+                    depth + 1, max_depth, ctx
                 )
+                if result and (
+                    self._vct_proof_turn(board, attacker, attacker) is not None
+                ):
+                    complete = False
 
                 board.undo_stone(x, y, current_player)
 
                 if not result:
+                    if not ctx.stopped:
+                        self.vct_table[key] = (False, max_depth - depth)
                     return False
 
+            self.vct_table[key] = (True, None, None if complete else self.age)
             return True
 
+    def _vct_proof_turn(
+        self, board, current_player: int, attacker: int
+    ) -> Optional[int]:
+        """
+        Return the turn tag of a proof resting on this position's proof.
+
+        None (the proof holds on any turn) when every defence below it was
+        searched, else the current turn: a proof cut short by the defence
+        limit is only trusted by the turn that found it.
+        """
+        if current_player == attacker and self._has_winning_move(board, attacker):
+            return None
+        entry = self.vct_table.get((board.current_hash, current_player, attacker))
+        if entry is not None and entry[0] and entry[2] is None:
+            return None
+        return self.age
+
+    def _vcf(
+        self, board, attacker: int, ctx: SearchContext, depth: int = 0
+    ) -> Optional[int]:
+        """
+        Find the first move (encoded) of attacker's victory by continuous fours.
+
+        None if there is none. Attacker is to move; every defence is the
+        forced block.
+
+        Facing a four, the attacker is assumed to have no VCF. Results are
+        cached by position across turns, unless the search was stopped: a
+        proof answers at any depth, a refutation only searches with no more
+        fours left than it had.
+        """
+        wins = board.win_squares[attacker]
+        if wins:
+            return min(wins)
+        defender = 3 - attacker
+        if board.win_squares[defender]:
+            return None
+        remaining = constants.VCF_MAX_DEPTH - depth
+        key = (board.current_hash, attacker)
+        entry = self.vcf_cache.get(key)
+        if entry is not None and (entry[0] is not None or entry[1] >= remaining):
+            return entry[0]
+        if remaining <= 0:
+            return None
+
+        found = None
+        for move in sorted(board.four_squares[attacker]):
+            if ctx.stopped:
+                return None
+            ctx.nodes += 1
+            x, y = board.decode(move)
+            board.place_stone(x, y, attacker)
+            blocks = board.win_squares[attacker]
+            if len(blocks) >= 2:
+                found = move
+            elif blocks:
+                bx, by = board.decode(next(iter(blocks)))
+                board.place_stone(bx, by, defender)
+                if self._vcf(board, attacker, ctx, depth + 1) is not None:
+                    found = move
+                board.undo_stone(bx, by, defender)
+            board.undo_stone(x, y, attacker)
+            if found is not None:
+                break
+
+        if found is not None or not ctx.stopped:
+            self.vcf_cache[key] = (found, remaining)
+        return found
+
+    def _vcf_safety_check(
+        self, board, player: int, move: Tuple[int, int], ctx: SearchContext
+    ) -> Tuple[int, int]:
+        """
+        Return move, unless it leaves the opponent a VCF.
+
+        A refuted move is replaced by the first of the next-best moves that
+        does not leave one. Keeps move when every candidate is refuted or
+        VCF_CHECK_BUDGET runs out.
+        """
+        if not self.vcf_check:
+            return move
+        logger = get_logger()
+        opponent = 3 - player
+        check_ctx = ctx.fork(deadline=time.time() + constants.VCF_CHECK_BUDGET)
+        # Probe stones go on a copy: the caller's board is left untouched
+        # (a stopped time-bank thread may still be searching its own copies)
+        board = board.copy()
+
+        candidates = [move]
+        for i in range(constants.VCF_CHECK_ALTERNATIVES + 1):
+            if i == len(candidates):
+                break
+            candidate = candidates[i]
+            x, y = candidate
+            board.place_stone(x, y, player)
+            refutation = self._vcf(board, opponent, check_ctx)
+            board.undo_stone(x, y, player)
+            if check_ctx.stopped:
+                break
+            if refutation is None:
+                if candidate != move:
+                    logger.info(f"VCF check: playing {candidate} instead of {move}")
+                ctx.merge(check_ctx)
+                return candidate
+            logger.info(
+                f"VCF check: {candidate} refuted by {board.decode(refutation)}"
+            )
+            if i == 0:
+                # Refuted: the next-best moves by heuristic become candidates.
+                # Only the candidate cells are scored, so the check stays
+                # within its budget on a crowded board
+                moves = [
+                    board.decode(cell) for cell in board.get_candidate_cells()
+                ]
+                candidates += [
+                    m for m, _ in self._score_moves(board, moves, player)
+                    if m != move
+                ][:constants.VCF_CHECK_ALTERNATIVES]
+                if check_ctx.stopped:
+                    break
+        ctx.merge(check_ctx)
+        return move
+
     def _threat_space_search(
-        self, board, player: int, max_depth: int = 14, time_limit: float = 1.5
+        self, board, player: int, max_depth: int = 14, time_limit: float = 1.5,
+        ctx: Optional[SearchContext] = None
     ) -> Optional[Tuple[int, int]]:
         """
         Search for Victory by Continuous Threats (VCT).
 
         Returns the move leading to a forced win, or None.
-        Uses iterative deepening to find quick wins first.
+        Uses iterative deepening to find quick wins first. With a VCT pool,
+        more root moves are proven by the workers in the same wall time:
+        the aggregate budget is VCT_WORKERS * time_limit.
         """
         start_time = time.time()
+        if ctx is None:
+            ctx = self.ctx
+        # Sub-search: time_limit is enforced inside the DFS, not only per move
+        vct_ctx = ctx.fork(deadline=start_time + time_limit)
 
         if self._has_winning_move(board, player):
             return None
@@ -1615,31 +2353,113 @@ class MinMaxAI:
         if not threat_moves:
             return None
 
-        threat_moves.sort(
-            key=lambda m: -self._move_heuristic(board, m, player)
+        # Inside a line proven against every defence on an earlier turn (or
+        # proven this turn): replay it
+        entry = self.vct_table.get((board.current_hash, player, player))
+        if (
+            entry is not None
+            and entry[0]
+            and entry[2] in (None, self.age)
+            and entry[1] in threat_moves
+        ):
+            return entry[1]
+
+        threat_moves = [
+            m for m, _ in self._score_moves(board, threat_moves, player)
+        ]
+
+        # Worker processes: each takes a root move, the first win stops the rest
+        pool = self.vct_pool
+        if pool is not None and not pool.broken and pool.lock.acquire(blocking=False):
+            try:
+                move = pool.search(
+                    board, player, threat_moves[:constants.VCT_POOL_ROOT_MOVES],
+                    max_depth, vct_ctx
+                )
+            finally:
+                pool.lock.release()
+            if not pool.broken:
+                if move is not None:
+                    # The workers' tables are their own: not replayed next turn
+                    self.vct_table[(board.current_hash, player, player)] = (
+                        True, move, self.age
+                    )
+                return move
+
+        return self._prove_root_threats(
+            board, player, threat_moves[:constants.VCT_ROOT_MOVES], max_depth,
+            vct_ctx, soft_deadline=start_time + time_limit * 0.9
         )
-        threat_moves = threat_moves[:16]
 
-        # Iterative deepening: try shallow depths first for quick wins
-        for vct_depth in [6, 10, max_depth]:
-            if time.time() - start_time > time_limit * 0.9:
+    def _prove_root_threats(
+        self, board, player: int, threat_moves: List[Tuple[int, int]],
+        max_depth: int, ctx: SearchContext, soft_deadline: Optional[float] = None
+    ) -> Optional[Tuple[int, int]]:
+        """
+        First of threat_moves proven to win for player by continuous threats.
+
+        Iterative deepening: every move is tried at each depth of VCT_DEPTHS,
+        then at max_depth, so quick wins are found first. No new depth is
+        started past soft_deadline.
+        """
+        for vct_depth in constants.VCT_DEPTHS + (max_depth,):
+            if soft_deadline is not None and time.time() > soft_deadline:
                 break
 
             for move in threat_moves:
-                if time.time() - start_time > time_limit:
-                    break
+                if ctx.stopped:
+                    return None
 
                 x, y = move
+                made = threats_at(board, board.encode(x, y), player)
                 board.place_stone(x, y, player)
 
                 vct_found = self._vct_search(
                     board, 3 - player, player,
-                    depth=1, max_depth=vct_depth
+                    depth=1, max_depth=vct_depth, ctx=ctx,
+                    last_threats=made
                 )
+                if vct_found:
+                    turn = self._vct_proof_turn(board, 3 - player, player)
 
                 board.undo_stone(x, y, player)
 
                 if vct_found:
+                    self.vct_table[(board.current_hash, player, player)] = (
+                        True, move, turn
+                    )
                     return move
 
         return None
+
+    def _refute(
+        self, board, player: int, move: Tuple[int, int], max_depth: int,
+        ctx: SearchContext
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Find the opponent's winning reply to player playing move.
+
+        The reply is a five or a proven VCT; None if none was found before
+        ctx stopped.
+        """
+        opponent = 3 - player
+        x, y = move
+        board.place_stone(x, y, player)
+        try:
+            # Our four must be blocked first: no refutation starts here
+            if self._has_winning_move(board, player):
+                return None
+            wins = board.win_squares[opponent]
+            if wins:
+                return board.decode(min(wins))
+            threat_moves = [
+                m for m, _ in self._score_moves(
+                    board, self._get_threat_moves(board, opponent), opponent
+                )
+            ]
+            return self._prove_root_threats(
+                board, opponent, threat_moves[:constants.VCT_ROOT_MOVES],
+                max_depth, ctx
+            )
+        finally:
+            board.undo_stone(x, y, player)
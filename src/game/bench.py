@@ -0,0 +1,224 @@
+##
+## EPITECH PROJECT, 2025
+## Gomoku
+## File description:
+## Search benchmark positions and A/B runner (python -m game.bench from src/)
+##
+
+import argparse
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from . import constants
+from .ai import MinMaxAI
+from .board import Board
+from .search_context import SearchContext
+
+# name, stones (x, y, player), player to move, moves solving it (None = quiet)
+BenchPosition = Tuple[
+    str, List[Tuple[int, int, int]], int, Optional[List[Tuple[int, int]]]
+]
+
+# fmt: off
+BENCH_POSITIONS: List[BenchPosition] = [
+    (
+        "win_in_one",
+        [(10, 10, 1), (11, 10, 1), (12, 10, 1), (13, 10, 1), (9, 10, 2),
+         (10, 11, 2), (11, 11, 2), (12, 12, 2)],
+        1, [(14, 10)],
+    ),
+    (
+        "block_four",
+        [(12, 8, 2), (12, 9, 2), (12, 10, 2), (12, 11, 2), (12, 7, 1),
+         (10, 10, 1), (11, 11, 1)],
+        1, [(12, 12)],
+    ),
+    (
+        "block_open_three",
+        [(11, 7, 2), (11, 8, 2), (11, 9, 2), (11, 11, 1), (10, 10, 1),
+         (9, 10, 1)],
+        1, [(11, 6), (11, 10)],
+    ),
+    (
+        "make_open_four",
+        [(10, 8, 1), (10, 9, 1), (10, 10, 1), (9, 10, 1), (12, 12, 2),
+         (13, 12, 2), (8, 8, 2)],
+        1, [(10, 7), (10, 11)],
+    ),
+    (
+        "block_split_three",
+        [(7, 14, 2), (8, 14, 2), (10, 14, 2), (10, 10, 1), (9, 12, 1)],
+        1, [(9, 14), (6, 14), (11, 14)],
+    ),
+    (
+        "midgame_a",
+        [(10, 10, 1), (11, 11, 2), (10, 11, 1), (9, 9, 2), (11, 10, 2),
+         (12, 12, 1), (9, 10, 1), (8, 8, 2)],
+        1, None,
+    ),
+    (
+        "midgame_b",
+        [(10, 10, 1), (10, 11, 2), (11, 9, 1), (12, 8, 2), (9, 11, 1),
+         (11, 11, 2), (12, 11, 1), (11, 12, 2), (10, 13, 1), (9, 9, 2)],
+        1, None,
+    ),
+]
+# fmt: on
+
+# A/B variants: pruning switches handed to MinMaxAI.pruning
+VARIANTS: Dict[str, Dict[str, bool]] = {
+    "none": {"futility": False, "lmp": False, "probcut": False},
+    "futility": {"futility": True, "lmp": False, "probcut": False},
+    "lmp": {"futility": False, "lmp": True, "probcut": False},
+    "probcut": {"futility": False, "lmp": False, "probcut": True},
+    "all": {"futility": True, "lmp": True, "probcut": True},
+}
+
+
+def load_position(stones: Sequence[Tuple[int, int, int]], size: int = 20) -> Board:
+    """Board with the given stones placed."""
+    board = Board(size, size)
+    for x, y, player in stones:
+        board.place_stone(x, y, player)
+    return board
+
+
+def run_position(
+    ai: MinMaxAI,
+    stones,
+    player: int,
+    time_limit: Optional[float],
+    max_depth: int = constants.MAX_DEPTH,
+) -> dict:
+    """
+    Run iterative deepening with _search_at_depth on one position.
+
+    Without a time limit every depth up to max_depth is searched.
+    Returns the deepest completed depth, its move, the node count, the
+    time used, the forward-pruning counters and the extension counters.
+    """
+    board = load_position(stones)
+    start = time.perf_counter()
+    deadline = time.time() + time_limit if time_limit is not None else None
+    ctx = SearchContext(deadline=deadline)
+    ai.ctx = ctx
+    ai.age += 1
+    move, depth = None, 0
+    for current in range(1, max_depth + 1):
+        found, _ = ai._search_at_depth(board, player, current, ctx)
+        if ctx.stopped:
+            break
+        move, depth = found, current
+    return {
+        "depth": depth,
+        "move": move,
+        "nodes": ctx.nodes,
+        "time": time.perf_counter() - start,
+        "pruned": dict(ctx.pruned),
+        "extensions": ctx.extensions,
+        "extension_nodes": ctx.extension_nodes,
+    }
+
+
+def run_bench(
+    pruning: Optional[Dict[str, bool]] = None,
+    time_limit: Optional[float] = 2.0,
+    max_depth: int = constants.MAX_DEPTH,
+    extensions: bool = constants.EXTENSIONS_ENABLED,
+) -> List[dict]:
+    """
+    Run every bench position with a fresh AI.
+
+    The AI uses the given pruning switches, with or without threat
+    extensions.
+    """
+    results = []
+    for name, stones, player, solutions in BENCH_POSITIONS:
+        ai = MinMaxAI()
+        if pruning is not None:
+            ai.pruning = dict(pruning)
+        ai.extend_threats = extensions
+        result = run_position(ai, stones, player, time_limit, max_depth)
+        result["name"] = name
+        result["solved"] = solutions is None or result["move"] in solutions
+        results.append(result)
+    return results
+
+
+def measure_quiet_gains(percentile: float = 0.95) -> int:
+    """
+    Eval gain of quiet moves over the bench positions.
+
+    A move is quiet when _is_tactical_move rejects it; its gain is the
+    static eval change for the side playing it. Returns the given
+    percentile, the basis of FUTILITY_MARGINS[1].
+    """
+    gains = []
+    for _, stones, player, _ in BENCH_POSITIONS:
+        ai = MinMaxAI()
+        board = load_position(stones)
+        for side in (player, 3 - player):
+            sign = 1 if side == 1 else -1
+            before = ai.evaluate(board) * sign
+            for x, y in board.get_valid_moves():
+                board.place_stone(x, y, side)
+                if not ai._is_tactical_move(board, (x, y), side):
+                    gains.append(ai.evaluate(board) * sign - before)
+                board.undo_stone(x, y, side)
+    gains.sort()
+    return gains[min(len(gains) - 1, int(len(gains) * percentile))]
+
+
+def _print_results(label: str, results: List[dict]) -> None:
+    print(f"== {label}")
+    for r in results:
+        pruned = " ".join(f"{k}={v}" for k, v in r["pruned"].items() if v)
+        print(
+            f"  {r['name']:<18} depth={r['depth']:<2} nodes={r['nodes']:<7} "
+            f"{r['time']:.2f}s move={r['move']} "
+            f"{'ok' if r['solved'] else 'FAILED'} {pruned} "
+            f"ext={r['extensions']}/{r['extension_nodes']}"
+        )
+    depth = sum(r["depth"] for r in results) / len(results)
+    nodes = sum(r["nodes"] for r in results)
+    solved = sum(r["solved"] for r in results)
+    print(f"  avg depth={depth:.2f} nodes={nodes} solved={solved}/{len(results)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Gomoku search benchmark")
+    parser.add_argument("--time", type=float, default=2.0, help="seconds per position")
+    parser.add_argument("--depth", type=int, default=constants.MAX_DEPTH)
+    parser.add_argument(
+        "--fixed",
+        action="store_true",
+        help="search every position to --depth without a time limit",
+    )
+    parser.add_argument("--ab", action="store_true", help="compare pruning variants")
+    parser.add_argument(
+        "--margins", action="store_true", help="measure quiet-move gains"
+    )
+    parser.add_argument(
+        "--no-extensions", action="store_true", help="disable threat extensions"
+    )
+    args = parser.parse_args()
+
+    if args.margins:
+        for percentile in (0.5, 0.9, 0.95, 0.99):
+            print(
+                f"quiet gain p{percentile * 100:.0f}: {measure_quiet_gains(percentile)}"
+            )
+        return
+    time_limit = None if args.fixed else args.time
+    extensions = not args.no_extensions
+    if args.ab:
+        for label, pruning in VARIANTS.items():
+            _print_results(
+                label, run_bench(pruning, time_limit, args.depth, extensions)
+            )
+    else:
+        _print_results("current", run_bench(None, time_limit, args.depth, extensions))
+
+
+if __name__ == "__main__":
+    main()
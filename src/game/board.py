@@ -6,28 +6,108 @@
 ##
 
 import random
-from typing import List, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 from . import constants
 
 
+def symmetry_transforms(span: int) -> List[Callable[[int, int], Tuple[int, int]]]:
+    """
+    Return the 8 symmetries of a square about the point (span / 2, span / 2).
+
+    In order: identity, rotations by 90, 180 and 270 degrees clockwise,
+    then the horizontal, vertical, main and anti-diagonal reflections.
+    span = size - 1 gives the symmetries of a size x size board.
+    """
+    return [
+        lambda x, y: (x, y),
+        lambda x, y: (y, span - x),
+        lambda x, y: (span - x, span - y),
+        lambda x, y: (span - y, x),
+        lambda x, y: (span - x, y),
+        lambda x, y: (x, span - y),
+        lambda x, y: (y, x),
+        lambda x, y: (span - y, span - x),
+    ]
+
+
 class Board:
+    """
+    Gomoku board.
+
+    The public API takes (x, y) coordinates. Internally each cell also has
+    an integer encoding, y * width + x, used by the search for its move
+    lists and move-indexed tables (see encode / get_valid_cells).
+
+    win_squares and four_squares hold, per player, the empty cells where
+    a stone would complete five or make a four. Each cell keeps one code
+    per direction for the WIN_LENGTH - 1 cells on each side of it (two
+    bits each: empty, player 1, player 2, off board). A move adds to the
+    codes of the cells on its four lines; the squares of an empty cell
+    change only when the status of one of its codes (see _code_status)
+    does, and an emptied cell gets its squares back from its codes.
+    Moves are journaled and applied when the squares are read, so a
+    stone placed and taken back in between (a threat probe) costs nothing.
+    """
+
     zobrist_table = None
+    eval_regions = {}  # (width, height) -> per-cell tuples of cells to re-evaluate
+    # (width, height) -> per-cell tuples of encoded cells in MOVE_RADIUS
+    neighbourhoods = {}
+    adjacencies = {}  # (width, height) -> per-cell tuples of encoded cells in radius 1
+    # (width, height) -> per-cell tuples of (direction, point 2 away on that line)
+    line_points = {}
+    # (width, height) -> per-cell, per-direction 9-cell lines centred on it
+    # (-1 = off board)
+    lines = {}
+    # (width, height) -> per-symmetry cell permutations and their inverses
+    # (square boards)
+    symmetries = {}
+    # (width, height) -> per player, per-cell tuples of the Zobrist keys of its 8 images
+    symmetry_keys = {}
+    # (width, height) -> line codes of an empty board, by cell * 4 + direction
+    empty_codes = {}
+    # (width, height) -> per-cell (code index, weight) pairs a stone there adds to
+    code_updates = {}
+    # line code -> WIN/FOUR bits of both players (-1 = not computed yet)
+    code_status = []
 
     def __init__(self, width: int, height: int):
         if Board.zobrist_table is None:
-            Board._init_zobrist(width, height)
+            # One table for every board size: hashes (and the book's keys) agree
+            Board._init_zobrist(constants.MAX_BOARD_SIZE, constants.MAX_BOARD_SIZE)
         self.width = width
         self.height = height
+        if (width, height) not in Board.eval_regions:
+            Board._init_eval_regions(width, height)
+        self._eval_region = Board.eval_regions[(width, height)]
+        if (width, height) not in Board.neighbourhoods:
+            Board._init_neighbourhoods(width, height)
+        self._neighbourhood = Board.neighbourhoods[(width, height)]
+        self._adjacency = Board.adjacencies[(width, height)]
+        self._line_points = Board.line_points[(width, height)]
+        self._lines = Board.lines[(width, height)]
+        if (width, height) not in Board.code_updates:
+            Board._init_line_codes(width, height)
+        self._code_updates = Board.code_updates[(width, height)]
+        self.line_codes = Board.empty_codes[(width, height)][:]
+        # Status of each line code, kept up to date for empty cells only
+        self.line_status = [0] * len(self.line_codes)
+        self._win_squares = {1: set(), 2: set()}  # Empty cells completing five
+        self._four_squares = {1: set(), 2: set()}  # Empty cells making a four
+        self._journal: List[Tuple[int, int]] = []  # (move, +/-player) not applied yet
         self.grid = [[0 for _ in range(width)] for _ in range(height)]
+        self.cells = [0] * (width * height)  # Flat mirror of grid, by encoded cell
         self.move_count = 0
         self.current_hash = 0
+        # Hashes of the 8 symmetric images (see enable_symmetry), None when off
+        self.sym_hashes: Optional[List[int]] = None
         # Incremental evaluation cache
         self.eval_cache = {}  # (x, y, player) -> score
         self.eval_totals = {1: 0, 2: 0}
         self.eval_dirty = set()  # positions needing recalculation
-        # Track occupied cells incrementally (avoid full board scan)
-        self.occupied_cells = set()
+        # Track occupied cells incrementally (avoid full board scan), encoded
+        self.occupied = set()
 
     @classmethod
     def _init_zobrist(cls, width: int, height: int):
@@ -37,50 +117,473 @@ class Board:
             for _ in range(height)
         ]
 
+    @classmethod
+    def _init_symmetries(cls, width: int, height: int):
+        """
+        Precompute the cell permutations of the board's 8 symmetries.
+
+        Also their inverses and each cell's Zobrist keys under them. Only
+        square boards have them.
+        """
+        cells = range(width * height)
+        perms = []
+        for transform in symmetry_transforms(width - 1):
+            perm = []
+            for cell in cells:
+                tx, ty = transform(cell % width, cell // width)
+                perm.append(ty * width + tx)
+            perms.append(perm)
+        inverses = []
+        for perm in perms:
+            inverse = [0] * len(perm)
+            for cell, image in enumerate(perm):
+                inverse[image] = cell
+            inverses.append(inverse)
+        cls.symmetries[(width, height)] = (perms, inverses)
+        zobrist = cls.zobrist_table
+        cls.symmetry_keys[(width, height)] = [
+            [
+                tuple(
+                    zobrist[perm[cell] // width][perm[cell] % width][player]
+                    for perm in perms
+                )
+                for cell in cells
+            ]
+            for player in range(2)
+        ]
+
+    @classmethod
+    def _init_eval_regions(cls, width: int, height: int):
+        """
+        Precompute, for every cell, the cells whose evaluation lines cross it.
+
+        A stone is scored from the 9-cell lines through it (4 cells each
+        side), so exactly the cells up to 4 away on the four lines change.
+        """
+        reach = constants.WIN_LENGTH - 1
+        regions = [[None] * width for _ in range(height)]
+        for y in range(height):
+            for x in range(width):
+                cells = [(x, y)]
+                for dx, dy in constants.DIRECTIONS:
+                    for i in range(-reach, reach + 1):
+                        nx, ny = x + i * dx, y + i * dy
+                        if i and 0 <= nx < width and 0 <= ny < height:
+                            cells.append((nx, ny))
+                regions[y][x] = tuple(cells)
+        cls.eval_regions[(width, height)] = regions
+
+    @classmethod
+    def _init_neighbourhoods(cls, width: int, height: int):
+        """
+        Precompute the neighbourhood tables of every encoded cell.
+
+        These are the encoded cells within MOVE_RADIUS and within radius 1,
+        the points two away along each line, and the lines through the cell.
+        """
+
+        def square(x, y, radius):
+            return tuple(
+                ny * width + nx
+                for ny in range(max(0, y - radius), min(height, y + radius + 1))
+                for nx in range(max(0, x - radius), min(width, x + radius + 1))
+            )
+
+        reach = constants.WIN_LENGTH - 1
+        neighbourhoods, adjacencies, line_points, lines = [], [], [], []
+        for y in range(height):
+            for x in range(width):
+                neighbourhoods.append(square(x, y, constants.MOVE_RADIUS))
+                adjacencies.append(square(x, y, 1))
+                points = []
+                cell_lines = []
+                for direction, (dx, dy) in enumerate(constants.DIRECTIONS):
+                    for sign in (1, -1):
+                        nx, ny = x + 2 * sign * dx, y + 2 * sign * dy
+                        if 0 <= nx < width and 0 <= ny < height:
+                            points.append((direction, ny * width + nx))
+                    cell_lines.append(
+                        tuple(
+                            (
+                                (y + i * dy) * width + x + i * dx
+                                if 0 <= x + i * dx < width and 0 <= y + i * dy < height
+                                else -1
+                            )
+                            for i in range(-reach, reach + 1)
+                        )
+                    )
+                line_points.append(tuple(points))
+                lines.append(tuple(cell_lines))
+        cls.neighbourhoods[(width, height)] = neighbourhoods
+        cls.adjacencies[(width, height)] = adjacencies
+        cls.line_points[(width, height)] = line_points
+        cls.lines[(width, height)] = lines
+
+    @classmethod
+    def _init_line_codes(cls, width: int, height: int):
+        """
+        Precompute the line codes of an empty board and their updates.
+
+        For every cell, these are the (code index, weight) pairs of the
+        cells on its four lines.
+
+        Digit j of a code stands for offset j - reach (j < reach) or
+        j - reach + 1 (j >= reach) from the cell, with weight 4 ** j.
+        """
+        reach = constants.WIN_LENGTH - 1
+        offsets = [i for i in range(-reach, reach + 1) if i]
+        codes = [0] * (width * height * 4)
+        updates = [[] for _ in range(width * height)]
+        for y in range(height):
+            for x in range(width):
+                cell = y * width + x
+                for direction, (dx, dy) in enumerate(constants.DIRECTIONS):
+                    index = cell * 4 + direction
+                    for j, i in enumerate(offsets):
+                        nx, ny = x + i * dx, y + i * dy
+                        if 0 <= nx < width and 0 <= ny < height:
+                            updates[ny * width + nx].append((index, 4**j))
+                        else:
+                            codes[index] += constants.OFF_BOARD * 4**j
+        cls.empty_codes[(width, height)] = codes
+        cls.code_updates[(width, height)] = [tuple(pairs) for pairs in updates]
+        if not cls.code_status:
+            cls.code_status = [-1] * 4 ** (2 * reach)
+
+    @classmethod
+    def _code_status(cls, code: int) -> int:
+        """
+        WIN_BITS / FOUR_BITS of a line code, memoised.
+
+        A player wins with the cell if their stones next to it on both
+        sides add up to WIN_LENGTH - 1; they make a four if some window of
+        WIN_LENGTH cells through it holds WIN_LENGTH - 2 of their stones
+        and nothing else (the _makes_four rule).
+        """
+        status = cls.code_status[code]
+        if status >= 0:
+            return status
+        reach = constants.WIN_LENGTH - 1
+        digits = [(code >> (2 * j)) & 3 for j in range(2 * reach)]
+        left = digits[reach - 1 :: -1]  # Nearest first
+        right = digits[reach:]
+        status = 0
+        for player in (1, 2):
+            run = 0
+            for side in (left, right):
+                for digit in side:
+                    if digit != player:
+                        break
+                    run += 1
+            if run >= reach:
+                status |= constants.WIN_BITS[player]
+            for k in range(reach + 1):
+                window = left[:k] + right[: reach - k]
+                if (
+                    len(window) == reach
+                    and window.count(player) == reach - 1
+                    and window.count(0) == 1
+                ):
+                    status |= constants.FOUR_BITS[player]
+                    break
+        cls.code_status[code] = status
+        return status
+
+    def _update_line_codes(self, move: int, delta: int) -> None:
+        """Add delta (a stone, or minus a stone) at move to the codes of its lines."""
+        codes = self.line_codes
+        cells = self.cells
+        line_status = self.line_status
+        table = Board.code_status
+        for index, weight in self._code_updates[move]:
+            code = codes[index] + delta * weight
+            codes[index] = code
+            cell = index >> 2
+            if cells[cell]:
+                continue
+            status = table[code]
+            if status < 0:
+                status = Board._code_status(code)
+            if status != line_status[index]:
+                line_status[index] = status
+                self._update_squares(cell)
+
+    def _update_squares(self, cell: int) -> None:
+        """Set the squares of the empty cell from the status of its four codes."""
+        line_status = self.line_status
+        base = cell * 4
+        status = (
+            line_status[base]
+            | line_status[base + 1]
+            | line_status[base + 2]
+            | line_status[base + 3]
+        )
+        for player in (1, 2):
+            for bits, squares in (
+                (constants.WIN_BITS[player], self._win_squares[player]),
+                (constants.FOUR_BITS[player], self._four_squares[player]),
+            ):
+                if status & bits:
+                    squares.add(cell)
+                else:
+                    squares.discard(cell)
+
+    def _refresh_line_status(self, cell: int) -> None:
+        """Recompute the codes' status of a cell that just became empty."""
+        codes = self.line_codes
+        line_status = self.line_status
+        table = Board.code_status
+        for index in range(cell * 4, cell * 4 + 4):
+            status = table[codes[index]]
+            if status < 0:
+                status = Board._code_status(codes[index])
+            line_status[index] = status
+        self._update_squares(cell)
+
+    def _apply_journal(self) -> None:
+        """Bring the line codes and square sets up to date with the grid."""
+        for move, delta in self._journal:
+            self._update_line_codes(move, delta)
+            if delta > 0:
+                for squares in (self._win_squares, self._four_squares):
+                    squares[1].discard(move)
+                    squares[2].discard(move)
+            else:
+                self._refresh_line_status(move)
+        self._journal.clear()
+
+    @property
+    def win_squares(self) -> Dict[int, Set[int]]:
+        """Per player, the encoded empty cells where a stone completes five."""
+        if self._journal:
+            self._apply_journal()
+        return self._win_squares
+
+    @property
+    def four_squares(self) -> Dict[int, Set[int]]:
+        """Per player, the encoded empty cells where a stone makes a four."""
+        if self._journal:
+            self._apply_journal()
+        return self._four_squares
+
+    def line_code(self, move: int, direction: int) -> int:
+        """Line code of the encoded cell move along DIRECTIONS[direction]."""
+        if self._journal:
+            self._apply_journal()
+        return self.line_codes[move * 4 + direction]
+
+    def encode(self, x: int, y: int) -> int:
+        """Integer encoding of the cell (x, y)."""
+        return y * self.width + x
+
+    def decode(self, move: int) -> Tuple[int, int]:
+        """(x, y) coordinates of an encoded cell."""
+        y, x = divmod(move, self.width)
+        return (x, y)
+
+    @property
+    def occupied_cells(self) -> Set[Tuple[int, int]]:
+        """Occupied cells as (x, y) coordinates."""
+        width = self.width
+        return {(move % width, move // width) for move in self.occupied}
+
     def place_stone(self, x: int, y: int, player: int) -> bool:
         if 0 <= x < self.width and 0 <= y < self.height and self.grid[y][x] == 0:
             self.grid[y][x] = player
+            move = y * self.width + x
+            self.cells[move] = player
             self.move_count += 1
             self.current_hash ^= self.zobrist_table[y][x][player - 1]
-            self.occupied_cells.add((x, y))
+            if self.sym_hashes is not None:
+                self._update_sym_hashes(move, player)
+            self.occupied.add(move)
             self._invalidate_eval_region(x, y)
+            self._journal.append((move, player))
             return True
         return False
 
     def undo_stone(self, x: int, y: int, player: int) -> None:
         if 0 <= x < self.width and 0 <= y < self.height and self.grid[y][x] == player:
             self.grid[y][x] = 0
+            move = y * self.width + x
+            self.cells[move] = 0
             self.move_count -= 1
             self.current_hash ^= self.zobrist_table[y][x][player - 1]
-            self.occupied_cells.discard((x, y))
+            if self.sym_hashes is not None:
+                self._update_sym_hashes(move, player)
+            self.occupied.discard(move)
             self._invalidate_eval_region(x, y)
+            journal = self._journal
+            if journal and journal[-1] == (move, player):
+                journal.pop()  # Probe taken back before anyone looked
+            else:
+                journal.append((move, -player))
+
+    def enable_symmetry(self) -> bool:
+        """
+        Track the hashes of the position's 8 symmetric images.
+
+        They are kept for canonical_hash. Square boards only; returns
+        whether tracking is on.
+        """
+        self.sym_hashes = None
+        if self.width != self.height:
+            return False
+        self.sym_hashes = self.symmetric_hashes()
+        return True
+
+    def symmetric_hashes(self) -> List[int]:
+        """
+        Return the hashes of the 8 symmetric images.
+
+        They are built from the stones, or are the tracked ones when
+        symmetry tracking is on. [current_hash] on non-square boards.
+        """
+        if self.sym_hashes is not None:
+            return self.sym_hashes[:]
+        if self.width != self.height:
+            return [self.current_hash]
+        size = (self.width, self.height)
+        if size not in Board.symmetries:
+            Board._init_symmetries(self.width, self.height)
+        keys = Board.symmetry_keys[size]
+        hashes = [0] * 8
+        for move in self.occupied:
+            images = keys[self.cells[move] - 1][move]
+            for t in range(8):
+                hashes[t] ^= images[t]
+        return hashes
+
+    def disable_symmetry(self) -> None:
+        """Stop tracking the symmetric hashes (no cost per move)."""
+        self.sym_hashes = None
+
+    def _update_sym_hashes(self, move: int, player: int) -> None:
+        """Toggle a stone of player on move in the symmetric hashes."""
+        hashes = self.sym_hashes
+        images = Board.symmetry_keys[(self.width, self.height)][player - 1][move]
+        for t in range(8):
+            hashes[t] ^= images[t]
+
+    def canonical_hash(self) -> Tuple[int, int]:
+        """
+        Return (hash, symmetry) of the position's canonical image.
+
+        That is the smallest of the symmetric hashes and the symmetry
+        giving it. Without symmetry tracking, (current_hash, 0).
+        """
+        hashes = self.sym_hashes
+        if hashes is None:
+            return self.current_hash, 0
+        best = min(hashes)
+        return best, hashes.index(best)
+
+    def stabilizer(self) -> List[int]:
+        """
+        List the symmetries, other than the identity, fixing the position.
+
+        Empty on non-square boards.
+        """
+        if self.width != self.height:
+            return []
+        size = (self.width, self.height)
+        if size not in Board.symmetries:
+            Board._init_symmetries(self.width, self.height)
+        perms = Board.symmetries[size][0]
+        cells = self.cells
+        return [
+            t
+            for t in range(1, 8)
+            if all(cells[perms[t][move]] == cells[move] for move in self.occupied)
+        ]
+
+    def to_symmetry(self, move: Optional[int], t: int) -> Optional[int]:
+        """Image of the encoded cell move under symmetry t (None stays None)."""
+        if move is None or t == 0:
+            return move
+        return Board.symmetries[(self.width, self.height)][0][t][move]
+
+    def from_symmetry(self, move: Optional[int], t: int) -> Optional[int]:
+        """Inverse of to_symmetry."""
+        if move is None or t == 0:
+            return move
+        return Board.symmetries[(self.width, self.height)][1][t][move]
 
     def _invalidate_eval_region(self, x: int, y: int) -> None:
-        """Mark positions in a radius of 2 as dirty for re-evaluation."""
-        for dy in range(-2, 3):
-            for dx in range(-2, 3):
-                nx, ny = x + dx, y + dy
-                if 0 <= nx < self.width and 0 <= ny < self.height:
-                    self.eval_dirty.add((nx, ny))
+        """Mark positions whose evaluation lines cross (x, y) as dirty."""
+        self.eval_dirty.update(self._eval_region[y][x])
 
-    def get_valid_moves(self) -> List[Tuple[int, int]]:
+    def place_move(self, move: int, player: int) -> bool:
+        """place_stone for an encoded cell."""
+        y, x = divmod(move, self.width)
+        return self.place_stone(x, y, player)
+
+    def undo_move(self, move: int, player: int) -> None:
+        """undo_stone for an encoded cell."""
+        y, x = divmod(move, self.width)
+        self.undo_stone(x, y, player)
+
+    def get_valid_cells(self) -> List[int]:
+        """Return the encoded empty cells within MOVE_RADIUS of a stone."""
         if self.move_count == 0:
-            center_x, center_y = self.width // 2, self.height // 2
-            return [(center_x, center_y)]
+            return [self.encode(self.width // 2, self.height // 2)]
 
+        neighbourhood = self._neighbourhood
         candidates = set()
-        for x, y in self.occupied_cells:
-            for dy in range(-constants.MOVE_RADIUS, constants.MOVE_RADIUS + 1):
-                for dx in range(-constants.MOVE_RADIUS, constants.MOVE_RADIUS + 1):
-                    nx, ny = x + dx, y + dy
-                    if (
-                        0 <= nx < self.width
-                        and 0 <= ny < self.height
-                        and self.grid[ny][nx] == 0
-                    ):
-                        candidates.add((nx, ny))
-
-        return list(candidates)
+        for move in self.occupied:
+            candidates.update(neighbourhood[move])
+        cells = self.cells
+        return [move for move in candidates if cells[move] == 0]
+
+    def get_candidate_cells(self) -> List[int]:
+        """
+        Adaptive subset of get_valid_cells for inner search nodes.
+
+        Encoded empty cells adjacent to a stone, plus the empty cells two
+        away from a stone along one of its lines where a stone of the same
+        player would match one of its POTENTIAL_PATTERNS on that line.
+        """
+        if self.move_count == 0:
+            return self.get_valid_cells()
+
+        adjacency = self._adjacency
+        candidates = set()
+        for move in self.occupied:
+            candidates.update(adjacency[move])
+        cells = self.cells
+        line_points = self._line_points
+        for move in self.occupied:
+            player = cells[move]
+            for direction, point in line_points[move]:
+                if (
+                    point not in candidates
+                    and cells[point] == 0
+                    and self._has_potential(point, direction, player)
+                ):
+                    candidates.add(point)
+        return [move for move in candidates if cells[move] == 0]
+
+    def _has_potential(self, move: int, direction: int, player: int) -> bool:
+        """Check if a stone of player on move fits a potential pattern on direction."""
+        cells = self.cells
+        line = [
+            "#" if cell < 0 else ".12"[cells[cell]]
+            for cell in self._lines[move][direction]
+        ]
+        stone = str(player)
+        line[constants.WIN_LENGTH - 1] = stone
+        line = "".join(line)
+        # Every potential pattern holds at least three stones of player
+        if line.count(stone) < 3:
+            return False
+        for pattern in constants.POTENTIAL_PATTERNS[player]:
+            if pattern in line:
+                return True
+        return False
+
+    def get_valid_moves(self) -> List[Tuple[int, int]]:
+        width = self.width
+        return [(move % width, move // width) for move in self.get_valid_cells()]
 
     def is_valid_position(self, x: int, y: int) -> bool:
         return 0 <= x < self.width and 0 <= y < self.height and self.grid[y][x] == 0
@@ -118,10 +621,23 @@ class Board:
     def copy(self) -> "Board":
         new_board = Board(self.width, self.height)
         new_board.grid = [row[:] for row in self.grid]
+        new_board.cells = self.cells[:]
         new_board.move_count = self.move_count
         new_board.current_hash = self.current_hash
+        if self.sym_hashes is not None:
+            new_board.sym_hashes = self.sym_hashes[:]
         new_board.eval_cache = self.eval_cache.copy()
         new_board.eval_totals = self.eval_totals.copy()
         new_board.eval_dirty = self.eval_dirty.copy()
-        new_board.occupied_cells = self.occupied_cells.copy()
+        new_board.occupied = self.occupied.copy()
+        if self._journal:
+            self._apply_journal()
+        new_board.line_codes = self.line_codes[:]
+        new_board.line_status = self.line_status[:]
+        new_board._win_squares = {
+            p: squares.copy() for p, squares in self._win_squares.items()
+        }
+        new_board._four_squares = {
+            p: squares.copy() for p, squares in self._four_squares.items()
+        }
         return new_board
@@ -0,0 +1,76 @@
+##
+## EPITECH PROJECT, 2025
+## Gomoku
+## File description:
+## Compact binary opening book file, memory-mapped and binary-searched
+##
+
+import mmap
+import struct
+from typing import Dict, Optional, Tuple
+
+# Header: magic, format version, board size, number of records
+HEADER = struct.Struct("<4sHHI")
+# Record: canonical hash, canonical response cell, score, search depth
+RECORD = struct.Struct("<QHiB")
+MAGIC = b"GMKB"
+VERSION = 1
+
+
+def write_book(
+    path: str, board_size: int, entries: Dict[int, Tuple[int, int, int]]
+) -> None:
+    """Write entries (hash -> (cell, score, depth)) sorted by hash."""
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, board_size, len(entries)))
+        for key in sorted(entries):
+            cell, score, depth = entries[key]
+            f.write(RECORD.pack(key, cell, score, depth))
+
+
+class BookFile:
+    """
+    Read-only view of a book file.
+
+    The file is memory-mapped, not loaded: opening it costs the same
+    whatever its size, and its records live in the page cache rather
+    than on the Python heap. probe is a binary search over the records.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, self.board_size, self.count = HEADER.unpack_from(
+                self._map, 0
+            )
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"not a version {VERSION} book file: {path}")
+            if len(self._map) != HEADER.size + self.count * RECORD.size:
+                raise ValueError(f"truncated book file: {path}")
+        except (ValueError, struct.error):
+            self._map.close()
+            raise
+
+    def probe(self, key: int) -> Optional[Tuple[int, int, int]]:
+        """(cell, score, depth) stored for key, or None."""
+        data = self._map
+        size = RECORD.size
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            offset = HEADER.size + mid * size
+            found = struct.unpack_from("<Q", data, offset)[0]
+            if found < key:
+                lo = mid + 1
+            elif found > key:
+                hi = mid
+            else:
+                return RECORD.unpack_from(data, offset)[1:]
+        return None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def close(self) -> None:
+        self._map.close()
@@ -0,0 +1,168 @@
+##
+## EPITECH PROJECT, 2025
+## Gomoku
+## File description:
+## Offline opening book generator (python -m game.book_gen from src/)
+##
+
+import argparse
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from . import constants
+from .ai import MinMaxAI
+from .bench import load_position
+from .book_file import write_book
+from .opening_book import canonical_key
+from .search_context import SearchContext
+
+Stones = List[Tuple[int, int, int]]
+
+
+def search_position(
+    stones: Stones, size: int, max_depth: int, time_limit: Optional[float]
+) -> Tuple[Optional[Tuple[int, int]], int, int]:
+    """
+    Worker task: iterative deepening search of our (player 1) move.
+
+    Returns (move, score, depth) of the deepest completed iteration.
+    Without a time limit every position is searched to max_depth, so the
+    book is reproducible.
+    """
+    ai = MinMaxAI()
+    board = load_position(stones, size)
+    ai._set_symmetry(board)
+    deadline = None if time_limit is None else time.time() + time_limit
+    ctx = SearchContext(deadline=deadline)
+    ai.ctx = ctx
+    ai.age += 1
+    move, score, depth = None, 0, 0
+    for current in range(1, max_depth + 1):
+        found, value = ai._search_at_depth(board, 1, current, ctx)
+        if ctx.stopped:
+            break
+        move, score, depth = found, value, current
+    return move, score, depth
+
+
+def opening_roots(size: int, radius: int = 2) -> List[Stones]:
+    """List the empty board and the opponent's first stones near the center."""
+    c = size // 2
+    roots = [[]]
+    for y in range(c - radius, c + radius + 1):
+        for x in range(c - radius, c + radius + 1):
+            roots.append([(x, y, 2)])
+    return roots
+
+
+def generate(
+    size: int = 20,
+    plies: int = 3,
+    replies: int = 4,
+    max_depth: int = 6,
+    time_limit: Optional[float] = None,
+    workers: int = 0,
+) -> Dict[int, Tuple[int, int, int]]:
+    """
+    Book entries (canonical hash -> (canonical cell, score, depth)).
+
+    Expands from opening_roots one ply pair at a time: each position of
+    the layer is searched (in parallel with workers > 1), and the
+    opponent's `replies` best-scored answers to our move make the next
+    layer. Symmetric positions are searched once; positions past
+    OPENING_BOOK_MAX_MOVES stones are not added.
+    """
+    entries: Dict[int, Tuple[int, int, int]] = {}
+    seen = set()
+    scorer = MinMaxAI()
+    layer = opening_roots(size)
+    pool = None
+    if workers > 1:
+        pool = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    try:
+        for ply in range(plies):
+            unique = []
+            for stones in layer:
+                if len(stones) > constants.OPENING_BOOK_MAX_MOVES:
+                    continue
+                key, _ = canonical_key(load_position(stones, size))
+                if key not in seen:
+                    seen.add(key)
+                    unique.append(stones)
+            if not unique:
+                break
+            start = time.time()
+            args = (
+                unique,
+                [size] * len(unique),
+                [max_depth] * len(unique),
+                [time_limit] * len(unique),
+            )
+            results = (
+                pool.map(search_position, *args)
+                if pool
+                else map(search_position, *args)
+            )
+
+            layer = []
+            for stones, (move, score, depth) in zip(unique, results):
+                if move is None:
+                    continue
+                board = load_position(stones, size)
+                key, t = canonical_key(board)
+                cell = board.to_symmetry(board.encode(*move), t)
+                entries[key] = (cell, score, depth)
+                board.place_stone(move[0], move[1], 1)
+                if board.check_win(move[0], move[1], 1):
+                    continue
+                scored = scorer._score_moves(board, board.get_valid_moves(), 2)
+                for reply, _ in scored[:replies]:
+                    layer.append(stones + [(move[0], move[1], 1), reply + (2,)])
+            print(
+                f"ply {ply + 1}: {len(unique)} positions in "
+                f"{time.time() - start:.1f}s, {len(entries)} entries"
+            )
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return entries
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Gomoku opening book generator")
+    parser.add_argument("--size", type=int, default=20, help="board size")
+    parser.add_argument("--plies", type=int, default=3, help="our moves per line")
+    parser.add_argument(
+        "--replies", type=int, default=4, help="opponent answers expanded per move"
+    )
+    parser.add_argument("--depth", type=int, default=6, help="search depth")
+    parser.add_argument(
+        "--time",
+        type=float,
+        default=None,
+        help="seconds per position (default: search to --depth)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="worker processes"
+    )
+    parser.add_argument(
+        "--output",
+        default=os.path.join(os.path.dirname(__file__), constants.OPENING_BOOK_FILE),
+        help="book file to write",
+    )
+    args = parser.parse_args()
+
+    entries = generate(
+        args.size, args.plies, args.replies, args.depth, args.time, args.workers
+    )
+    write_book(args.output, args.size, entries)
+    print(f"wrote {len(entries)} entries to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
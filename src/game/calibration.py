@@ -0,0 +1,147 @@
+##
+## EPITECH PROJECT, 2025
+## Gomoku
+## File description:
+## Startup calibration of node rate and deadline safety margins
+##
+
+import math
+import threading
+import time
+from typing import Callable, Optional
+
+from utils.logger import get_logger
+
+from . import constants
+from .search_context import SearchContext
+
+
+class Calibration:
+    """
+    Host-specific timing margins.
+
+    The defaults are the hand-tuned constants. calibrate() replaces them
+    with values derived from this host's node rate, thread join latency
+    and stdout flush latency.
+    """
+
+    def __init__(self):
+        self.node_rate = float(constants.CALIBRATION_REFERENCE_RATE)
+        self.join_latency = 0.0
+        self.flush_latency = 0.0
+        self.response_deadline = constants.RESPONSE_DEADLINE
+        self.search_margin = constants.SEARCH_SAFETY_MARGIN
+        self.bank_margin = constants.TIME_BANK_MARGIN
+        self.join_timeout = constants.THREAD_JOIN_TIMEOUT
+        self.expected_depth = constants.MAX_DEPTH
+
+    def derive(self) -> None:
+        """Derive margins and depth expectations from the measurements."""
+        # Slow hosts need wider margins, fast hosts can use more of the turn
+        scale = constants.CALIBRATION_REFERENCE_RATE / max(self.node_rate, 1.0)
+        scale = min(
+            constants.CALIBRATION_MAX_SCALE, max(constants.CALIBRATION_MIN_SCALE, scale)
+        )
+        latency = (self.join_latency + self.flush_latency) * (
+            constants.CALIBRATION_LATENCY_FACTOR
+        )
+
+        base_margin = constants.TURN_TIMEOUT - constants.RESPONSE_DEADLINE
+        deadline = constants.TURN_TIMEOUT - base_margin * scale - latency
+        self.response_deadline = min(
+            constants.CALIBRATION_MAX_DEADLINE,
+            max(constants.CALIBRATION_MIN_DEADLINE, deadline),
+        )
+        self.search_margin = constants.SEARCH_SAFETY_MARGIN * scale + latency
+        self.bank_margin = constants.TIME_BANK_MARGIN * scale + latency
+        self.join_timeout = constants.THREAD_JOIN_TIMEOUT * scale + self.join_latency
+
+        # Depth reachable in one turn with the effective branching factor
+        nodes = self.node_rate * max(0.0, self.response_deadline - self.search_margin)
+        if nodes > 1:
+            depth = int(math.log(nodes) / math.log(constants.CALIBRATION_BRANCHING))
+        else:
+            depth = 1
+        self.expected_depth = max(1, min(constants.MAX_DEPTH, depth))
+
+    def warmup_depth(self, depth: int) -> int:
+        """Cap a warming/pondering depth to what this host can finish."""
+        return max(2, min(depth, self.expected_depth))
+
+    def __repr__(self) -> str:
+        return (
+            f"Calibration(rate={self.node_rate:.0f}n/s "
+            f"join={self.join_latency * 1000:.2f}ms "
+            f"flush={self.flush_latency * 1000:.2f}ms "
+            f"deadline={self.response_deadline:.2f}s "
+            f"margin={self.search_margin:.2f}s depth={self.expected_depth})"
+        )
+
+
+def _measure_node_rate() -> float:
+    """Run a short time-boxed search on a fixed midgame position."""
+    from .ai import MinMaxAI
+    from .board import Board
+
+    board = Board(20, 20)
+    for x, y, player in constants.CALIBRATION_POSITION:
+        board.place_stone(x, y, player)
+
+    probe = MinMaxAI()
+    ctx = SearchContext(deadline=time.time() + constants.CALIBRATION_TIME)
+    start = time.perf_counter()
+    probe.negamax(board, 3, -constants.INFINITY, constants.INFINITY, 1, ctx)
+    elapsed = time.perf_counter() - start
+
+    return ctx.nodes / max(elapsed, 1e-6)
+
+
+def _measure_join_latency() -> float:
+    """Time from signalling a waiting thread to join() returning."""
+    worst = 0.0
+    for _ in range(constants.CALIBRATION_SAMPLES):
+        event = threading.Event()
+        thread = threading.Thread(target=event.wait, daemon=True)
+        thread.start()
+        start = time.perf_counter()
+        event.set()
+        thread.join()
+        worst = max(worst, time.perf_counter() - start)
+    return worst
+
+
+def _measure_flush_latency(flush: Optional[Callable[[], None]]) -> float:
+    """Worst observed cost of flushing the output stream."""
+    if flush is None:
+        return 0.0
+    worst = 0.0
+    for _ in range(constants.CALIBRATION_SAMPLES):
+        start = time.perf_counter()
+        flush()
+        worst = max(worst, time.perf_counter() - start)
+    return worst
+
+
+def calibrate(flush: Optional[Callable[[], None]] = None) -> Calibration:
+    """
+    Measure this host and return its calibrated timing margins.
+
+    Args:
+        flush: Flush function of the protocol output stream (stdout)
+
+    Returns:
+        Calibration with derived deadline, margins and expected depth
+    """
+    calibration = Calibration()
+    try:
+        calibration.node_rate = _measure_node_rate()
+        calibration.join_latency = _measure_join_latency()
+        calibration.flush_latency = _measure_flush_latency(flush)
+        calibration.derive()
+    except Exception as e:
+        # Never fail START because of calibration: keep hand-tuned defaults
+        get_logger().warn(f"Calibration failed, using defaults: {e}")
+        return Calibration()
+
+    get_logger().info(f"Calibrated: {calibration}")
+    return calibration
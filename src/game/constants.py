@@ -30,9 +30,47 @@ MAX_DEPTH = 12
 TIME_BANK_ENABLED = True
 RESPONSE_DEADLINE = 4.30  # Return move at this time (700ms safety margin from 5s limit)
 MIN_THINKING_TIME = 0.1   # Always think at least this long
-TT_WARMUP_DEPTH = 6       # Depth for warming TT during time bank (reduced from 8 to prevent timeout)
+# Depth for warming TT during time bank (reduced from 8 to prevent timeout)
+TT_WARMUP_DEPTH = 6
 TT_WARMUP_POSITIONS = 4   # Number of opponent responses to explore during warming
 
+# Time Management - stop early on a stable root, extend when it changes its mind
+# Stop iterative deepening this long before RESPONSE_DEADLINE
+SEARCH_SAFETY_MARGIN = 0.3
+TIME_SOFT_FRACTION = 0.6       # Soft budget: share of the search time used normally
+TIME_STABLE_FRACTION = 0.5     # Share of the soft budget used once the root is stable
+TIME_ITERATION_GROWTH = 3.0    # Next iteration assumed to take N times the last one
+STABILITY_MIN_DEPTH = 4        # Never stop early before this depth is completed
+STABILITY_ITERATIONS = 3       # Same best move for N iterations = stable root
+STABILITY_SCORE_MARGIN = 300   # Score swing between iterations counted as instability
+SEARCH_POLL_INTERVAL = 0.02    # Poll interval of the search driver in seconds
+# Time-banked return wakes up this long before the deadline
+TIME_BANK_MARGIN = 0.30
+THREAD_JOIN_TIMEOUT = 0.1      # Max wait for a stopped search thread
+
+# Startup Calibration - derive the margins above from this host's speed at START
+CALIBRATION_ENABLED = True
+TURN_TIMEOUT = 5.0                 # timeout_turn of the game manager (seconds)
+CALIBRATION_TIME = 0.1             # Duration of the node-rate probe
+CALIBRATION_SAMPLES = 5            # Samples for join/flush latency (worst is kept)
+# Node rate (nodes/s) the hand-tuned margins fit: the START probe's median on
+# the reference host (8 fresh processes, 447-465 n/s)
+CALIBRATION_REFERENCE_RATE = 460
+CALIBRATION_MIN_SCALE = 0.5        # Margins shrink at most to half on fast hosts
+CALIBRATION_MAX_SCALE = 2.0        # and grow at most to double on slow ones
+CALIBRATION_LATENCY_FACTOR = 4.0   # Safety multiple of measured join + flush latency
+CALIBRATION_MIN_DEADLINE = 3.5     # Calibrated RESPONSE_DEADLINE bounds
+CALIBRATION_MAX_DEADLINE = 4.6
+CALIBRATION_BRANCHING = 6.0        # Effective branching factor for depth estimates
+CALIBRATION_POSITION = [           # Fixed midgame probe position (x, y, player)
+    (10, 10, 1), (11, 11, 2), (10, 11, 1), (9, 9, 2), (11, 10, 2), (12, 12, 1),
+]
+
+# Watchdog - force a reply from the protocol side if the search misses its deadline
+WATCHDOG_ENABLED = True
+WATCHDOG_DEADLINE = 4.75   # Hard reply deadline from command receipt (5s timeout_turn)
+EMERGENCY_CACHE_SIZE = 64  # Root positions remembered with their best-so-far move
+
 # Pondering - calculate during opponent's turn
 PONDER_ENABLED = True
 PONDER_PREDICTIONS = 5    # Top N opponent moves to explore
@@ -48,25 +86,93 @@ LMR_FULL_MOVES = 3          # First N moves at full depth
 LMR_MIN_DEPTH = 3           # Minimum depth to apply LMR
 LMR_REDUCTION = 2           # Depth reduction amount
 
+# Forward Pruning - null-window nodes only, never in forcing positions
+# (A/B with python -m game.bench --ab from src/)
+FUTILITY_ENABLED = True
+FUTILITY_MAX_DEPTH = 2      # Frontier depths where futility applies
+FUTILITY_MARGINS = (0, 5_000, 20_000)  # By depth: quiet-move eval gain bound
+LMP_ENABLED = True
+LMP_MAX_DEPTH = 3           # Late move pruning up to this depth
+# By depth: moves searched before quiet moves are pruned
+LMP_MOVE_COUNTS = (0, 8, 12, 16)
+PROBCUT_ENABLED = True
+PROBCUT_MIN_DEPTH = 3       # Minimum depth to try ProbCut
+PROBCUT_REDUCTION = 2       # Depth reduction of the ProbCut verification search
+PROBCUT_MARGIN = 20_000     # Beta is raised by this much for the verification
+PROBCUT_MAX_MOVES = 3       # Tactical moves tried by ProbCut
+
+# Search Extensions - forcing moves searched one ply deeper in negamax
+EXTENSIONS_ENABLED = True
+EXTENSION_MAX_PLIES = 2     # Extension plies allowed along one search path
+
 # Quiescence Search - extend search on tactical moves at depth 0
 QUIESCENCE_MAX_DEPTH = 4    # Maximum plies to search in quiescence (reduced to avoid timeout)
 QUIESCENCE_MAX_MOVES = 6    # Maximum moves to explore per quiescence level
 QUIESCENCE_DELTA = 50_000   # Delta pruning margin
+QUIESCENCE_MOVE_CACHE_SIZE = 50_000  # Cached tactical move lists (position, player)
 
 # History Heuristic - track successful moves across depths
 HISTORY_MAX_VALUE = 10_000  # Cap history scores to prevent overflow
 HISTORY_DECAY_FACTOR = 0.9  # Multiply all history by this each age
 HISTORY_BONUS_DEPTH = True  # Scale bonus by depth (deeper = more valuable)
+HISTORY_RESCALE_LIMIT = 1e9 # Renormalise raw history once the epoch weight exceeds this
+MAX_BOARD_SIZE = 32         # Largest side supported by the cell-indexed move tables
+MAX_PLY = MAX_DEPTH + EXTENSION_MAX_PLIES + QUIESCENCE_MAX_DEPTH  # Search stack frames
 
 # Opening Book - pre-computed moves for early game
 OPENING_BOOK_MAX_MOVES = 6  # Use book for first N moves
 OPENING_BOOK_ENABLED = True # Toggle opening book
+# Generated book (python -m game.book_gen), in game/
+OPENING_BOOK_FILE = "opening_book.bin"
+
+# Symmetry - canonical hashing while the early-game position is symmetric
+SYMMETRY_ENABLED = True     # Toggle canonical TT keys and symmetric root pruning
+SYMMETRY_MAX_MOVES = 10     # Never tracked past this many stones
 
 DOUBLE_THREE_BONUS = 20_000
 DOUBLE_FOUR_BONUS = 50_000
 CENTER_CONTROL = 10
 
 MOVE_RADIUS = 2
+# Inner search nodes: radius 1, plus distance-2 points on lines with pattern potential
+ADAPTIVE_RADIUS_ENABLED = True
+
+# Board line codes (see Board.win_squares / four_squares)
+OFF_BOARD = 3               # Code digit of a cell beyond the edge
+WIN_BITS = {1: 1, 2: 2}     # Line code status: the cell completes five
+FOUR_BITS = {1: 4, 2: 8}    # Line code status: the cell makes a four
+
+# Threat-space search - threat kinds of game.threats, weakest first
+THREAT_THREE = 1            # Makes a straight four next unless a cost square is taken
+THREAT_FOUR = 2             # One completion square: the only cost square
+THREAT_STRAIGHT_FOUR = 3    # Two completion squares: cannot be defended
+THREAT_FIVE = 4             # Completes five
+VCT_DEPTHS = (6, 10)        # Depths tried before max_depth (quick wins first)
+VCT_MAX_DEPTH = 14          # max_depth of the turn's own VCT search
+VCT_ROOT_MOVES = 16         # Root threat moves tried by the in-process search
+
+# Parallel VCT - root threat moves spread over worker processes (game.vct_pool)
+# Each worker costs ~25 MB: keep within max_memory (70 MB per bot, config.ini)
+VCT_WORKERS = 0             # Worker processes, 0 = search in-process
+VCT_POOL_ROOT_MOVES = 64    # Root threat moves shared by the workers
+VCT_POOL_POLL = 0.01        # Seconds between checks of the search's stop token
+
+# Portfolio - the full search races the VCT pool's solvers from the start of the turn
+PORTFOLIO_ENABLED = False   # Needs VCT_WORKERS > 0 (else phases run in sequence)
+PORTFOLIO_VETO_MOVES = 6    # Best-ordered root moves checked for a refutation up front
+PORTFOLIO_REFUTE_DEPTH = 10 # max_depth of the opponent's VCT against a root move
+
+# VCF safety check - the opponent's continuous fours against the chosen move
+VCF_CHECK_ENABLED = True
+VCF_CHECK_BUDGET = 0.08     # Seconds for the whole check, so it runs on every move
+VCF_CHECK_ALTERNATIVES = 4  # Next-best moves tried when the chosen one is refuted
+VCF_MAX_DEPTH = 16          # Fours the attacker may play along one line
+VCF_CACHE_SIZE = 50_000     # (position, attacker) -> VCF start or None, and depth
+
+# VCT proof table - (position, side to move, attacker) -> proof or disproof
+# Kept across turns: the opponent's reply was usually explored. Proofs that
+# skipped defences (past the 6 best) only hold on the turn that found them
+VCT_TABLE_SIZE = 50_000
 
 SCORE_FIVE = 1_000_000
 SCORE_OPEN_FOUR = 100_000
@@ -90,6 +196,8 @@ UPPER = 2
 
 # Transposition Table
 TT_MAX_SIZE = 500_000  # Maximum transposition table entries (LRU eviction)
+EVAL_CACHE_SIZE = 100_000  # Static evaluations by position hash, shared by board copies
+HEURISTIC_CACHE_SIZE = 200_000  # Move ordering scores by (position hash, move, player)
 
 MOVE_WIN = 1_000_000_000
 MOVE_BLOCK_WIN = 500_000_000
@@ -112,6 +220,8 @@ MOVE_BLOCK_BUILDING_TWO = 2_000_000  # Proactive defense - stop .XX. from becomi
 IMMEDIATE_MOVE_THRESHOLD = 40_000_000  # MOVE_BLOCK_SPLIT_THREE level
 
 PATTERNS = {1: None, 2: None}
+# Threat and winning patterns: a line matching one with the new stone has potential
+POTENTIAL_PATTERNS = {1: None, 2: None}
 
 
 def _init_patterns():
@@ -161,5 +271,13 @@ def _init_patterns():
                 },
             }
 
+            potential = []
+            for category in ("winning", "threat"):
+                for pats in PATTERNS[player][category].values():
+                    for pat in [pats] if isinstance(pats, str) else pats:
+                        if pat not in potential:
+                            potential.append(pat)
+            POTENTIAL_PATTERNS[player] = tuple(potential)
+
 
 _init_patterns()
@@ -0,0 +1,74 @@
+##
+## EPITECH PROJECT, 2025
+## Gomoku
+## File description:
+## History heuristic and countermove tables indexed by encoded move
+##
+
+from typing import List, Optional
+
+from . import constants
+
+
+class HistoryTable:
+    """
+    History scores and countermoves in flat per-player arrays.
+
+    Indexed by encoded move (Board.encode) and sized for boards up to
+    MAX_BOARD_SIZE, the largest START accepts.
+
+    Scores are stored multiplied by a weight that grows by
+    1 / HISTORY_DECAY_FACTOR each epoch: decaying every entry is O(1), and
+    since the weight is common to all entries, move ordering can compare
+    the raw values directly. Raw values are renormalised only when the
+    weight gets large.
+    """
+
+    def __init__(self):
+        cells = constants.MAX_BOARD_SIZE * constants.MAX_BOARD_SIZE
+        # Indexed by player (1 or 2); slot 0 is unused
+        self.raw: List[List[float]] = [[], [0.0] * cells, [0.0] * cells]
+        self.countermoves: List[List[Optional[int]]] = [
+            [],
+            [None] * cells,
+            [None] * cells,
+        ]
+        self.weight = 1.0
+
+    def score(self, move: int, player: int) -> int:
+        """Decayed history score of move for player."""
+        return round(self.raw[player][move] / self.weight)
+
+    def set(self, move: int, player: int, value: int) -> None:
+        """Set the decayed score of move for player."""
+        self.raw[player][move] = value * self.weight
+
+    def update(self, move: int, player: int, bonus: int) -> None:
+        """Add a cutoff bonus, capped at HISTORY_MAX_VALUE."""
+        scores = self.raw[player]
+        scores[move] = min(
+            scores[move] + bonus * self.weight,
+            constants.HISTORY_MAX_VALUE * self.weight,
+        )
+
+    def decay(self) -> None:
+        """Start a new epoch: all scores shrink by HISTORY_DECAY_FACTOR."""
+        self.weight /= constants.HISTORY_DECAY_FACTOR
+        if self.weight > constants.HISTORY_RESCALE_LIMIT:
+            for player in (1, 2):
+                self.raw[player] = [value / self.weight for value in self.raw[player]]
+            self.weight = 1.0
+
+    def counter(self, player: int, previous: Optional[int]) -> Optional[int]:
+        """Reply of player that last refuted the opponent's previous move."""
+        if previous is None:
+            return None
+        return self.countermoves[player][previous]
+
+    def set_counter(self, player: int, previous: int, move: int) -> None:
+        """Record move as player's refutation of the opponent's previous move."""
+        self.countermoves[player][previous] = move
+
+    def entries(self, player: int) -> int:
+        """Count the moves with a non-zero score for player."""
+        return sum(1 for value in self.raw[player] if value / self.weight >= 0.5)
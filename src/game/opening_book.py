@@ -5,29 +5,58 @@
 ## Opening book for pre-computed moves
 ##
 
+import os
 from typing import Dict, List, Optional, Tuple, Callable
 
+from . import constants
+from .board import Board, symmetry_transforms
+from .book_file import BookFile
+from utils.logger import get_logger
+
 
 class OpeningBook:
     """
     Pre-computed opening moves for Gomoku.
 
-    Uses normalized board representation to handle symmetry.
-    Board states are represented as frozensets of (x, y, player) tuples.
+    Positions are keyed by their canonical Zobrist hash (the smallest hash
+    of their 8 symmetric images, see Board.canonical_hash), so symmetric
+    positions share one entry. Responses are stored as encoded cells in
+    the canonical image's frame and transformed back at lookup.
+
+    Positions missing from these hand-written patterns are probed in the
+    generated book file (see game.book_gen), when there is one.
     """
 
-    def __init__(self, board_size: int = 20):
+    def __init__(self, board_size: int = 20, path: Optional[str] = None):
         self.board_size = board_size
         self.center = board_size // 2
-        self.book: Dict[frozenset, Tuple[int, int]] = {}
+        self.book: Dict[int, int] = {}  # canonical hash -> canonical response cell
+        self._scratch = Board(board_size, board_size)  # Hashes positions being added
         self._build_book()
+        if path is None:
+            path = os.path.join(os.path.dirname(__file__), constants.OPENING_BOOK_FILE)
+        self.file = self._open_file(path)
+
+    def _open_file(self, path: str) -> Optional[BookFile]:
+        """Memory-map the book file of our board size, if there is one."""
+        if not os.path.exists(path):
+            return None
+        try:
+            book_file = BookFile(path)
+        except (OSError, ValueError) as e:
+            get_logger().warn(f"Ignoring opening book file: {e}")
+            return None
+        if book_file.board_size != self.board_size:
+            book_file.close()
+            return None
+        return book_file
 
     def _build_book(self) -> None:
         """Build the opening book with common patterns."""
         c = self.center  # Shorthand for center coordinate
 
         # === Move 1: Empty board -> play center ===
-        self.book[frozenset()] = (c, c)
+        self._add([], (c, c))
 
         # === Move 2: Opponent at center -> adjacent diagonal ===
         self._add_with_symmetry(
@@ -92,45 +121,42 @@ class OpeningBook:
         """
         Add a position and all its symmetric variants to the book.
 
-        Symmetries considered:
+        Symmetries considered (about the center cell):
         - 4 rotations (0, 90, 180, 270 degrees)
         - 4 reflections (horizontal, vertical, both diagonals)
+
+        Variants that are board symmetries of each other share one entry.
         """
+        size = self.board_size
         for transform in self._get_transforms():
-            transformed_stones = frozenset(
-                (transform(x, y)[0], transform(x, y)[1], p)
-                for x, y, p in stones
-            )
+            transformed_stones = [
+                transform(x, y) + (p,) for x, y, p in stones
+            ]
             transformed_response = transform(response[0], response[1])
 
-            # Only add if response is valid
-            rx, ry = transformed_response
-            if 0 <= rx < self.board_size and 0 <= ry < self.board_size:
-                self.book[transformed_stones] = transformed_response
+            # Only add if every square is on the board
+            squares = [(x, y) for x, y, _ in transformed_stones]
+            squares.append(transformed_response)
+            if all(0 <= x < size and 0 <= y < size for x, y in squares):
+                self._add(transformed_stones, transformed_response)
+
+    def _add(
+        self,
+        stones: List[Tuple[int, int, int]],
+        response: Tuple[int, int]
+    ) -> None:
+        """Store one position under its canonical hash."""
+        board = self._scratch
+        for x, y, p in stones:
+            board.place_stone(x, y, p)
+        key, t = canonical_key(board)
+        self.book[key] = board.to_symmetry(board.encode(*response), t)
+        for x, y, p in stones:
+            board.undo_stone(x, y, p)
 
     def _get_transforms(self) -> List[Callable[[int, int], Tuple[int, int]]]:
-        """Get all 8 symmetry transformations."""
-        c = self.center
-
-        transforms = [
-            # Identity
-            lambda x, y: (x, y),
-            # Rotate 90 degrees clockwise around center
-            lambda x, y, c=c: (c + (y - c), c - (x - c)),
-            # Rotate 180 degrees
-            lambda x, y, c=c: (2*c - x, 2*c - y),
-            # Rotate 270 degrees clockwise
-            lambda x, y, c=c: (c - (y - c), c + (x - c)),
-            # Reflect horizontal (mirror left-right)
-            lambda x, y, c=c: (2*c - x, y),
-            # Reflect vertical (mirror top-bottom)
-            lambda x, y, c=c: (x, 2*c - y),
-            # Reflect main diagonal
-            lambda x, y, c=c: (c + (y - c), c + (x - c)),
-            # Reflect anti-diagonal
-            lambda x, y, c=c: (c - (y - c), c - (x - c)),
-        ]
-        return transforms
+        """Get all 8 symmetry transformations (about the center cell)."""
+        return symmetry_transforms(2 * self.center)
 
     def lookup(self, board) -> Optional[Tuple[int, int]]:
         """
@@ -142,8 +168,6 @@ class OpeningBook:
         Returns:
             Best move (x, y) if found, None otherwise
         """
-        from . import constants
-
         # Only use book for first N moves
         if not constants.OPENING_BOOK_ENABLED:
             return None
@@ -151,21 +175,18 @@ class OpeningBook:
         if board.move_count > constants.OPENING_BOOK_MAX_MOVES:
             return None
 
-        # Convert board to normalized representation
-        stones = set()
-        for y in range(board.height):
-            for x in range(board.width):
-                if board.grid[y][x] != 0:
-                    stones.add((x, y, board.grid[y][x]))
-
-        state = frozenset(stones)
-
-        # Direct lookup
-        if state in self.book:
-            move = self.book[state]
+        # Canonical image of the position: one probe, then back to our frame
+        key, t = canonical_key(board)
+        move = self.book.get(key)
+        if move is None and self.file is not None:
+            entry = self.file.probe(key)
+            if entry is not None:
+                move = entry[0]
+        if move is not None and board.width == self.board_size:
+            x, y = board.decode(board.from_symmetry(move, t))
             # Verify move is valid (empty square)
-            if board.grid[move[1]][move[0]] == 0:
-                return move
+            if board.grid[y][x] == 0:
+                return (x, y)
 
         return None
 
@@ -174,6 +195,13 @@ class OpeningBook:
         return len(self.book)
 
 
+def canonical_key(board) -> Tuple[int, int]:
+    """(smallest symmetric hash, symmetry giving it) of board's position."""
+    hashes = board.symmetric_hashes()
+    key = min(hashes)
+    return key, hashes.index(key)
+
+
 # Singleton instance
 _opening_book: Optional[OpeningBook] = None
 
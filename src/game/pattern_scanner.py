@@ -0,0 +1,190 @@
+##
+## EPITECH PROJECT, 2025
+## Gomoku
+## File description:
+## Single-pass multi-pattern (Aho-Corasick) scanner for board threat scans
+##
+
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from . import constants
+
+# Threat categories of a full board scan, in report order
+SCAN_CATEGORIES = ("fours", "open_threes", "split_threes", "building_twos")
+
+# Names of constants.DIRECTIONS, in the same order
+DIRECTION_NAMES = ("horizontal", "vertical", "diagonal_\\", "diagonal_/")
+
+_scanners: Dict[int, "PatternScanner"] = {}
+
+
+class PatternScanner:
+    """
+    Aho-Corasick automaton over line strings ('.', '1', '2').
+
+    Compiled once from (category, pattern, marks) entries, it reports every
+    occurrence of every pattern, overlapping ones included, in one pass.
+    marks are offsets inside the pattern (gaps, blocking or extension
+    squares) that are carried along with each match.
+    """
+
+    def __init__(self, entries: Sequence[Tuple[str, str, Tuple[int, ...]]]):
+        self.entries = list(entries)
+        # Trie
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+        for index, (_, pattern, _) in enumerate(self.entries):
+            state = 0
+            for char in pattern:
+                if char not in goto[state]:
+                    goto.append({})
+                    outputs.append([])
+                    goto[state][char] = len(goto) - 1
+                state = goto[state][char]
+            outputs[state].append(index)
+
+        # Failure links, folded into a complete transition table
+        alphabet = {char for _, pattern, _ in self.entries for char in pattern}
+        delta: List[Dict[str, int]] = [dict() for _ in goto]
+        fail = [0] * len(goto)
+        for char in alphabet:
+            delta[0][char] = goto[0].get(char, 0)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            outputs[state] = outputs[state] + outputs[fail[state]]
+            for char in alphabet:
+                child = goto[state].get(char)
+                if child is None:
+                    delta[state][char] = delta[fail[state]][char]
+                else:
+                    fail[child] = delta[fail[state]][char]
+                    delta[state][char] = child
+                    queue.append(child)
+
+        self.delta = delta
+        self.outputs = [tuple(out) for out in outputs]
+
+    def scan(self, line: str) -> List[Tuple[int, int]]:
+        """
+        All matches in line, as (start, entry index), ordered by end.
+
+        Characters outside the patterns' alphabet (e.g. '#') reset the
+        automaton.
+        """
+        delta = self.delta
+        outputs = self.outputs
+        entries = self.entries
+        matches = []
+        state = 0
+        for end, char in enumerate(line):
+            state = delta[state].get(char, 0)
+            if outputs[state]:
+                for index in outputs[state]:
+                    matches.append((end - len(entries[index][1]) + 1, index))
+        return matches
+
+
+def threat_entries(player: int) -> List[Tuple[str, str, Tuple[int, ...]]]:
+    """Scan patterns of player's threats, in the order they are reported."""
+    p = str(player)
+    return [
+        ("fours", p * 4, ()),
+        ("fours", f"{p * 3}.{p}", (3,)),
+        ("fours", f"{p}.{p * 3}", (1,)),
+        ("fours", f"{p * 2}.{p * 2}", (2,)),
+        ("open_threes", f".{p * 3}.", (0, 4)),
+        ("split_threes", f"{p * 2}.{p}", (2,)),
+        ("split_threes", f"{p}.{p * 2}", (1,)),
+        ("building_twos", f".{p * 2}.", (0, 3)),
+    ]
+
+
+def get_scanner(player: int) -> PatternScanner:
+    """Threat scanner of player, compiled on first use."""
+    scanner = _scanners.get(player)
+    if scanner is None:
+        scanner = _scanners[player] = PatternScanner(threat_entries(player))
+    return scanner
+
+
+def grid_lines(
+    grid: Sequence[Sequence[int]],
+) -> Iterator[Tuple[int, int, int, int, str]]:
+    """
+    Every full row, column and diagonal of grid (rows of 0/1/2).
+
+    Yields (direction index, start x, start y, length, line string).
+    """
+    height, width = len(grid), len(grid[0])
+    chars = ".12"
+    for direction, (dx, dy) in enumerate(constants.DIRECTIONS):
+        if direction == 0:
+            starts = [(0, y) for y in range(height)]
+        elif direction == 1:
+            starts = [(x, 0) for x in range(width)]
+        elif direction == 2:
+            starts = [
+                (max(0, s - height + 1), max(0, height - 1 - s))
+                for s in range(width + height - 1)
+            ]
+        else:
+            starts = [
+                (max(0, s - height + 1), min(height - 1, s))
+                for s in range(width + height - 1)
+            ]
+        for x, y in starts:
+            cells = []
+            cx, cy = x, y
+            while 0 <= cx < width and 0 <= cy < height:
+                cells.append(chars[grid[cy][cx]])
+                cx += dx
+                cy += dy
+            yield direction, x, y, len(cells), "".join(cells)
+
+
+def scan_grid(
+    grid: Sequence[Sequence[int]], player: int, scanner: Optional[PatternScanner] = None
+) -> Dict[str, list]:
+    """
+    All threat patterns of player on grid, by category.
+
+    Usable on any rows-of-ints grid (the engine's Board.grid, the
+    visualizer's). Each match is a dict with its "positions", "direction"
+    name and marks: "gap" for fours ("pattern" too) and split threes,
+    "blocks" for open threes, "extensions" for building twos. Within a
+    line, matches are reported by pattern, then by position.
+    """
+    if scanner is None:
+        scanner = get_scanner(player)
+    stone = str(player)
+    threats: Dict[str, list] = {category: [] for category in SCAN_CATEGORIES}
+    for direction, x, y, length, line in grid_lines(grid):
+        # Every pattern holds at least two of player's stones
+        if length < 4 or line.count(stone) < 2:
+            continue
+        matches = scanner.scan(line)
+        if not matches:
+            continue
+        matches.sort(key=lambda match: match[1])
+        dx, dy = constants.DIRECTIONS[direction]
+        name = DIRECTION_NAMES[direction]
+        for start, index in matches:
+            category, pattern, marks = scanner.entries[index]
+            positions = [
+                (x + (start + i) * dx, y + (start + i) * dy)
+                for i in range(len(pattern))
+            ]
+            threat = {"positions": positions, "direction": name}
+            if category == "fours":
+                threat["gap"] = positions[marks[0]] if marks else None
+                threat["pattern"] = pattern
+            elif category == "open_threes":
+                threat["blocks"] = [positions[i] for i in marks]
+            elif category == "split_threes":
+                threat["gap"] = positions[marks[0]]
+            else:
+                threat["extensions"] = [positions[i] for i in marks]
+            threats[category].append(threat)
+    return threats
@@ -9,6 +9,7 @@ import threading
 from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
 from . import constants
+from .search_context import SearchContext
 
 if TYPE_CHECKING:
     from .ai import MinMaxAI
@@ -32,6 +33,7 @@ class PonderManager:
         self.pondering = False
         self.stop_flag = False
         self.threads: list[threading.Thread] = []
+        self.contexts: list[SearchContext] = []  # One per ponder thread
 
     def start_pondering(
         self,
@@ -66,13 +68,16 @@ class PonderManager:
 
         # Start background search for each prediction
         self.threads = []
+        self.contexts = []
         for pred_move in predicted_moves:
+            ctx = SearchContext()
             thread = threading.Thread(
                 target=self._ponder_position,
-                args=(board.copy(), pred_move, opponent, player),
+                args=(board.copy(), pred_move, opponent, player, ctx),
                 daemon=True
             )
             self.threads.append(thread)
+            self.contexts.append(ctx)
             thread.start()
 
     def _ponder_position(
@@ -80,7 +85,8 @@ class PonderManager:
         board: "Board",
         opponent_move: Tuple[int, int],
         opponent: int,
-        player: int
+        player: int,
+        ctx: SearchContext
     ) -> None:
         """
         Search a predicted position in background.
@@ -90,6 +96,7 @@ class PonderManager:
             opponent_move: Predicted opponent move
             opponent: Opponent player number
             player: Our player number
+            ctx: Search context of this thread (cancelled by stop_pondering)
         """
         try:
             if self.stop_flag:
@@ -100,7 +107,7 @@ class PonderManager:
             if not board.place_stone(x, y, opponent):
                 return
 
-            if self.stop_flag:
+            if ctx.stopped:
                 return
 
             # Search for our best response
@@ -108,11 +115,11 @@ class PonderManager:
             original_depth = self.ai.max_depth
             self.ai.max_depth = constants.PONDER_MAX_DEPTH
 
-            best_move = self.ai.get_best_move(board, player)
+            best_move = self.ai.get_best_move(board, player, ctx)
 
             self.ai.max_depth = original_depth
 
-            if self.stop_flag:
+            if ctx.stopped:
                 return
 
             # Store result
@@ -148,15 +155,16 @@ class PonderManager:
         with self.lock:
             self.pondering = False
 
-        # Signal AI to stop search
-        if hasattr(self.ai, 'stop_search'):
-            self.ai.stop_search = True
+        # Cancel only the ponder searches, never the turn's own search
+        for ctx in self.contexts:
+            ctx.cancel()
 
         # Wait briefly for threads to finish
         for thread in self.threads:
             thread.join(timeout=0.05)
 
         self.threads = []
+        self.contexts = []
 
     def is_pondering(self) -> bool:
         """Check if currently pondering."""
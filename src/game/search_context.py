@@ -0,0 +1,141 @@
+##
+## EPITECH PROJECT, 2025
+## Gomoku
+## File description:
+## Search context - per-search cancellation, counters and search stack
+##
+
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from . import constants
+
+
+class StopToken:
+    """
+    Cooperative cancellation flag for one search.
+
+    Tokens form a tree: cancelling a token cancels every token forked from
+    it, so stopping a turn also stops its TT warming and VCT sub-searches.
+    Searches only read the plain `cancelled` attribute.
+    """
+
+    __slots__ = ("cancelled", "_children")
+
+    def __init__(self, parent: Optional["StopToken"] = None):
+        self.cancelled = False
+        self._children: List["StopToken"] = []
+        if parent is not None:
+            parent._children.append(self)
+            self.cancelled = parent.cancelled
+
+    def cancel(self) -> None:
+        """Cancel this token and all tokens forked from it."""
+        self.cancelled = True
+        for child in self._children:
+            child.cancel()
+
+
+class SearchFrame:
+    """
+    Scratch state of one ply, allocated once with its SearchContext.
+
+    Nodes at the same ply of a search are never active at the same time,
+    so the frame is reused by every node of that ply across iterations.
+    """
+
+    __slots__ = ("moves", "killers", "forced", "static_eval", "move", "four", "nodes")
+
+    def __init__(self):
+        self.moves: List[int] = []  # Quiet-move buffer of the staged picker
+        self.killers: List[Optional[int]] = [None, None]
+        self.forced = False  # Current node only searches its relevance zone
+        self.static_eval: Optional[int] = None  # Static eval of the current node
+        self.move: Optional[int] = None  # Move being searched from this ply
+        self.four = False  # That move makes a four (the reply is a forced block)
+        self.nodes = 0
+
+
+class SearchContext:
+    """
+    State owned by a single search.
+
+    Passed down negamax, quiescence_search and _vct_search so the main
+    search, time-bank warming and pondering can run concurrently on the
+    shared tables (TT, history, threat cache) without stopping each other
+    or mixing their killer moves.
+    """
+
+    __slots__ = (
+        "stop",
+        "nodes",
+        "pruned",
+        "extensions",
+        "extension_nodes",
+        "stack",
+        "deadline",
+        "vetoed",
+    )
+
+    def __init__(
+        self, deadline: Optional[float] = None, stop: Optional[StopToken] = None
+    ):
+        self.stop = stop if stop is not None else StopToken()
+        self.nodes = 0
+        # Moves cut by each forward-pruning technique
+        self.pruned: Dict[str, int] = {"futility": 0, "lmp": 0, "probcut": 0}
+        # Moves searched one ply deeper, and nodes searched below them
+        self.extensions = 0
+        self.extension_nodes = 0
+        # One frame per ply: negamax plies, then quiescence plies
+        self.stack: List[SearchFrame] = [
+            SearchFrame() for _ in range(constants.MAX_PLY + 1)
+        ]
+        self.deadline = deadline  # Absolute time.time(), None = no deadline
+        # Root moves refuted by the opponent's solver, shared with forks
+        self.vetoed: Set[Tuple[int, int]] = set()
+
+    @property
+    def stopped(self) -> bool:
+        """True once cancelled or past the deadline."""
+        if self.stop.cancelled:
+            return True
+        if self.deadline is not None and time.time() >= self.deadline:
+            self.stop.cancel()
+            return True
+        return False
+
+    def cancel(self) -> None:
+        """Cancel this search (and every search forked from it)."""
+        self.stop.cancel()
+
+    def merge(self, child: "SearchContext") -> None:
+        """Add a finished sub-search's counters to this context."""
+        self.nodes += child.nodes
+        self.extensions += child.extensions
+        self.extension_nodes += child.extension_nodes
+        for technique, count in child.pruned.items():
+            self.pruned[technique] += count
+
+    def ply_nodes(self) -> List[int]:
+        """Nodes searched at each ply, up to the deepest ply reached."""
+        counts = [frame.nodes for frame in self.stack]
+        while counts and counts[-1] == 0:
+            counts.pop()
+        return counts
+
+    def fork(self, deadline: Optional[float] = None) -> "SearchContext":
+        """
+        Create a sub-search context.
+
+        The child has its own counters and stack and an optional tighter
+        deadline; cancelling this context cancels the child too. Vetoed
+        root moves are shared.
+        """
+        if deadline is None:
+            deadline = self.deadline
+        elif self.deadline is not None:
+            deadline = min(deadline, self.deadline)
+        child = SearchContext(deadline=deadline, stop=StopToken(self.stop))
+        child.vetoed = self.vetoed
+        return child
@@ -0,0 +1,181 @@
+##
+## EPITECH PROJECT, 2025
+## Gomoku
+## File description:
+## Threat tables for threat-space search: gain, cost and rest squares by line code
+##
+
+from typing import Dict, List, Optional, Tuple
+
+from . import constants
+
+# kind, cost offsets, rest offsets of the threat a line code makes
+_LineThreat = Tuple[int, Tuple[int, ...], Tuple[int, ...]]
+
+# (line code, player) -> _LineThreat, or None (memo)
+_line_threats: Dict[Tuple[int, int], Optional[_LineThreat]] = {}
+
+
+class Threat:
+    """
+    A threat made by playing its gain square, in one direction.
+
+    In threat-space search terms: the attacker plays the gain square; the
+    defender must answer on one of the cost squares; the rest squares are
+    the other empty squares the threat needs. Squares are encoded cells.
+    """
+
+    __slots__ = ("kind", "gain", "costs", "rests", "direction")
+
+    def __init__(
+        self,
+        kind: int,
+        gain: int,
+        costs: Tuple[int, ...],
+        rests: Tuple[int, ...],
+        direction: int,
+    ):
+        self.kind = kind  # constants.THREAT_*
+        self.gain = gain
+        self.costs = costs
+        self.rests = rests
+        self.direction = direction
+
+    def __repr__(self) -> str:
+        return (
+            f"Threat(kind={self.kind}, gain={self.gain}, costs={self.costs}, "
+            f"rests={self.rests}, direction={self.direction})"
+        )
+
+
+def _run_through_centre(line: List[int], player: int) -> int:
+    """Length of player's run through the centre of line."""
+    centre = len(line) // 2
+    run = 1
+    for step in (1, -1):
+        i = centre + step
+        while 0 <= i < len(line) and line[i] == player:
+            run += 1
+            i += step
+    return run
+
+
+def _completions(line: List[int], player: int) -> List[int]:
+    """Empty squares of line where player completes five through the centre."""
+    squares = []
+    for i, cell in enumerate(line):
+        if cell == 0:
+            line[i] = player
+            if _run_through_centre(line, player) >= constants.WIN_LENGTH:
+                squares.append(i)
+            line[i] = 0
+    return squares
+
+
+def _straight_four_gains(line: List[int], player: int) -> List[int]:
+    """Empty squares of line where player makes a four with two completions."""
+    gains = []
+    for i, cell in enumerate(line):
+        if cell == 0:
+            line[i] = player
+            if len(_completions(line, player)) >= 2:
+                gains.append(i)
+            line[i] = 0
+    return gains
+
+
+def line_threat(code: int, player: int) -> Optional[_LineThreat]:
+    """
+    Threat made by player on the centre of a line code (see Board).
+
+    The line is the centre cell, holding player's new stone, and the
+    WIN_LENGTH - 1 cells on each side. Squares are offsets from the centre.
+
+    Returns:
+        (kind, cost offsets, rest offsets), or None when the stone makes
+        no threat on this line.
+    """
+    key = (code, player)
+    if key in _line_threats:
+        return _line_threats[key]
+
+    reach = constants.WIN_LENGTH - 1
+    digits = [(code >> (2 * j)) & 3 for j in range(2 * reach)]
+    line = digits[:reach] + [player] + digits[reach:]
+    defender = 3 - player
+    empties = [i for i, cell in enumerate(line) if cell == 0]
+    threat = None
+
+    if _run_through_centre(line, player) >= constants.WIN_LENGTH:
+        threat = (constants.THREAT_FIVE, [], [])
+    else:
+        completions = _completions(line, player)
+        if len(completions) >= 2:
+            threat = (constants.THREAT_STRAIGHT_FOUR, completions, [])
+        elif completions:
+            threat = (constants.THREAT_FOUR, completions, [])
+        else:
+            gains = _straight_four_gains(line, player)
+            if gains:
+                # Costs: defences leaving no straight four; rests: the
+                # other squares of the straight fours (e.g. far ends)
+                costs = []
+                for i in empties:
+                    line[i] = defender
+                    if not _straight_four_gains(line, player):
+                        costs.append(i)
+                    line[i] = 0
+                needed = set(gains)
+                for gain in gains:
+                    line[gain] = player
+                    needed.update(_completions(line, player))
+                    line[gain] = 0
+                rests = sorted(needed - set(costs))
+                threat = (constants.THREAT_THREE, costs, rests)
+
+    if threat is not None:
+        kind, costs, rests = threat
+        threat = (
+            kind,
+            tuple(i - reach for i in costs),
+            tuple(i - reach for i in rests),
+        )
+    _line_threats[key] = threat
+    return threat
+
+
+def threats_at(board, move: int, player: int) -> List[Threat]:
+    """
+    Threats player makes by playing the empty encoded cell move, one per line.
+
+    Read them before placing the stone: the line codes of occupied cells
+    are not kept up to date.
+    """
+    found = []
+    width = board.width
+    for direction, (dx, dy) in enumerate(constants.DIRECTIONS):
+        threat = line_threat(board.line_code(move, direction), player)
+        if threat is None:
+            continue
+        kind, costs, rests = threat
+        step = dy * width + dx
+        found.append(
+            Threat(
+                kind,
+                move,
+                tuple(move + offset * step for offset in costs),
+                tuple(move + offset * step for offset in rests),
+                direction,
+            )
+        )
+    return found
+
+
+def best_kind(board, move: int, player: int) -> int:
+    """Strongest threat kind player makes on move, 0 if none."""
+    best = 0
+    for direction in range(len(constants.DIRECTIONS)):
+        threat = line_threat(board.line_code(move, direction), player)
+        if threat is not None and threat[0] > best:
+            best = threat[0]
+    return best
@@ -0,0 +1,115 @@
+##
+## EPITECH PROJECT, 2025
+## Gomoku
+## File description:
+## Time manager - stability-based stop/extend for iterative deepening
+##
+
+from typing import Optional, Tuple
+
+from . import constants
+
+
+class IterationTimer:
+    """
+    Decide how long iterative deepening may keep going.
+
+    Every completed iteration is recorded with its best move and score.
+    While the root is unstable (best move just changed, or the score swung
+    by more than STABILITY_SCORE_MARGIN) or still too shallow to judge, the
+    search may run up to the hard limit. A settled root stops at the soft
+    budget, and once the best move has survived several iterations the limit
+    drops further, so easy turns return early and bank the time for the
+    turns that need it.
+
+    All times are seconds elapsed since the start of the turn.
+    """
+
+    def __init__(self, search_start: float, hard_limit: float):
+        self.search_start = search_start
+        self.hard_limit = hard_limit
+        budget = max(0.0, hard_limit - search_start)
+        self.soft_limit = search_start + budget * constants.TIME_SOFT_FRACTION
+        self.depth = 0
+        self.best_move: Optional[Tuple[int, int]] = None
+        self.best_value = 0
+        self.stable_iterations = 0
+        self.move_changes = 0
+        self.last_swing = 0
+        self.unstable = False
+        self.last_iteration_time = 0.0
+        self.last_finish = search_start
+        self.stop_reason = "deadline"
+
+    def record(
+        self, depth: int, move: Optional[Tuple[int, int]], value: int, elapsed: float
+    ) -> None:
+        """Record the result of a fully completed iteration."""
+        if move is None:
+            return
+
+        if self.best_move is None:
+            changed = False
+            swing = 0
+        else:
+            changed = move != self.best_move
+            swing = abs(value - self.best_value)
+
+        if changed:
+            self.move_changes += 1
+            self.stable_iterations = 0
+        else:
+            self.stable_iterations += 1
+
+        self.unstable = changed or swing > constants.STABILITY_SCORE_MARGIN
+        self.last_swing = swing
+        self.depth = depth
+        self.best_move = move
+        self.best_value = value
+        self.last_iteration_time = elapsed - self.last_finish
+        self.last_finish = elapsed
+
+    def time_limit(self) -> float:
+        """Return the elapsed-time limit the search may currently use."""
+        if self.depth < constants.STABILITY_MIN_DEPTH or self.unstable:
+            # Too shallow to judge, or the root changed its mind:
+            # extend into the banked time
+            return self.hard_limit
+
+        if self.stable_iterations >= constants.STABILITY_ITERATIONS:
+            budget = self.soft_limit - self.search_start
+            return self.search_start + budget * constants.TIME_STABLE_FRACTION
+
+        return self.soft_limit
+
+    def should_stop(self, elapsed: float) -> bool:
+        """Check if the search should stop now."""
+        if elapsed >= self.hard_limit:
+            self.stop_reason = "deadline"
+            return True
+
+        limit = self.time_limit()
+        if elapsed >= limit:
+            self.stop_reason = "stable"
+            return True
+
+        # A stable root won't change in an iteration we cannot finish
+        if (
+            not self.unstable
+            and self.depth >= constants.STABILITY_MIN_DEPTH
+            and elapsed + self.last_iteration_time * constants.TIME_ITERATION_GROWTH
+            > limit
+        ):
+            self.stop_reason = "stable"
+            return True
+
+        return False
+
+    def stats(self) -> dict:
+        """Per-turn stability stats for logging."""
+        return {
+            "changes": self.move_changes,
+            "stable": self.stable_iterations,
+            "swing": self.last_swing,
+            "stop": self.stop_reason,
+        }
@@ -0,0 +1,264 @@
+##
+## EPITECH PROJECT, 2025
+## Gomoku
+## File description:
+## Process pool spreading the root threat moves of threat-space search
+##
+
+import multiprocessing
+import threading
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    BrokenExecutor,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from typing import Iterable, List, Optional, Set, Tuple
+
+from utils.logger import get_logger
+
+from . import constants
+from .search_context import SearchContext, StopToken
+
+# Worker process state, set up by _init_worker
+_cancelled = None  # Shared: last search generation the parent cancelled
+_worker_ai = None  # Own MinMaxAI (threat and heuristic caches) per worker
+
+
+class _PoolStopToken(StopToken):
+    """
+    StopToken of a worker task.
+
+    It is also cancelled from the parent process once the task's search
+    generation is cancelled there.
+    """
+
+    __slots__ = ("_local", "_generation")
+
+    def __init__(self, generation: int):
+        self._local = False
+        self._generation = generation
+        super().__init__()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._local or _cancelled.value >= self._generation
+
+    @cancelled.setter
+    def cancelled(self, value: bool) -> None:
+        self._local = value
+
+
+def _init_worker(cancelled) -> None:
+    """Worker initializer: keep the shared cancellation counter."""
+    global _cancelled
+    _cancelled = cancelled
+
+
+def _setup_task(
+    stones: List[Tuple[int, int, int]],
+    width: int,
+    height: int,
+    deadline: float,
+    generation: int,
+):
+    """Worker's MinMaxAI, the rebuilt board and the task's search context."""
+    from .board import Board
+
+    board = Board(width, height)
+    for x, y, stone in stones:
+        board.place_stone(x, y, stone)
+    ctx = SearchContext(deadline=deadline, stop=_PoolStopToken(generation))
+    return _warm_worker(), board, ctx
+
+
+def _warm_worker():
+    """Worker task: the worker's MinMaxAI, built (and its modules imported) once."""
+    global _worker_ai
+    from .ai import MinMaxAI
+
+    if _worker_ai is None:
+        _worker_ai = MinMaxAI()
+        _worker_ai.vct_pool = None  # Workers never spawn workers
+    return _worker_ai
+
+
+def prove_move(
+    stones: List[Tuple[int, int, int]],
+    width: int,
+    height: int,
+    player: int,
+    move: Tuple[int, int],
+    max_depth: int,
+    deadline: float,
+    generation: int,
+) -> bool:
+    """Worker task: whether the root threat move wins by continuous threats."""
+    ai, board, ctx = _setup_task(stones, width, height, deadline, generation)
+    return ai._prove_root_threats(board, player, [move], max_depth, ctx) is not None
+
+
+def refute_move(
+    stones: List[Tuple[int, int, int]],
+    width: int,
+    height: int,
+    player: int,
+    move: Tuple[int, int],
+    max_depth: int,
+    deadline: float,
+    generation: int,
+) -> Optional[Tuple[int, int]]:
+    """Worker task: the opponent's winning reply to player's move, if any."""
+    ai, board, ctx = _setup_task(stones, width, height, deadline, generation)
+    return ai._refute(board, player, move, max_depth, ctx)
+
+
+class VCTPool:
+    """
+    Worker processes proving root threat moves in parallel.
+
+    Each root move of a threat-space search is one task (prove_move); the
+    first proven win cancels the others. The portfolio search also asks
+    them for the opponent's refutations of our root moves (refute_move).
+    Workers are spawned by start (at START), or else on first use, and
+    keep their own board copies and caches. Only one search uses the pool
+    at a time: callers take `lock` (non-blocking) and search in-process
+    when it is held.
+    """
+
+    def __init__(self, workers: int = constants.VCT_WORKERS):
+        self.workers = workers
+        self.lock = threading.Lock()
+        self.broken = False  # Set when the pool failed; callers stop using it
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._cancelled = None
+        self._generation = 0
+        self._futures: Set[Future] = set()  # Outstanding tasks, for close
+
+    def _track(self, future: Future) -> Future:
+        """Remember future until it completes, so close can cancel it."""
+        self._futures.add(future)
+        future.add_done_callback(self._futures.discard)
+        return future
+
+    def _start(self) -> ProcessPoolExecutor:
+        """Spawn the executor (spawn context: safe beside our threads)."""
+        if self._executor is None:
+            mp = multiprocessing.get_context("spawn")
+            self._cancelled = mp.RawValue("i", 0)
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=mp,
+                initializer=_init_worker,
+                initargs=(self._cancelled,),
+            )
+        return self._executor
+
+    def start(self) -> None:
+        """
+        Spawn the workers and build their MinMaxAI ahead of the first search.
+
+        Process start-up and imports then happen at START, not in a timed turn.
+        """
+        try:
+            executor = self._start()
+            for _ in range(self.workers):
+                self._track(executor.submit(_warm_worker))
+        except Exception as e:
+            self.fail(e)
+
+    def begin(self) -> int:
+        """Start the workers if needed; generation of a new search."""
+        self._start()
+        self._generation += 1
+        return self._generation
+
+    def submit(self, generation: int, task, board, *args) -> Future:
+        """Run task (prove_move, refute_move) on board in a worker."""
+        stones = [
+            (x, y, board.grid[y][x])
+            for y in range(board.height)
+            for x in range(board.width)
+            if board.grid[y][x]
+        ]
+        return self._track(
+            self._executor.submit(
+                task, stones, board.width, board.height, *args, generation
+            )
+        )
+
+    def cancel(self, generation: int, futures: Iterable[Future] = ()) -> None:
+        """Stop every task of generation (and older), running or queued."""
+        if self._cancelled is not None:
+            self._cancelled.value = max(self._cancelled.value, generation)
+        for future in futures:
+            future.cancel()
+
+    def search(
+        self,
+        board,
+        player: int,
+        moves: List[Tuple[int, int]],
+        max_depth: int,
+        ctx: SearchContext,
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Find the first root move of moves proven to win for player.
+
+        Among simultaneous proofs the best ranked move is returned; None
+        once refuted, out of time or stopped. ctx must carry the search
+        deadline.
+        """
+        rank = {}
+        generation = 0
+        try:
+            generation = self.begin()
+            for i, move in enumerate(moves):
+                future = self.submit(
+                    generation, prove_move, board, player, move, max_depth, ctx.deadline
+                )
+                rank[future] = i
+            pending = set(rank)
+            while pending and not ctx.stopped:
+                done, pending = wait(
+                    pending,
+                    timeout=constants.VCT_POOL_POLL,
+                    return_when=FIRST_COMPLETED,
+                )
+                proven = [f for f in done if self.result(f)]
+                if proven:
+                    return moves[min(rank[f] for f in proven)]
+            return None
+        except Exception as e:
+            self.fail(e)
+            return None
+        finally:
+            self.cancel(generation, rank)
+
+    def result(self, future: Future):
+        """
+        Return the result of a finished task, None if it raised.
+
+        A dead worker breaks the pool: its BrokenExecutor is raised.
+        """
+        error = future.exception()
+        if isinstance(error, BrokenExecutor):
+            raise error
+        return None if error is not None else future.result()
+
+    def fail(self, error: Exception) -> None:
+        """Mark the pool broken: no workers, or a dead one (e.g. memory limit)."""
+        get_logger().warn(f"VCT pool failed, searching in-process: {error}")
+        self.broken = True
+
+    def close(self) -> None:
+        """Cancel outstanding tasks and stop the workers."""
+        if self._executor is not None:
+            self._cancelled.value = self._generation
+            # shutdown(cancel_futures=) is Python 3.9+: cancel queued tasks
+            # ourselves (list(): done callbacks may shrink the set meanwhile)
+            for future in list(self._futures):
+                future.cancel()
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -7,12 +7,14 @@
 ## main
 ##
 
+import multiprocessing
 import sys
+import threading
 from typing import Optional
 
 import constants
 from communication import CommunicationManager
-from game import Board, MinMaxAI, PonderManager
+from game import Board, MinMaxAI, PonderManager, calibrate
 from game import constants as game_constants
 
 
@@ -23,14 +25,25 @@ class GameContext:
         self.ponder_manager: Optional[PonderManager] = None
         self.player_stone = 1
         self.opponent_stone = 2
+        # One committed move per turn, shared by the search and the watchdog
+        self._move_lock = threading.Lock()
+        self._move_pending = False
+        self._last_move = (0, 0)
 
     def initialize_board(self, width: int, height: int) -> None:
+        if self.ai is not None and self.ai.vct_pool is not None:
+            self.ai.vct_pool.close()  # A new game gets a new AI and pool
         self.board = Board(width, height)
         self.ai = MinMaxAI(
             max_depth=game_constants.MAX_DEPTH,
             time_limit=game_constants.TIME_LIMIT,
             use_iterative_deepening=True,
         )
+        if game_constants.CALIBRATION_ENABLED:
+            self.ai.calibration = calibrate(flush=sys.stdout.flush)
+        if self.ai.vct_pool is not None:
+            # Spawn the workers now rather than inside the first timed search
+            self.ai.vct_pool.start()
         if game_constants.PONDER_ENABLED:
             self.ponder_manager = PonderManager(self.ai)
 
@@ -71,11 +84,42 @@ class GameContext:
         if self.board is None or self.ai is None:
             return (0, 0)
 
-        move = self.ai.get_best_move(self.board, self.player_stone)
-        if move:
+        with self._move_lock:
+            self._move_pending = True
+            board = self.board.copy()
+
+        # Search a copy so a late search never touches the live board
+        move = self.ai.get_best_move(board, self.player_stone)
+        return self._commit_move(move)
+
+    def get_emergency_move(self) -> tuple[int, int]:
+        """Reply immediately with the best move known so far (watchdog)."""
+        if self.board is None or self.ai is None:
+            return (0, 0)
+
+        self.ai.stop()
+        move = None
+        with self._move_lock:
+            if self._move_pending:
+                move = self.ai.get_emergency_move(self.board)
+        return self._commit_move(move)
+
+    def _commit_move(self, move: Optional[tuple]) -> tuple[int, int]:
+        """Place our move once per turn; later commits return the first one."""
+        with self._move_lock:
+            if not self._move_pending:
+                return self._last_move
+            self._move_pending = False
+
+            if move is None or not self.board.is_valid_position(move[0], move[1]):
+                moves = self.board.get_valid_moves()
+                move = moves[0] if moves else None
+            if move is None:
+                return (0, 0)
+
             self.board.place_stone(move[0], move[1], self.player_stone)
-            return move
-        return (0, 0)
+            self._last_move = (move[0], move[1])
+            return self._last_move
 
     def process_board(self, moves: list) -> None:
         if self.board is None:
@@ -99,6 +143,8 @@ class GameContext:
 
 
 if __name__ == "__main__":
+    # VCT worker processes are spawned from the (possibly frozen) executable
+    multiprocessing.freeze_support()
     context = GameContext()
     manager = CommunicationManager(context)
     # PonderManager will be set after initialize_board is called
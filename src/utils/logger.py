@@ -92,13 +92,17 @@ class GameLogger:
         depth: int,
         nodes: int,
         time_s: float,
-        best_move: Optional[tuple]
+        best_move: Optional[tuple],
+        stats: Optional[dict] = None
     ):
-        """Log search stats."""
+        """Log search stats, followed by any extra per-turn stats as key=value."""
         move_str = f"({best_move[0]},{best_move[1]})" if best_move else "None"
+        extra = ""
+        if stats:
+            extra = " " + " ".join(f"{key}={value}" for key, value in stats.items())
         self._write(
             "SEARCH",
-            f"depth={depth} nodes={nodes} time={time_s:.2f}s best={move_str}"
+            f"depth={depth} nodes={nodes} time={time_s:.2f}s best={move_str}{extra}"
         )
 
     def board_scan(self, threats: dict):
@@ -0,0 +1,127 @@
+##
+## EPITECH PROJECT, 2025
+## Gomoku
+## File description:
+## Tests for the adaptive candidate radius of inner search nodes
+##
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from game.board import Board
+from game.ai import MinMaxAI
+from game.search_context import SearchContext
+from game import constants
+
+
+class TestCandidateCells:
+    """Board.get_candidate_cells: radius 1 plus promising distance-2 points."""
+
+    def setup_method(self):
+        self.board = Board(20, 20)
+
+    def _candidates(self):
+        return {self.board.decode(m) for m in self.board.get_candidate_cells()}
+
+    def test_lone_stone_is_radius_one(self):
+        """A single stone gives its eight neighbours only."""
+        self.board.place_stone(10, 10, 1)
+        assert self._candidates() == {
+            (10 + dx, 10 + dy)
+            for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy
+        }
+
+    def test_subset_of_valid_cells(self):
+        """Candidates are always valid moves."""
+        for x, y, p in [(10, 10, 1), (11, 11, 2), (10, 11, 1), (9, 9, 2),
+                        (12, 10, 1), (0, 0, 2)]:
+            self.board.place_stone(x, y, p)
+        cells = self.board.get_candidate_cells()
+        assert set(cells) <= set(self.board.get_valid_cells())
+        assert len(cells) == len(set(cells))
+
+    def test_line_with_potential(self):
+        """XX. followed by the point: a stone there makes the split three XX.X."""
+        self.board.place_stone(10, 10, 1)
+        self.board.place_stone(11, 10, 1)
+        candidates = self._candidates()
+        assert (13, 10) in candidates
+        assert (8, 10) in candidates
+
+    def test_line_without_potential(self):
+        """Distance-2 points off the lines of a pair are dropped."""
+        self.board.place_stone(10, 10, 1)
+        self.board.place_stone(11, 10, 1)
+        candidates = self._candidates()
+        assert (10, 12) not in candidates
+        assert (12, 12) not in candidates
+        assert (13, 11) not in candidates
+
+    def test_potential_of_each_player(self):
+        """Distance-2 points are judged with the colour of their stone."""
+        self.board.place_stone(5, 5, 2)
+        self.board.place_stone(6, 6, 2)
+        self.board.place_stone(12, 12, 1)
+        candidates = self._candidates()
+        assert (8, 8) in candidates
+        assert (3, 3) in candidates
+        assert (14, 14) not in candidates
+
+    def test_empty_board_center(self):
+        """The empty board still starts in the centre."""
+        assert self.board.get_candidate_cells() == [self.board.encode(10, 10)]
+
+    def test_potential_patterns_hold_three_stones(self):
+        """The three-stone prefilter of _has_potential is exact."""
+        for player in (1, 2):
+            for pattern in constants.POTENTIAL_PATTERNS[player]:
+                assert pattern.count(str(player)) >= 3
+
+
+class TestAdaptivePicker:
+    """negamax picks from the adaptive set, forcing checks from the full one."""
+
+    def setup_method(self):
+        self.board = Board(20, 20)
+        self.ai = MinMaxAI()
+        self.ctx = SearchContext()
+
+    def _picked(self, player=1):
+        picker = self.ai._staged_moves(self.board, player, 3, None, self.ctx)
+        return set(picker)
+
+    def test_quiet_moves_adaptive(self):
+        """A quiet position searches exactly the candidate cells."""
+        self.ai.adaptive_radius = True
+        for x, y, p in [(10, 10, 1), (11, 11, 2), (9, 11, 1)]:
+            self.board.place_stone(x, y, p)
+        assert self._picked() == set(self.board.get_candidate_cells())
+        assert len(self._picked()) < len(self.board.get_valid_cells())
+
+    def test_switch_off_full_radius(self):
+        """Without the adaptive radius every valid cell is searched."""
+        self.ai.adaptive_radius = False
+        for x, y, p in [(10, 10, 1), (11, 11, 2), (9, 11, 1)]:
+            self.board.place_stone(x, y, p)
+        assert self._picked() == set(self.board.get_valid_cells())
+
+    def test_forcing_zone_unchanged(self):
+        """Defences against an open three keep their distance-2 squares."""
+        for i in range(3):
+            self.board.place_stone(8 + i, 10, 2)
+        self.board.place_stone(9, 14, 1)
+        self.ai.adaptive_radius = True
+        adaptive = self._picked()
+        self.ai.adaptive_radius = False
+        assert adaptive == self._picked()
+        assert self.board.encode(6, 10) in adaptive
+
+    def test_root_keeps_full_radius(self):
+        """The root search still considers every valid move."""
+        for x, y, p in [(10, 10, 1), (11, 11, 2)]:
+            self.board.place_stone(x, y, p)
+        self.ai.adaptive_radius = True
+        move, _ = self.ai._search_at_depth(self.board, 1, 1, self.ctx)
+        assert move in self.board.get_valid_moves()
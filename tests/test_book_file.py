@@ -0,0 +1,118 @@
+##
+## EPITECH PROJECT, 2025
+## Gomoku
+## File description:
+## Tests for the generated, memory-mapped opening book file
+##
+
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from game.board import Board, symmetry_transforms
+from game.book_file import HEADER, RECORD, BookFile, write_book
+from game.book_gen import generate, opening_roots
+from game.opening_book import OpeningBook, canonical_key
+
+
+def make_board(stones, size=20):
+    board = Board(size, size)
+    for x, y, p in stones:
+        board.place_stone(x, y, p)
+    return board
+
+
+class TestBookFile:
+    """Sorted records probed by binary search."""
+
+    def test_round_trip(self, tmp_path):
+        """Every written entry is found; other keys are not."""
+        path = str(tmp_path / "book.bin")
+        entries = {k * 7919: (k % 400, -k * 1000, k % 9) for k in range(1, 300)}
+        write_book(path, 20, entries)
+        book = BookFile(path)
+        assert len(book) == len(entries)
+        assert book.board_size == 20
+        for key, value in entries.items():
+            assert book.probe(key) == value
+        assert book.probe(0) is None
+        assert book.probe(7919 * 300) is None
+        assert book.probe(7919 + 1) is None
+        book.close()
+
+    def test_compact_records(self, tmp_path):
+        """The file is the header and one fixed-size record per entry."""
+        path = str(tmp_path / "book.bin")
+        write_book(path, 15, {1: (2, 3, 4), 2**64 - 1: (5, 6, 7)})
+        assert os.path.getsize(path) == HEADER.size + 2 * RECORD.size
+        assert BookFile(path).probe(2**64 - 1) == (5, 6, 7)
+
+    def test_invalid_files(self, tmp_path):
+        """Foreign and truncated files are rejected."""
+        path = str(tmp_path / "book.bin")
+        with open(path, "wb") as f:
+            f.write(b"NOPE" + bytes(HEADER.size))
+        with pytest.raises(ValueError):
+            BookFile(path)
+        write_book(path, 20, {1: (2, 3, 4)})
+        with open(path, "r+b") as f:
+            f.truncate(HEADER.size + 3)
+        with pytest.raises(ValueError):
+            BookFile(path)
+
+
+class TestBookWithFile:
+    """OpeningBook falls back on the book file."""
+
+    def test_missing_file(self, tmp_path):
+        """Without a book file only the hand-written book is used."""
+        book = OpeningBook(20, path=str(tmp_path / "none.bin"))
+        assert book.file is None
+        assert book.lookup(Board(20, 20)) == (10, 10)
+
+    def test_file_probed_in_any_frame(self, tmp_path):
+        """A position of the file is answered in every symmetric frame."""
+        stones = [(4, 3, 2), (5, 5, 1), (6, 3, 2)]
+        board = make_board(stones)
+        key, t = canonical_key(board)
+        path = str(tmp_path / "book.bin")
+        write_book(path, 20, {key: (board.to_symmetry(board.encode(5, 3), t), 12, 6)})
+        book = OpeningBook(20, path=path)
+        assert book.file is not None
+        for transform in symmetry_transforms(19):
+            image = [transform(x, y) + (p,) for x, y, p in stones]
+            assert book.lookup(make_board(image)) == transform(5, 3)
+
+    def test_other_board_size_ignored(self, tmp_path):
+        """A book generated for another board size is not used."""
+        path = str(tmp_path / "book.bin")
+        write_book(path, 15, {})
+        assert OpeningBook(20, path=path).file is None
+
+    def test_hand_written_book_first(self, tmp_path):
+        """The file does not override the hand-written patterns."""
+        board = Board(20, 20)
+        path = str(tmp_path / "book.bin")
+        write_book(path, 20, {canonical_key(board)[0]: (0, 0, 1)})
+        assert OpeningBook(20, path=path).lookup(board) == (10, 10)
+
+
+class TestGenerator:
+    """Offline book generation."""
+
+    def test_generate_roots(self, tmp_path):
+        """Each root class gets one searched entry, answered by lookup."""
+        entries = generate(size=15, plies=1, replies=1, max_depth=1)
+        keys = {canonical_key(make_board(s, 15))[0] for s in opening_roots(15)}
+        assert set(entries) == keys
+        assert all(depth == 1 for _, _, depth in entries.values())
+
+        path = str(tmp_path / "book.bin")
+        write_book(path, 15, entries)
+        book = OpeningBook(15, path=path)
+        board = make_board([(5, 8, 2)], 15)
+        x, y = book.lookup(board)
+        assert board.grid[y][x] == 0
@@ -0,0 +1,132 @@
+##
+## EPITECH PROJECT, 2025
+## Gomoku
+## File description:
+## Tests for startup calibration
+##
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from game.board import Board
+from game.ai import MinMaxAI
+from game.calibration import Calibration, calibrate
+from game import constants
+
+
+class TestCalibrationDefaults:
+    """Uncalibrated values are the hand-tuned constants."""
+
+    def test_defaults_match_constants(self):
+        """A fresh Calibration keeps the hand-tuned margins."""
+        calibration = Calibration()
+        assert calibration.response_deadline == constants.RESPONSE_DEADLINE
+        assert calibration.search_margin == constants.SEARCH_SAFETY_MARGIN
+        assert calibration.bank_margin == constants.TIME_BANK_MARGIN
+        assert calibration.join_timeout == constants.THREAD_JOIN_TIMEOUT
+
+    def test_ai_starts_uncalibrated(self):
+        """MinMaxAI uses default margins until START calibrates it."""
+        ai = MinMaxAI()
+        assert ai.calibration.response_deadline == constants.RESPONSE_DEADLINE
+
+    def test_reference_rate_reproduces_constants(self):
+        """At the reference node rate and no latency, derive() is a no-op."""
+        calibration = Calibration()
+        calibration.derive()
+        assert abs(calibration.response_deadline - constants.RESPONSE_DEADLINE) < 1e-9
+        assert abs(calibration.search_margin - constants.SEARCH_SAFETY_MARGIN) < 1e-9
+
+
+class TestCalibrationDerive:
+    """Margins scale with host speed and measured latency."""
+
+    def test_slow_host_widens_margins(self):
+        """A slow host answers earlier and stops searching earlier."""
+        calibration = Calibration()
+        calibration.node_rate = constants.CALIBRATION_REFERENCE_RATE / 2
+        calibration.derive()
+        assert calibration.response_deadline < constants.RESPONSE_DEADLINE
+        assert calibration.search_margin > constants.SEARCH_SAFETY_MARGIN
+
+    def test_fast_host_uses_more_time(self):
+        """A fast host may use more of the turn."""
+        calibration = Calibration()
+        calibration.node_rate = constants.CALIBRATION_REFERENCE_RATE * 2
+        calibration.derive()
+        assert calibration.response_deadline > constants.RESPONSE_DEADLINE
+        assert calibration.response_deadline <= constants.CALIBRATION_MAX_DEADLINE
+
+    def test_latency_widens_margins(self):
+        """Join and flush latency are added to the safety margins."""
+        calibration = Calibration()
+        calibration.join_latency = 0.05
+        calibration.flush_latency = 0.05
+        calibration.derive()
+        assert calibration.response_deadline < constants.RESPONSE_DEADLINE
+        assert calibration.join_timeout > constants.THREAD_JOIN_TIMEOUT
+
+    def test_deadline_is_clamped(self):
+        """Even a pathological host keeps the deadline within bounds."""
+        calibration = Calibration()
+        calibration.node_rate = 1
+        calibration.join_latency = 1.0
+        calibration.derive()
+        assert calibration.response_deadline == constants.CALIBRATION_MIN_DEADLINE
+
+    def test_expected_depth_grows_with_rate(self):
+        """Faster hosts are expected to reach deeper."""
+        slow = Calibration()
+        slow.node_rate = 100
+        slow.derive()
+        fast = Calibration()
+        fast.node_rate = 100_000
+        fast.derive()
+        assert slow.expected_depth < fast.expected_depth
+        assert 1 <= slow.expected_depth <= constants.MAX_DEPTH
+
+    def test_warmup_depth_capped_by_expected_depth(self):
+        """Warming depth never exceeds what the host can finish."""
+        calibration = Calibration()
+        calibration.expected_depth = 3
+        assert calibration.warmup_depth(constants.TT_WARMUP_DEPTH) == 3
+        assert calibration.warmup_depth(2) == 2
+
+
+class TestCalibrate:
+    """End-to-end calibration at START."""
+
+    def test_calibrate_measures_host(self):
+        """calibrate() measures a positive node rate quickly."""
+        flushes = []
+        start = time.time()
+        calibration = calibrate(flush=lambda: flushes.append(1))
+        elapsed = time.time() - start
+
+        assert calibration.node_rate > 0
+        assert len(flushes) == constants.CALIBRATION_SAMPLES
+        assert elapsed < 1.0
+        assert (
+            constants.CALIBRATION_MIN_DEADLINE
+            <= calibration.response_deadline
+            <= constants.CALIBRATION_MAX_DEADLINE
+        )
+
+    def test_calibrated_deadline_is_used(self):
+        """Time banking honours the calibrated response deadline."""
+        board = Board(20, 20)
+        for i in range(4):
+            board.place_stone(10 + i, 10, 1)
+
+        ai = MinMaxAI()
+        ai.calibration.response_deadline = 1.0
+
+        start = time.time()
+        move = ai.get_best_move(board, 1)
+        elapsed = time.time() - start
+
+        assert move in [(9, 10), (14, 10)]
+        assert elapsed < 1.5
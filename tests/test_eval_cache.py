@@ -0,0 +1,67 @@
+##
+## EPITECH PROJECT, 2025
+## Gomoku
+## File description:
+## Tests for the shared position evaluation cache
+##
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from game.board import Board
+from game.ai import MinMaxAI, LRUTranspositionTable
+
+
+class TestPositionEvalCache:
+    """Static evaluations shared by hash across board copies."""
+
+    def setup_method(self):
+        self.board = Board(20, 20)
+        self.ai = MinMaxAI()
+        for x, y, p in [(10, 10, 1), (11, 10, 2), (10, 11, 1), (9, 9, 2)]:
+            self.board.place_stone(x, y, p)
+
+    def test_copy_hits_shared_cache(self):
+        """A board copy is answered from the cache, not re-evaluated."""
+        score = self.ai.evaluate(self.board)
+        copy = self.board.copy()
+        copy.eval_cache.clear()
+        copy.eval_totals = {1: 0, 2: 0}
+
+        assert self.ai.evaluate(copy) == score
+        assert self.ai.eval_hits == 1
+        assert copy.eval_cache == {}
+
+    def test_transposition_hits_cache(self):
+        """The same position reached in another move order is a hit."""
+        other = Board(20, 20)
+        for x, y, p in [(9, 9, 2), (10, 11, 1), (11, 10, 2), (10, 10, 1)]:
+            other.place_stone(x, y, p)
+        score = self.ai.evaluate(self.board)
+
+        assert self.ai.evaluate(other) == score
+        assert self.ai.eval_hits == 1
+
+    def test_cached_score_matches_fresh_evaluation(self):
+        """Cached scores equal what a fresh AI computes."""
+        self.ai.evaluate(self.board)
+        self.board.place_stone(12, 12, 1)
+        self.board.undo_stone(12, 12, 1)
+        assert self.ai.evaluate(self.board) == MinMaxAI().evaluate(self.board.copy())
+
+    def test_cache_is_bounded(self):
+        """The cache evicts beyond its maximum size."""
+        self.ai.position_evals = LRUTranspositionTable(max_size=2)
+        for x in range(3):
+            self.board.place_stone(x, 0, 1)
+            self.ai.evaluate(self.board)
+        assert len(self.ai.position_evals) == 2
+
+    def test_hit_rate_reset_each_turn(self):
+        """Hit counters are per turn."""
+        self.ai.eval_probes = self.ai.eval_hits = 10**9
+        self.ai.get_best_move(self.board, 1)
+        assert self.ai.eval_probes < 10**9
+        assert 0 <= self.ai.eval_hits <= self.ai.eval_probes
@@ -0,0 +1,127 @@
+##
+## EPITECH PROJECT, 2025
+## Gomoku
+## File description:
+## Tests for threat extensions (fours and forced blocks) in negamax
+##
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from game.board import Board
+from game.ai import MinMaxAI
+from game.search_context import SearchContext
+from game import constants
+
+
+class TestExtensionConfig:
+    """Budget and stack size."""
+
+    def test_stack_covers_extensions(self):
+        """MAX_PLY leaves room for every extension ply."""
+        assert constants.MAX_PLY == (
+            constants.MAX_DEPTH
+            + constants.EXTENSION_MAX_PLIES
+            + constants.QUIESCENCE_MAX_DEPTH
+        )
+        assert len(SearchContext().stack) == constants.MAX_PLY + 1
+
+    def test_switch_follows_constant(self):
+        """A new AI extends threats as configured."""
+        assert MinMaxAI().extend_threats == constants.EXTENSIONS_ENABLED
+
+    def test_counters_merged(self):
+        """A sub-search's extension counters are added to its parent."""
+        ctx = SearchContext()
+        child = ctx.fork()
+        child.extensions = 2
+        child.extension_nodes = 40
+        ctx.merge(child)
+        assert ctx.extensions == 2
+        assert ctx.extension_nodes == 40
+
+
+class TestFourExtension:
+    """Moves making a four are searched one ply deeper."""
+
+    def setup_method(self):
+        self.board = Board(20, 20)
+        self.ai = MinMaxAI()
+        self.ai.extend_threats = True
+        # Player 1 has a closed three: several squares make a four
+        for x, y, p in [(10, 10, 1), (11, 10, 1), (12, 10, 1), (9, 10, 2),
+                        (10, 12, 2), (14, 14, 2)]:
+            self.board.place_stone(x, y, p)
+
+    def _search(self, depth=1, extensions=0):
+        ctx = SearchContext()
+        self.ai.negamax(
+            self.board, depth, -constants.INFINITY, constants.INFINITY, 1,
+            ctx, 0, extensions
+        )
+        return ctx
+
+    def test_four_extended(self):
+        """A depth-1 search extends its four-making moves."""
+        ctx = self._search()
+        assert ctx.extensions > 0
+        assert ctx.extension_nodes > 0
+        assert len(ctx.ply_nodes()) > 1
+
+    def test_disabled(self):
+        """With extensions off, nothing is extended."""
+        self.ai.extend_threats = False
+        ctx = self._search()
+        assert ctx.extensions == 0
+        assert ctx.extension_nodes == 0
+
+    def test_budget_exhausted(self):
+        """A path that spent its budget is not extended further."""
+        ctx = self._search(extensions=constants.EXTENSION_MAX_PLIES)
+        assert ctx.extensions == 0
+
+    def test_ply_bounded(self):
+        """Extended paths stay within depth + budget + quiescence plies."""
+        depth = 2
+        ctx = self._search(depth=depth)
+        deepest = len(ctx.ply_nodes()) - 1
+        assert deepest <= (
+            depth + constants.EXTENSION_MAX_PLIES + constants.QUIESCENCE_MAX_DEPTH
+        )
+        assert deepest < constants.MAX_PLY
+
+
+class TestBlockExtension:
+    """Replies to the opponent's four are extended too."""
+
+    def setup_method(self):
+        self.board = Board(20, 20)
+        self.ai = MinMaxAI()
+        self.ai.extend_threats = True
+        for i in range(4):
+            self.board.place_stone(10 + i, 10, 2)
+        self.board.place_stone(9, 10, 1)
+        self.board.place_stone(11, 12, 1)
+
+    def test_forced_block_extended(self):
+        """Below a four, the blocking reply is extended."""
+        ctx = SearchContext()
+        ctx.stack[0].four = True
+        self.ai.negamax(
+            self.board, 1, -constants.INFINITY, constants.INFINITY, 1, ctx, 1
+        )
+        assert ctx.extensions >= 1
+
+    def test_no_block_without_four(self):
+        """Without a four above, a quiet reply is not extended."""
+        board = Board(20, 20)
+        board.place_stone(10, 10, 2)
+        board.place_stone(11, 11, 1)
+        ctx = SearchContext()
+        ctx.stack[0].four = False
+        self.ai.negamax(
+            board, 1, -constants.INFINITY, constants.INFINITY, 1, ctx, 1
+        )
+        assert ctx.extensions == 0
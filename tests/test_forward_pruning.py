@@ -0,0 +1,170 @@
+##
+## EPITECH PROJECT, 2025
+## Gomoku
+## File description:
+## Tests for forward pruning (futility, late move pruning, ProbCut) and the bench
+##
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from game.board import Board
+from game.ai import MinMaxAI
+from game.search_context import SearchContext
+from game import bench, constants
+
+NO_PRUNING = {"futility": False, "lmp": False, "probcut": False}
+
+
+class TestPruningConfig:
+    """Switches and margins."""
+
+    def test_constants_exist(self):
+        """Margins and move counts cover every depth they apply to."""
+        assert len(constants.FUTILITY_MARGINS) > constants.FUTILITY_MAX_DEPTH
+        assert len(constants.LMP_MOVE_COUNTS) > constants.LMP_MAX_DEPTH
+        assert constants.PROBCUT_MIN_DEPTH > constants.PROBCUT_REDUCTION
+
+    def test_switches_follow_constants(self):
+        """A new AI uses the configured techniques."""
+        ai = MinMaxAI()
+        assert ai.pruning == {
+            "futility": constants.FUTILITY_ENABLED,
+            "lmp": constants.LMP_ENABLED,
+            "probcut": constants.PROBCUT_ENABLED,
+        }
+
+    def test_fork_counts_merged(self):
+        """A sub-search's pruning counters are added to its parent."""
+        ctx = SearchContext()
+        child = ctx.fork()
+        child.nodes = 3
+        child.pruned["lmp"] = 2
+        ctx.merge(child)
+        assert ctx.nodes == 3
+        assert ctx.pruned["lmp"] == 2
+
+
+class TestFutilityAndLMP:
+    """Quiet moves cut in null-window frontier nodes."""
+
+    def setup_method(self):
+        self.board = Board(20, 20)
+        self.ai = MinMaxAI()
+        for x, y, p in [(10, 10, 1), (11, 11, 2), (10, 11, 1), (9, 9, 2)]:
+            self.board.place_stone(x, y, p)
+        self.static = self.ai.evaluate(self.board)
+
+    def _search(self, alpha, beta, depth=1):
+        ctx = SearchContext()
+        self.ai.negamax(self.board, depth, alpha, beta, 1, ctx)
+        return ctx
+
+    def test_futility_below_alpha(self):
+        """A hopeless null window prunes quiet moves at depth 1."""
+        alpha = self.static + constants.FUTILITY_MARGINS[1] + 1000
+        ctx = self._search(alpha, alpha + 1)
+        assert ctx.pruned["futility"] > 0
+
+    def test_late_moves_pruned(self):
+        """Past LMP_MOVE_COUNTS, quiet moves are not searched."""
+        self.ai.pruning = {"futility": False, "lmp": True, "probcut": False}
+        alpha = self.static + constants.SCORE_OPEN_FOUR  # Fail low: no cutoff
+        ctx = self._search(alpha, alpha + 1)
+        assert ctx.pruned["lmp"] > 0
+        assert ctx.pruned["futility"] == 0
+
+    def test_pv_nodes_not_pruned(self):
+        """A full-window node never prunes its moves."""
+        ctx = self._search(-constants.INFINITY, constants.INFINITY)
+        assert ctx.pruned == {"futility": 0, "lmp": 0, "probcut": 0}
+
+    def test_disabled(self):
+        """With every switch off, nothing is pruned."""
+        self.ai.pruning = dict(NO_PRUNING)
+        alpha = self.static + constants.FUTILITY_MARGINS[1] + 1000
+        ctx = self._search(alpha, alpha + 1)
+        assert ctx.pruned == {"futility": 0, "lmp": 0, "probcut": 0}
+
+    def test_forcing_position_not_pruned(self):
+        """Facing a four, the relevance zone is searched in full."""
+        for i in range(4):
+            self.board.place_stone(3 + i, 3, 2)
+        alpha = 10 * constants.SCORE_FIVE
+        ctx = self._search(alpha, alpha + 1)
+        assert ctx.pruned["futility"] == 0
+        assert ctx.pruned["lmp"] == 0
+
+
+class TestProbCut:
+    """Shallow tactical searches proving a fail high."""
+
+    def setup_method(self):
+        self.board = Board(20, 20)
+        self.ai = MinMaxAI()
+        for i in range(4):
+            self.board.place_stone(10 + i, 10, 1)
+        self.board.place_stone(9, 10, 2)
+        self.board.place_stone(11, 12, 2)
+
+    def test_winning_tactic_cuts(self):
+        """A winning tactical move beats any ordinary beta."""
+        ctx = SearchContext()
+        value = self.ai._probcut(self.board, constants.PROBCUT_MIN_DEPTH, 0, 1, ctx, 0)
+        assert value is not None
+        assert value >= constants.PROBCUT_MARGIN
+
+    def test_no_tactic_no_cut(self):
+        """Without tactical moves ProbCut proves nothing."""
+        board = Board(20, 20)
+        board.place_stone(10, 10, 1)
+        board.place_stone(12, 12, 2)
+        value = self.ai._probcut(board, constants.PROBCUT_MIN_DEPTH, 0, 1, SearchContext(), 0)
+        assert value is None
+
+
+class TestRootPVS:
+    """Null-window root search returns the full-window result."""
+
+    def test_same_best_value(self):
+        """PVS at the root keeps the exact best value."""
+        board = bench.load_position(bench.BENCH_POSITIONS[5][1])
+        ai = MinMaxAI()
+        ai.pruning = dict(NO_PRUNING)
+        move, value = ai._search_at_depth(board, 1, 2, SearchContext())
+
+        reference = MinMaxAI()
+        reference.pruning = dict(NO_PRUNING)
+        moves = [m for m, _ in reference._score_moves(board, board.get_valid_moves(), 1)[:12]]
+        values = []
+        for x, y in moves:
+            board.place_stone(x, y, 1)
+            values.append(-reference.negamax(
+                board, 1, -constants.INFINITY, constants.INFINITY, 2, SearchContext()
+            ))
+            board.undo_stone(x, y, 1)
+        assert value == max(values)
+
+
+class TestBench:
+    """Benchmark positions and runner."""
+
+    def test_positions_are_legal(self):
+        """Every bench position loads, with legal expected moves."""
+        for name, stones, player, solutions in bench.BENCH_POSITIONS:
+            board = bench.load_position(stones)
+            assert board.move_count == len(stones), name
+            for x, y in solutions or []:
+                assert board.is_valid_position(x, y), name
+
+    def test_run_bench_reports(self):
+        """run_bench reports depth, nodes and pruning counters per position."""
+        results = bench.run_bench(bench.VARIANTS["all"], time_limit=None, max_depth=1)
+        assert len(results) == len(bench.BENCH_POSITIONS)
+        for result in results:
+            assert result["depth"] == 1
+            assert result["nodes"] > 0
+            assert set(result["pruned"]) == {"futility", "lmp", "probcut"}
+        assert next(r for r in results if r["name"] == "win_in_one")["solved"]
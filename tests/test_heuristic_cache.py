@@ -0,0 +1,92 @@
+##
+## EPITECH PROJECT, 2025
+## Gomoku
+## File description:
+## Tests for the shared move heuristic cache and batch scoring
+##
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from game.board import Board
+from game.ai import MinMaxAI
+from game import constants
+
+
+class TestHeuristicCache:
+    """_move_heuristic results cached by (position, move, player)."""
+
+    def setup_method(self):
+        self.board = Board(20, 20)
+        self.ai = MinMaxAI()
+        for i in range(3):
+            self.board.place_stone(10 + i, 10, 2)
+        self.board.place_stone(10, 11, 1)
+        self.board.place_stone(11, 12, 1)
+        self.computed = []
+        original = self.ai._compute_move_heuristic
+
+        def counting(board, move, player):
+            self.computed.append((move, player))
+            return original(board, move, player)
+
+        self.ai._compute_move_heuristic = counting
+
+    def test_cached_matches_computed(self):
+        """A cached score equals a fresh computation."""
+        first = self.ai._move_heuristic(self.board, (13, 10), 1)
+        second = self.ai._move_heuristic(self.board, (13, 10), 1)
+        assert first == second == MinMaxAI()._move_heuristic(self.board, (13, 10), 1)
+        assert len(self.computed) == 1
+
+    def test_key_includes_player(self):
+        """The same square is scored separately for each player."""
+        self.ai._move_heuristic(self.board, (13, 10), 1)
+        self.ai._move_heuristic(self.board, (13, 10), 2)
+        assert len(self.computed) == 2
+
+    def test_new_position_is_a_miss(self):
+        """After a move, the position hash differs and the score is recomputed."""
+        self.ai._move_heuristic(self.board, (13, 10), 1)
+        self.board.place_stone(5, 5, 1)
+        self.ai._move_heuristic(self.board, (13, 10), 1)
+        assert len(self.computed) == 2
+
+    def test_shared_between_callers(self):
+        """Ponder prediction and immediate-move detection share scores."""
+        self.ai._get_top_opponent_moves(self.board, 1, count=5)
+        computed = len(self.computed)
+        self.ai._get_immediate_move(self.board, 1)
+        assert len(self.computed) == computed
+
+
+class TestScoreMoves:
+    """Batch scoring of all candidate moves of a position."""
+
+    def setup_method(self):
+        self.board = Board(20, 20)
+        self.ai = MinMaxAI()
+        for i in range(3):
+            self.board.place_stone(10 + i, 10, 2)
+        self.board.place_stone(10, 11, 1)
+
+    def test_best_first(self):
+        """Pairs come back sorted by decreasing score."""
+        scored = self.ai._score_moves(self.board, self.board.get_valid_moves(), 1)
+        scores = [score for _, score in scored]
+        assert scores == sorted(scores, reverse=True)
+        assert scored[0][1] >= constants.MOVE_BLOCK_OPEN_THREE
+
+    def test_matches_single_scores(self):
+        """Batch scores equal individual _move_heuristic calls."""
+        moves = self.board.get_valid_moves()
+        scored = dict(self.ai._score_moves(self.board, moves, 1))
+        fresh = MinMaxAI()
+        for move in moves:
+            assert scored[move] == fresh._move_heuristic(self.board, move, 1)
+
+    def test_empty_move_list(self):
+        """No candidates, no scores."""
+        assert self.ai._score_moves(self.board, [], 1) == []
@@ -12,9 +12,16 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from game.board import Board
 from game.ai import MinMaxAI
+from game.history import HistoryTable
+from game.search_context import SearchContext
 from game import constants
 
 
+def cell(x, y):
+    """Encoded move (x, y) on a 20x20 board."""
+    return y * 20 + x
+
+
 class TestHistoryConstants:
     """Tests for history heuristic constants."""
 
@@ -33,16 +40,16 @@ class TestHistoryTableInit:
     def test_history_table_initialized(self):
         """History table should be initialized for both players."""
         ai = MinMaxAI(time_limit=1.0)
-        assert 1 in ai.history_table
-        assert 2 in ai.history_table
-        assert isinstance(ai.history_table[1], dict)
-        assert isinstance(ai.history_table[2], dict)
+        assert isinstance(ai.history, HistoryTable)
+        cells = constants.MAX_BOARD_SIZE * constants.MAX_BOARD_SIZE
+        assert len(ai.history.raw[1]) == cells
+        assert len(ai.history.raw[2]) == cells
 
     def test_history_table_empty_initially(self):
         """History table should be empty at start."""
         ai = MinMaxAI(time_limit=1.0)
-        assert len(ai.history_table[1]) == 0
-        assert len(ai.history_table[2]) == 0
+        assert ai.history.entries(1) == 0
+        assert ai.history.entries(2) == 0
 
 
 class TestUpdateHistory:
@@ -53,51 +60,49 @@ class TestUpdateHistory:
 
     def test_update_history_adds_score(self):
         """_update_history should add score for moves."""
-        move = (10, 10)
+        move = cell(10, 10)
         self.ai._update_history(move, 1, depth=3)
-        assert move in self.ai.history_table[1]
-        assert self.ai.history_table[1][move] > 0
+        assert self.ai._get_history_score(move, 1) > 0
 
     def test_update_history_accumulates(self):
         """Multiple updates should accumulate scores."""
-        move = (10, 10)
+        move = cell(10, 10)
         self.ai._update_history(move, 1, depth=3)
-        first_score = self.ai.history_table[1][move]
+        first_score = self.ai._get_history_score(move, 1)
 
         self.ai._update_history(move, 1, depth=3)
-        second_score = self.ai.history_table[1][move]
+        second_score = self.ai._get_history_score(move, 1)
 
         assert second_score > first_score
 
     def test_update_history_depth_scaling(self):
         """Deeper cutoffs should give higher history bonus."""
-        move1 = (10, 10)
-        move2 = (11, 11)
+        move1 = cell(10, 10)
+        move2 = cell(11, 11)
 
         self.ai._update_history(move1, 1, depth=2)
         self.ai._update_history(move2, 1, depth=4)
 
         # Depth 4 cutoff should be worth more than depth 2
-        assert self.ai.history_table[1][move2] > self.ai.history_table[1][move1]
+        assert self.ai._get_history_score(move2, 1) > self.ai._get_history_score(move1, 1)
 
     def test_update_history_per_player(self):
         """History should be tracked separately per player."""
-        move = (10, 10)
+        move = cell(10, 10)
         self.ai._update_history(move, 1, depth=3)
         self.ai._update_history(move, 2, depth=5)
 
-        assert move in self.ai.history_table[1]
-        assert move in self.ai.history_table[2]
+        assert self.ai._get_history_score(move, 1) > 0
         # Player 2 used deeper depth, should have higher score
-        assert self.ai.history_table[2][move] > self.ai.history_table[1][move]
+        assert self.ai._get_history_score(move, 2) > self.ai._get_history_score(move, 1)
 
     def test_history_caps_at_max(self):
         """History scores should be capped."""
-        move = (10, 10)
+        move = cell(10, 10)
         for _ in range(1000):
             self.ai._update_history(move, 1, depth=10)
 
-        assert self.ai.history_table[1][move] <= constants.HISTORY_MAX_VALUE
+        assert self.ai._get_history_score(move, 1) <= constants.HISTORY_MAX_VALUE
 
 
 class TestDecayHistory:
@@ -108,46 +113,46 @@ class TestDecayHistory:
 
     def test_decay_history_reduces_scores(self):
         """_decay_history should reduce all scores."""
-        move = (10, 10)
+        move = cell(10, 10)
         self.ai._update_history(move, 1, depth=5)
-        original_score = self.ai.history_table[1][move]
+        original_score = self.ai._get_history_score(move, 1)
 
         self.ai._decay_history()
 
-        assert self.ai.history_table[1][move] < original_score
+        assert self.ai._get_history_score(move, 1) < original_score
 
     def test_decay_applies_factor(self):
         """Decay should apply the configured factor."""
-        move = (10, 10)
+        move = cell(10, 10)
         # Set a known score
-        self.ai.history_table[1][move] = 100
+        self.ai.history.set(move, 1, 100)
 
         self.ai._decay_history()
 
         expected = int(100 * constants.HISTORY_DECAY_FACTOR)
-        assert self.ai.history_table[1][move] == expected
+        assert self.ai._get_history_score(move, 1) == expected
 
-    def test_decay_removes_zero_entries(self):
-        """Decay should remove entries that reach 0."""
-        move = (10, 10)
-        self.ai.history_table[1][move] = 1
+    def test_decay_reaches_zero(self):
+        """Small scores decay to 0."""
+        move = cell(10, 10)
+        self.ai.history.set(move, 1, 1)
 
-        # Many decays should reduce to 0 and remove
         for _ in range(100):
             self.ai._decay_history()
 
-        assert move not in self.ai.history_table[1]
+        assert self.ai._get_history_score(move, 1) == 0
+        assert self.ai.history.entries(1) == 0
 
     def test_decay_affects_both_players(self):
         """Decay should affect both players' history."""
-        move = (10, 10)
-        self.ai.history_table[1][move] = 100
-        self.ai.history_table[2][move] = 100
+        move = cell(10, 10)
+        self.ai.history.set(move, 1, 100)
+        self.ai.history.set(move, 2, 100)
 
         self.ai._decay_history()
 
-        assert self.ai.history_table[1][move] < 100
-        assert self.ai.history_table[2][move] < 100
+        assert self.ai._get_history_score(move, 1) < 100
+        assert self.ai._get_history_score(move, 2) < 100
 
 
 class TestGetHistoryScore:
@@ -158,21 +163,21 @@ class TestGetHistoryScore:
 
     def test_get_history_score_default(self):
         """_get_history_score returns 0 for unknown moves."""
-        score = self.ai._get_history_score((5, 5), 1)
+        score = self.ai._get_history_score(cell(5, 5), 1)
         assert score == 0
 
     def test_get_history_score_returns_stored_value(self):
         """_get_history_score returns stored value."""
-        move = (10, 10)
+        move = cell(10, 10)
         self.ai._update_history(move, 1, depth=4)
-        expected = self.ai.history_table[1][move]
+        expected = self.ai.history.score(move, 1)
 
         score = self.ai._get_history_score(move, 1)
         assert score == expected
 
     def test_get_history_score_per_player(self):
         """_get_history_score is player-specific."""
-        move = (10, 10)
+        move = cell(10, 10)
         self.ai._update_history(move, 1, depth=3)
 
         score_p1 = self.ai._get_history_score(move, 1)
@@ -202,14 +207,12 @@ class TestHistoryIntegration:
         )
 
         # At least one move should have history now
-        total_history = sum(self.ai.history_table[1].values())
-        total_history += sum(self.ai.history_table[2].values())
-        assert total_history > 0
+        assert self.ai.history.entries(1) + self.ai.history.entries(2) > 0
 
     def test_decay_called_on_new_search(self):
         """Decay should be called at start of each get_best_move."""
-        move = (10, 10)
-        self.ai.history_table[1][move] = 100
+        move = cell(10, 10)
+        self.ai.history.set(move, 1, 100)
 
         self.board.place_stone(10, 10, 1)
 
@@ -217,7 +220,7 @@ class TestHistoryIntegration:
         self.ai.get_best_move(self.board, 2)
 
         # History should have decayed
-        assert self.ai.history_table[1][move] < 100
+        assert self.ai._get_history_score(move, 1) < 100
 
     def test_history_affects_move_ordering(self):
         """Moves with high history should be explored earlier."""
@@ -225,7 +228,7 @@ class TestHistoryIntegration:
         self.board.place_stone(9, 9, 2)
 
         # Give a specific move high history
-        high_history_move = (10, 11)
+        high_history_move = cell(10, 11)
         for _ in range(10):
             self.ai._update_history(high_history_move, 1, depth=5)
 
@@ -253,16 +256,16 @@ class TestHistoryIntegration:
         self.board.place_stone(10, 10, 1)
         self.ai.get_best_move(self.board, 2)
 
-        # Store current history
-        history_after_first = dict(self.ai.history_table[1])
-
         self.board.place_stone(9, 9, 2)
         self.ai.get_best_move(self.board, 1)
 
         # History should still exist (possibly decayed)
-        total_after = sum(self.ai.history_table[1].values())
+        total_after = sum(
+            self.ai._get_history_score(cell(x, y), 1)
+            for x in range(20) for y in range(20)
+        )
         # Can't guarantee relationship, just that it works
-        assert isinstance(total_after, (int, float))
+        assert isinstance(total_after, int)
 
 
 class TestHistoryPerformance:
@@ -298,5 +301,74 @@ class TestHistoryPerformance:
 
         # History table should have reasonable size
         # 20x20 board = 400 positions max per player
-        assert len(self.ai.history_table[1]) <= 400
-        assert len(self.ai.history_table[2]) <= 400
+        assert self.ai.history.entries(1) <= 400
+        assert self.ai.history.entries(2) <= 400
+
+
+class TestHistoryTable:
+    """Flat cell-indexed tables with epoch decay."""
+
+    def setup_method(self):
+        self.table = HistoryTable()
+
+    def test_sized_for_largest_board(self):
+        """Every encoded cell of a MAX_BOARD_SIZE board has a slot."""
+        last = Board(constants.MAX_BOARD_SIZE, constants.MAX_BOARD_SIZE).encode(
+            constants.MAX_BOARD_SIZE - 1, constants.MAX_BOARD_SIZE - 1
+        )
+        self.table.update(last, 1, 10)
+        assert self.table.score(last, 1) == 10
+
+    def test_decay_does_not_touch_entries(self):
+        """Decay only advances the epoch weight."""
+        self.table.set(cell(10, 10), 1, 100)
+        raw = list(self.table.raw[1])
+        self.table.decay()
+        assert self.table.raw[1] == raw
+        assert self.table.score(cell(10, 10), 1) == 90
+
+    def test_rescale_keeps_scores(self):
+        """Renormalising a large weight preserves the decayed scores."""
+        self.table.set(cell(10, 10), 1, constants.HISTORY_MAX_VALUE)
+        self.table.weight = constants.HISTORY_RESCALE_LIMIT
+        self.table.set(cell(10, 10), 1, constants.HISTORY_MAX_VALUE)
+        self.table.decay()
+        assert self.table.weight == 1.0
+        expected = round(constants.HISTORY_MAX_VALUE * constants.HISTORY_DECAY_FACTOR)
+        assert self.table.score(cell(10, 10), 1) == expected
+
+    def test_bonus_after_decay_outranks_old_score(self):
+        """A fresh bonus counts fully against decayed scores."""
+        self.table.update(cell(1, 1), 1, 100)
+        for _ in range(5):
+            self.table.decay()
+        self.table.update(cell(2, 2), 1, 80)
+        assert self.table.raw[1][cell(2, 2)] > self.table.raw[1][cell(1, 1)]
+
+    def test_countermoves_per_player(self):
+        """Countermoves are indexed by the previous move and the replying player."""
+        self.table.set_counter(1, cell(5, 5), cell(6, 6))
+        assert self.table.counter(1, cell(5, 5)) == cell(6, 6)
+        assert self.table.counter(2, cell(5, 5)) is None
+        assert self.table.counter(1, None) is None
+
+
+class TestCountermoves:
+    """Countermoves recorded by negamax on beta cutoffs."""
+
+    def test_cutoff_records_countermove(self):
+        """A cutoff below the root stores the reply to the previous move."""
+        board = Board(20, 20)
+        ai = MinMaxAI(time_limit=1.0)
+        board.place_stone(10, 10, 1)
+        board.place_stone(9, 9, 2)
+        board.place_stone(10, 11, 1)
+        ctx = SearchContext()
+        ai._search_at_depth(board, 2, 3, ctx)
+
+        recorded = [
+            move for player in (1, 2) for move in ai.history.countermoves[player]
+            if move is not None
+        ]
+        assert recorded
+        assert any(frame.killers != [None, None] for frame in ctx.stack)
@@ -15,6 +15,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 from communication import CommunicationManager
 from communication.protocol.commands import CommandType, Command
 from communication.protocol.responses import ResponseType
+from game import constants as game_constants
 
 
 class MockGameContext:
@@ -114,6 +115,19 @@ class TestCommunicationManager:
         assert responses[0].type == ResponseType.OK
         assert self.context.initialized
 
+    def test_process_command_start_unsupported_size(self):
+        # The move tables are sized for MAX_BOARD_SIZE: larger boards are refused
+        size = game_constants.MAX_BOARD_SIZE + 8
+        command = Command(CommandType.START, {"size": size})
+        responses = self.manager.process_command(command)
+        assert len(responses) == 1
+        assert responses[0].type == ResponseType.ERROR
+        assert not self.context.initialized
+
+        command = Command(CommandType.START, {"size": game_constants.MAX_BOARD_SIZE})
+        responses = self.manager.process_command(command)
+        assert responses[0].type == ResponseType.OK
+
     def test_process_command_start_no_context_method(self):
         # Create a context without the method to test error handling
         class MockContextNoInit:
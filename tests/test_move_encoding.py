@@ -0,0 +1,104 @@
+##
+## EPITECH PROJECT, 2025
+## Gomoku
+## File description:
+## Tests for integer move encoding on the board and in the search
+##
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from game.board import Board
+from game.ai import MinMaxAI
+from game import constants
+
+
+class TestBoardEncoding:
+    """Encoded cells (y * width + x) mirror the (x, y) API."""
+
+    def setup_method(self):
+        self.board = Board(20, 20)
+
+    def test_encode_decode_roundtrip(self):
+        """decode inverts encode on every cell."""
+        for y in range(20):
+            for x in range(20):
+                move = self.board.encode(x, y)
+                assert move == y * 20 + x
+                assert self.board.decode(move) == (x, y)
+
+    def test_cells_mirror_grid(self):
+        """The flat cell array follows place and undo."""
+        self.board.place_stone(3, 4, 2)
+        assert self.board.cells[self.board.encode(3, 4)] == 2
+        assert self.board.occupied == {self.board.encode(3, 4)}
+        self.board.undo_stone(3, 4, 2)
+        assert self.board.cells[self.board.encode(3, 4)] == 0
+        assert self.board.occupied == set()
+
+    def test_valid_cells_match_valid_moves(self):
+        """get_valid_cells is get_valid_moves, encoded."""
+        for x, y, p in [(0, 0, 1), (10, 10, 2), (19, 12, 1), (11, 11, 1)]:
+            self.board.place_stone(x, y, p)
+        cells = self.board.get_valid_cells()
+        assert sorted(self.board.decode(m) for m in cells) == sorted(
+            self.board.get_valid_moves()
+        )
+        assert len(cells) == len(set(cells))
+
+    def test_valid_cells_within_radius(self):
+        """Candidates are the empty cells within MOVE_RADIUS of a stone."""
+        self.board.place_stone(0, 0, 1)
+        expected = {
+            (x, y)
+            for x in range(constants.MOVE_RADIUS + 1)
+            for y in range(constants.MOVE_RADIUS + 1)
+        } - {(0, 0)}
+        assert set(self.board.get_valid_moves()) == expected
+
+    def test_empty_board_center(self):
+        """The only move on an empty board is the centre."""
+        assert self.board.get_valid_cells() == [self.board.encode(10, 10)]
+
+    def test_non_square_board(self):
+        """Encoding uses the board width."""
+        board = Board(15, 10)
+        board.place_stone(14, 9, 1)
+        assert board.encode(14, 9) == 149
+        assert board.decode(149) == (14, 9)
+        assert all(0 <= m < 150 for m in board.get_valid_cells())
+
+    def test_copy_is_independent(self):
+        """Copies do not share the cell array or occupied set."""
+        self.board.place_stone(5, 5, 1)
+        copy = self.board.copy()
+        copy.place_stone(6, 6, 2)
+        assert self.board.cells[self.board.encode(6, 6)] == 0
+        assert self.board.encode(6, 6) not in self.board.occupied
+
+
+class TestSearchEncoding:
+    """The search stores encoded moves, the public API returns tuples."""
+
+    def setup_method(self):
+        self.board = Board(20, 20)
+        self.ai = MinMaxAI()
+        for x, y, p in [(10, 10, 1), (11, 11, 2), (10, 11, 1), (9, 9, 2)]:
+            self.board.place_stone(x, y, p)
+
+    def test_tt_best_move_is_encoded(self):
+        """negamax stores an int best move in the TT."""
+        self.ai.negamax(
+            self.board, 2, -constants.INFINITY, constants.INFINITY, 1
+        )
+        entry = self.ai.transposition_table.get(self.board.current_hash)
+        assert isinstance(entry["best_move"], int)
+        assert self.board.cells[entry["best_move"]] == 0
+
+    def test_best_move_is_a_tuple(self):
+        """get_best_move still answers in (x, y)."""
+        move = self.ai.get_best_move(self.board, 1)
+        assert isinstance(move, tuple)
+        assert self.board.is_valid_position(*move)
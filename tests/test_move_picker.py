@@ -0,0 +1,177 @@
+##
+## EPITECH PROJECT, 2025
+## Gomoku
+## File description:
+## Tests for the staged move picker used by negamax
+##
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from game.board import Board
+from game.ai import MinMaxAI
+from game.search_context import SearchContext
+from game import constants
+
+
+class TestStagedMoves:
+    """Stage order and laziness of _staged_moves."""
+
+    def setup_method(self):
+        self.board = Board(20, 20)
+        self.ai = MinMaxAI()
+        self.ai.adaptive_radius = False  # Stage order over the full MOVE_RADIUS set
+        self.ctx = SearchContext()
+        self.board.place_stone(10, 10, 1)
+        self.board.place_stone(11, 11, 2)
+        self.board.place_stone(9, 11, 1)
+
+    def _picked(self, ply, tt_move=None):
+        if tt_move is not None:
+            tt_move = self.board.encode(*tt_move)
+        picker = self.ai._staged_moves(self.board, 1, ply, tt_move, self.ctx)
+        return [self.board.decode(move) for move in picker]
+
+    def test_yields_every_valid_move_once(self):
+        """The picker is a permutation of get_valid_moves."""
+        moves = self._picked(3)
+        assert len(moves) == len(set(moves))
+        assert set(moves) == set(self.board.get_valid_moves())
+
+    def test_tt_move_first(self):
+        """The TT move comes first; moves are generated once."""
+        calls = []
+        original = self.board.get_valid_cells
+        self.board.get_valid_cells = lambda: calls.append(1) or original()
+        tt_move = self.board.encode(12, 12)
+
+        picker = self.ai._staged_moves(self.board, 1, 3, tt_move, self.ctx)
+        assert next(picker) == tt_move
+
+        rest = list(picker)
+        assert tt_move not in rest
+        assert calls == [1]
+
+    def test_occupied_tt_move_skipped(self):
+        """A stale TT move on an occupied square is not yielded."""
+        assert (10, 10) not in self._picked(3, (10, 10))
+
+    def test_killers_before_quiet_moves(self):
+        """Legal killers follow the TT move, illegal ones are skipped."""
+        self.ctx.stack[3].killers = [self.board.encode(9, 9), self.board.encode(0, 0)]
+        self.ai.history.set(self.board.encode(8, 8), 1, 500)
+        moves = self._picked(3, (12, 12))
+        assert moves[:3] == [(12, 12), (9, 9), (8, 8)]
+        assert (0, 0) not in moves
+
+    def test_quiet_moves_by_history(self):
+        """Quiet moves follow the history table, best first."""
+        self.ai.history.set(self.board.encode(8, 8), 1, 500)
+        self.ai.history.set(self.board.encode(12, 10), 1, 100)
+        moves = self._picked(3)
+        assert moves[:2] == [(8, 8), (12, 10)]
+
+    def test_countermove_after_killers(self):
+        """The reply that refuted the previous move comes before quiet moves."""
+        encode = self.board.encode
+        self.ctx.stack[3].killers = [encode(9, 9), None]
+        self.ctx.stack[2].move = encode(11, 11)
+        self.ai.history.set_counter(1, encode(11, 11), encode(12, 12))
+        self.ai.history.set(encode(8, 8), 1, 500)
+        moves = self._picked(3)
+        assert moves[:3] == [(9, 9), (12, 12), (8, 8)]
+
+    def test_no_countermove_at_root_ply(self):
+        """Ply 0 has no previous move to answer."""
+        encode = self.board.encode
+        self.ai.history.set_counter(1, encode(11, 11), encode(12, 12))
+        self.ai.history.set(encode(8, 8), 1, 500)
+        moves = self._picked(0)
+        assert moves[0] == (8, 8)
+
+    def test_negamax_uses_picker(self):
+        """negamax still finds the winning move through the picker."""
+        for i in range(4):
+            self.board.place_stone(12 + i, 5, 1)
+        value = self.ai.negamax(
+            self.board, 2, -constants.INFINITY, constants.INFINITY, 1, self.ctx
+        )
+        assert value > 0
+
+
+class TestForcedReplies:
+    """Relevance-zone move generation in forcing positions."""
+
+    def setup_method(self):
+        self.board = Board(20, 20)
+        self.ai = MinMaxAI()
+        self.ctx = SearchContext()
+
+    def _picked(self, player):
+        picker = self.ai._staged_moves(self.board, player, 3, None, self.ctx)
+        return [self.board.decode(move) for move in picker]
+
+    def test_quiet_position_not_forced(self):
+        """Without fours or open threes every move is searched."""
+        self.board.place_stone(10, 10, 1)
+        self.board.place_stone(11, 11, 2)
+        moves = self.board.get_valid_cells()
+        assert self.ai._forced_replies(self.board, 1, moves) is None
+
+    def test_tt_move_outside_zone_skipped(self):
+        """In a forcing position, a TT move outside the zone is not searched."""
+        for i in range(4):
+            self.board.place_stone(5 + i, 5, 2)
+        self.board.place_stone(10, 10, 1)
+        encode = self.board.encode
+        picker = self.ai._staged_moves(self.board, 1, 3, encode(11, 11), self.ctx)
+        moves = [self.board.decode(move) for move in picker]
+        assert (11, 11) not in moves
+        assert set(moves) == {(4, 5), (9, 5)}
+        assert self.ctx.stack[3].forced
+
+    def test_tt_move_inside_zone_first(self):
+        """In a forcing position, a TT move of the zone still comes first."""
+        for i in range(4):
+            self.board.place_stone(5 + i, 5, 2)
+        self.board.place_stone(10, 10, 1)
+        encode = self.board.encode
+        picker = self.ai._staged_moves(self.board, 1, 3, encode(9, 5), self.ctx)
+        moves = [self.board.decode(move) for move in picker]
+        assert moves == [(9, 5), (4, 5)]
+
+    def test_own_win_only(self):
+        """With a win available, nothing else is searched."""
+        for i in range(4):
+            self.board.place_stone(5 + i, 5, 1)
+            self.board.place_stone(5 + i, 12, 2)
+        assert self._picked(1) in ([(4, 5)], [(9, 5)])
+
+    def test_block_four_only(self):
+        """Facing a four, only the blocking square is searched."""
+        for i in range(4):
+            self.board.place_stone(5 + i, 5, 2)
+        self.board.place_stone(4, 5, 1)
+        self.board.place_stone(10, 10, 1)
+        assert self._picked(1) == [(9, 5)]
+
+    def test_open_three_defences(self):
+        """Facing .XXX., the ends and far ends are the defences."""
+        for i in range(3):
+            self.board.place_stone(8 + i, 10, 2)
+        self.board.place_stone(9, 14, 1)
+        moves = set(self._picked(1))
+        assert moves == {(6, 10), (7, 10), (11, 10), (12, 10)}
+
+    def test_counter_four_kept(self):
+        """Our own four-making moves stay in the zone."""
+        for i in range(3):
+            self.board.place_stone(8 + i, 10, 2)
+            self.board.place_stone(8 + i, 14, 1)
+        self.board.place_stone(7, 14, 2)
+        moves = set(self._picked(1))
+        assert (11, 14) in moves
+        assert (12, 14) in moves
+        assert (9, 12) not in moves
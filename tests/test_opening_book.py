@@ -11,7 +11,7 @@ import time
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from game.board import Board
+from game.board import Board, symmetry_transforms
 from game.ai import MinMaxAI
 from game.opening_book import OpeningBook, get_opening_book
 from game import constants
@@ -235,16 +235,22 @@ class TestOpeningBookPatterns:
         self.board = Board(20, 20)
         self.book = OpeningBook(20)
 
+    def _key(self, stones):
+        """Canonical hash of a position, as the book keys it."""
+        board = Board(20, 20)
+        for x, y, p in stones:
+            board.place_stone(x, y, p)
+        return min(board.symmetric_hashes())
+
     def test_empty_board_pattern(self):
         """Empty board should map to center."""
-        state = frozenset()
-        assert state in self.book.book
-        assert self.book.book[state] == (10, 10)
+        key = self._key([])
+        assert key in self.book.book
+        assert self.book.lookup(self.board) == (10, 10)
 
     def test_opponent_center_pattern(self):
         """Opponent at center should have diagonal response."""
-        state = frozenset([(10, 10, 2)])
-        assert state in self.book.book
+        assert self._key([(10, 10, 2)]) in self.book.book
 
     def test_book_has_multiple_patterns(self):
         """Book should have patterns for various situations."""
@@ -253,13 +259,32 @@ class TestOpeningBookPatterns:
 
     def test_book_responses_are_valid(self):
         """All book responses should be valid board positions."""
-        for state, response in self.book.book.items():
-            x, y = response
-            assert 0 <= x < 20
-            assert 0 <= y < 20
-            # Response should not overlap with any stone in state
-            state_positions = {(sx, sy) for sx, sy, _ in state}
-            assert (x, y) not in state_positions
+        for key, response in self.book.book.items():
+            assert isinstance(key, int)
+            assert 0 <= response < 20 * 20
+
+    def test_symmetric_positions_share_entry(self):
+        """Symmetric images of a position are one entry, answered in their frame."""
+        stones = [(10, 10, 1), (11, 10, 2)]
+        keys = set()
+        for transform in symmetry_transforms(19):
+            board = Board(20, 20)
+            cells = {transform(x, y) for x, y, _ in stones}
+            # Stones land on distinct cells, and the response on none of them
+            assert len(cells) == len(stones)
+            for x, y, p in stones:
+                board.place_stone(*transform(x, y), p)
+            keys.add(self._key([transform(x, y) + (p,) for x, y, p in stones]))
+            move = self.book.lookup(board)
+            assert move == transform(9, 10)
+            assert move not in cells
+        assert len(keys) == 1
+        assert keys.pop() in self.book.book
+
+    def test_fewer_entries_than_variants(self):
+        """Variants that are board symmetries are stored once (15x15: all 8)."""
+        book = OpeningBook(15)
+        assert book.size() * 4 < 8 * 28
 
 
 class TestOpeningBookPerformance:
@@ -0,0 +1,92 @@
+##
+## EPITECH PROJECT, 2025
+## Gomoku
+## File description:
+## Tests for the single-pass multi-pattern threat scanner
+##
+
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from game.board import Board
+from game.ai import MinMaxAI
+from game.pattern_scanner import (
+    PatternScanner, get_scanner, scan_grid, threat_entries
+)
+
+
+def find_all(line, entries):
+    """Reference: every (start, index) found with one str.find loop per pattern."""
+    matches = set()
+    for index, (_, pattern, _) in enumerate(entries):
+        idx = line.find(pattern)
+        while idx != -1:
+            matches.add((idx, index))
+            idx = line.find(pattern, idx + 1)
+    return matches
+
+
+class TestPatternScanner:
+    """The automaton reports exactly the str.find matches."""
+
+    def test_overlapping_matches(self):
+        """Nested and overlapping patterns are all reported."""
+        scanner = get_scanner(1)
+        matches = scanner.scan("..111.1..")
+        names = {scanner.entries[i][1] for _, i in matches}
+        assert names == {"111.1", ".111.", "11.1"}
+        assert (1, 4) in matches  # .111. starts on the first empty square
+
+    def test_random_lines_match_find(self):
+        """Random lines: same matches as one find loop per pattern."""
+        rng = random.Random(11)
+        for player in (1, 2):
+            scanner = get_scanner(player)
+            for _ in range(300):
+                line = "".join(rng.choice(".12") for _ in range(rng.randint(0, 25)))
+                matches = scanner.scan(line)
+                assert len(matches) == len(set(matches))
+                assert set(matches) == find_all(line, scanner.entries)
+
+    def test_unknown_character_resets(self):
+        """A character outside the alphabet breaks a pattern."""
+        scanner = PatternScanner([("x", "11", ())])
+        assert scanner.scan("1#1") == []
+        assert scanner.scan("#11") == [(1, 0)]
+
+    def test_compiled_once(self):
+        """Each player's scanner is built once and reused."""
+        assert get_scanner(2) is get_scanner(2)
+        assert [e[1] for e in get_scanner(2).entries] == [
+            e[1] for e in threat_entries(2)
+        ]
+
+
+class TestScanGrid:
+    """Full-board scans on any grid."""
+
+    def test_board_scan_uses_grid(self):
+        """_scan_board_threats is scan_grid of the board."""
+        board = Board(20, 20)
+        for x, y, p in [(5, 5, 2), (6, 6, 2), (7, 7, 2), (10, 3, 2), (11, 3, 2)]:
+            board.place_stone(x, y, p)
+        threats = MinMaxAI()._scan_board_threats(board, 2)
+        assert threats == scan_grid(board.grid, 2)
+        assert threats["open_threes"][0]["blocks"] == [(4, 4), (8, 8)]
+        assert threats["open_threes"][0]["direction"] == "diagonal_\\"
+        assert threats["building_twos"][0]["extensions"] == [(9, 3), (12, 3)]
+
+    def test_plain_grid(self):
+        """A bare list of rows, e.g. the visualizer's board, can be scanned."""
+        grid = [[0] * 15 for _ in range(15)]
+        for x in (3, 4, 6, 7):
+            grid[14][x] = 1
+        threats = scan_grid(grid, 1)
+        assert [t["gap"] for t in threats["fours"]] == [(5, 14)]
+        assert threats["fours"][0]["pattern"] == "11.11"
+        assert scan_grid(grid, 2) == {
+            "fours": [], "open_threes": [], "split_threes": [], "building_twos": []
+        }
@@ -0,0 +1,157 @@
+##
+## EPITECH PROJECT, 2025
+## Gomoku
+## File description:
+## Tests for the portfolio search: full search racing the VCT solvers
+##
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from game.board import Board
+from game.ai import MinMaxAI
+from game.search_context import SearchContext
+from game import constants
+from game.vct_pool import VCTPool
+
+
+class TestRefute:
+    """_refute: the opponent's winning reply to one of our moves."""
+
+    def setup_method(self):
+        self.board = Board(20, 20)
+        self.ai = MinMaxAI()
+        # Opponent (2) has an open three
+        for x in (9, 10, 11):
+            self.board.place_stone(x, 10, 2)
+        self.board.place_stone(10, 12, 1)
+
+    def _refute(self, move):
+        ctx = SearchContext(deadline=time.time() + 5)
+        return self.ai._refute(self.board, 1, move, 6, ctx)
+
+    def test_ignoring_the_three_is_refuted(self):
+        """A move elsewhere lets the three become an open four."""
+        assert self._refute((3, 3)) in [(8, 10), (12, 10)]
+
+    def test_block_is_not_refuted(self):
+        """Blocking one end leaves no VCT."""
+        assert self._refute((8, 10)) is None
+        assert self.board.grid[10][8] == 0
+
+    def test_our_four_comes_first(self):
+        """A move making a four cannot be refuted before it is blocked."""
+        for y in (3, 4, 5):
+            self.board.place_stone(3, y, 1)
+        assert self._refute((3, 6)) is None
+
+
+class TestVetoedRootMoves:
+    """The root searches skip vetoed moves."""
+
+    def test_vetoed_move_skipped(self):
+        """A vetoed best move is replaced by another one."""
+        board = Board(20, 20)
+        for x in (9, 10, 11):
+            board.place_stone(x, 10, 2)
+        board.place_stone(10, 12, 1)
+        ai = MinMaxAI()
+        ctx = SearchContext()
+        best, _ = ai._search_at_depth(board, 1, 2, ctx)
+        ctx.vetoed.add(best)
+        other, _ = ai._search_at_depth(board, 1, 2, ctx)
+        assert other != best
+        assert other is not None
+
+    def test_vetoes_shared_with_forks(self):
+        """Sub-searches see the vetoes of their parent."""
+        ctx = SearchContext()
+        child = ctx.fork()
+        ctx.vetoed.add((1, 2))
+        assert (1, 2) in child.vetoed
+
+    def test_all_vetoed_searches_anyway(self):
+        """With every move vetoed the root still returns a move."""
+        board = Board(20, 20)
+        board.place_stone(10, 10, 2)
+        ai = MinMaxAI()
+        ctx = SearchContext()
+        ctx.vetoed.update(board.get_valid_moves())
+        move, _ = ai._search_at_depth(board, 1, 1, ctx)
+        assert move is not None
+
+
+class TestPortfolioSearch:
+    """The coordinator over the full search and the workers."""
+
+    @classmethod
+    def setup_class(cls):
+        cls.pool = VCTPool(workers=2)
+
+    @classmethod
+    def teardown_class(cls):
+        cls.pool.close()
+
+    def setup_method(self):
+        self.board = Board(20, 20)
+        self.ai = MinMaxAI()
+        self.ai.vct_pool = self.pool
+        self.ai.portfolio = True
+        self.ai.calibration.response_deadline = 1.5
+
+    def test_off_by_default(self):
+        """Portfolio mode is opt-in."""
+        assert constants.PORTFOLIO_ENABLED is False
+        assert MinMaxAI().portfolio is False
+
+    def test_proven_win_returned_early(self):
+        """A VCT proven by a worker ends the turn before the deadline."""
+        for x in (9, 10, 11):
+            self.board.place_stone(x, 10, 1)
+        self.board.place_stone(10, 12, 2)
+        self.board.place_stone(5, 5, 2)
+        start = time.time()
+        move = self.ai._portfolio_search(self.board, 1, start, SearchContext())
+        assert move in [(8, 10), (12, 10)]
+        assert time.time() - start < 1.0
+
+    def test_quiet_turn_uses_full_search(self):
+        """Without a win the full search's move is played."""
+        for x, y, p in [(10, 10, 1), (11, 11, 2), (9, 11, 1), (12, 9, 2),
+                        (5, 14, 1), (15, 4, 2)]:
+            self.board.place_stone(x, y, p)
+        calls = []
+        search = self.ai._portfolio_search
+        self.ai._portfolio_search = lambda *args: calls.append(1) or search(*args)
+        move = self.ai.get_best_move(self.board, 1)
+        assert calls == [1]
+        assert move in self.board.get_valid_moves()
+        assert move not in self.ai.ctx.vetoed
+        assert not self.pool.broken
+
+    def test_refuted_moves_vetoed(self):
+        """Moves ignoring the opponent's open three are vetoed."""
+        for x in (9, 10, 11):
+            self.board.place_stone(x, 10, 2)
+        self.board.place_stone(10, 12, 1)
+        ctx = SearchContext()
+        move = self.ai._portfolio_search(self.board, 1, time.time(), ctx)
+        assert ctx.vetoed
+        assert move not in ctx.vetoed
+        assert move in [(8, 10), (12, 10)]
+
+    def test_busy_pool_runs_full_search(self):
+        """While another search holds the pool, only the full search runs."""
+        for x in (9, 10, 11):
+            self.board.place_stone(x, 10, 2)
+        self.board.place_stone(10, 12, 1)
+        generation = self.pool._generation
+        ctx = SearchContext()
+        with self.pool.lock:
+            move = self.ai._portfolio_search(self.board, 1, time.time(), ctx)
+        assert self.pool._generation == generation
+        assert not ctx.vetoed
+        assert move in self.board.get_valid_moves()
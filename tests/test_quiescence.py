@@ -235,6 +235,82 @@ class TestNegamaxQuiescenceIntegration:
         assert qs_score > 0
 
 
+class TestQuiescenceTransposition:
+    """Tests for quiescence TT probing/storage and move list reuse."""
+
+    def setup_method(self):
+        self.board = Board(20, 20)
+        self.ai = MinMaxAI(time_limit=2.0)
+        for i in range(3):
+            self.board.place_stone(10, 10 + i, 1)
+        self.board.place_stone(9, 9, 2)
+        self.board.place_stone(11, 9, 2)
+
+    def _qs(self, **kwargs):
+        return self.ai.quiescence_search(
+            self.board, -constants.INFINITY, constants.INFINITY, 2, **kwargs
+        )
+
+    def test_quiescence_stores_negative_depth(self):
+        """QS entries carry a negative depth marker."""
+        self._qs()
+        entry = self.ai.transposition_table.get(self.board.current_hash)
+        assert entry is not None
+        assert entry["depth"] == -1
+
+    def test_quiescence_probe_hits(self):
+        """A repeated QS call is answered from the TT in one node."""
+        first = self._qs()
+        self.ai.nodes = 0
+        second = self._qs()
+        assert second == first
+        assert self.ai.nodes == 1
+
+    def test_main_search_ignores_quiescence_entries(self):
+        """negamax at depth >= 1 never returns a QS value from the TT."""
+        self._qs()
+        self.ai.nodes = 0
+        self.ai.negamax(
+            self.board, depth=1, alpha=-constants.INFINITY,
+            beta=constants.INFINITY, current_player=2
+        )
+        assert self.ai.nodes > 1
+
+    def test_quiescence_keeps_main_entry(self):
+        """QS never overwrites a deeper main-search entry of the same age."""
+        self.ai.negamax(
+            self.board, depth=2, alpha=-constants.INFINITY,
+            beta=constants.INFINITY, current_player=2
+        )
+        self._qs()
+        entry = self.ai.transposition_table.get(self.board.current_hash)
+        assert entry["depth"] == 2
+
+    def test_evaluation_path_independent(self):
+        """Place/undo sequences leave the incremental eval exact (TT soundness)."""
+        for x, y, p in [(10, 13, 2), (14, 10, 1), (13, 13, 2)]:
+            self.board.place_stone(x, y, p)
+            self.ai.evaluate(self.board)
+            self.board.undo_stone(x, y, p)
+        fresh = Board(20, 20)
+        for x, y in self.board.occupied_cells:
+            fresh.place_stone(x, y, self.board.grid[y][x])
+        assert self.ai.evaluate(self.board) == self.ai.evaluate(fresh)
+
+    def test_tactical_moves_reused(self):
+        """Tactical move lists are generated once per position and player."""
+        calls = []
+        original = self.ai._get_quiescence_moves
+        self.ai._get_quiescence_moves = lambda b, p: calls.append(p) or original(b, p)
+
+        self._qs()
+        generated = len(calls)
+        self.ai.transposition_table.clear()
+        self._qs()
+        assert generated > 0
+        assert len(calls) == generated
+
+
 class TestQuiescencePerformance:
     """Performance tests for quiescence search."""
 
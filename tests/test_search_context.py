@@ -0,0 +1,176 @@
+##
+## EPITECH PROJECT, 2025
+## Gomoku
+## File description:
+## Tests for per-search contexts and cooperative cancellation
+##
+
+import sys
+import os
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from game.board import Board
+from game.ai import MinMaxAI
+from game.ponder import PonderManager
+from game.search_context import SearchContext, SearchFrame, StopToken
+from game import constants
+
+
+class TestStopToken:
+    """Cancellation propagates from parent to forked tokens only."""
+
+    def test_cancel_propagates_to_children(self):
+        """Cancelling a parent cancels every descendant."""
+        parent = StopToken()
+        child = StopToken(parent)
+        grandchild = StopToken(child)
+        parent.cancel()
+        assert child.cancelled and grandchild.cancelled
+
+    def test_child_cancel_leaves_parent(self):
+        """Cancelling a sub-search does not stop its parent or siblings."""
+        parent = StopToken()
+        child = StopToken(parent)
+        sibling = StopToken(parent)
+        child.cancel()
+        assert not parent.cancelled
+        assert not sibling.cancelled
+
+    def test_fork_of_cancelled_is_cancelled(self):
+        """A token forked after cancellation starts cancelled."""
+        parent = StopToken()
+        parent.cancel()
+        assert StopToken(parent).cancelled
+
+
+class TestSearchContext:
+    """Deadlines, counters and forks."""
+
+    def test_deadline_stops(self):
+        """A context past its deadline reports stopped."""
+        ctx = SearchContext(deadline=time.time() - 1)
+        assert ctx.stopped
+        assert ctx.stop.cancelled
+
+    def test_fork_keeps_tighter_deadline(self):
+        """A fork never outlives its parent's deadline."""
+        ctx = SearchContext(deadline=time.time() + 1)
+        assert ctx.fork(deadline=time.time() + 10).deadline == ctx.deadline
+        assert ctx.fork().deadline == ctx.deadline
+
+    def test_fork_has_own_counters(self):
+        """Nodes and killers are not shared with the parent."""
+        ctx = SearchContext()
+        child = ctx.fork()
+        child.nodes = 5
+        child.stack[1].killers[0] = 42
+        assert ctx.nodes == 0
+        assert ctx.stack[1].killers == [None, None]
+
+
+class TestSearchStack:
+    """Preallocated per-ply frames."""
+
+    def setup_method(self):
+        self.board = Board(20, 20)
+        for x, y, p in [(10, 10, 1), (11, 11, 2), (10, 11, 1), (9, 9, 2)]:
+            self.board.place_stone(x, y, p)
+        self.ai = MinMaxAI()
+
+    def _search(self, ctx, depth=3):
+        return self.ai._search_at_depth(self.board, 1, depth, ctx)
+
+    def test_one_frame_per_ply(self):
+        """The stack covers negamax and quiescence plies."""
+        ctx = SearchContext()
+        assert len(ctx.stack) == constants.MAX_PLY + 1
+        assert all(isinstance(frame, SearchFrame) for frame in ctx.stack)
+
+    def test_frames_reused_across_iterations(self):
+        """Iterations reuse the same frames and move buffers."""
+        ctx = SearchContext()
+        frames = list(ctx.stack)
+        buffers = [frame.moves for frame in frames]
+        for depth in (1, 2, 3):
+            self._search(ctx, depth)
+        assert all(a is b for a, b in zip(ctx.stack, frames))
+        assert all(frame.moves is buffer for frame, buffer in zip(ctx.stack, buffers))
+
+    def test_ply_nodes_add_up(self):
+        """Per-ply counters account for every node."""
+        ctx = SearchContext()
+        self._search(ctx)
+        counts = ctx.ply_nodes()
+        assert sum(counts) == ctx.nodes
+        assert counts[0] == 0  # The root is searched by _search_at_depth
+        assert counts[1] > 0
+        assert len(counts) > 3  # Quiescence plies below the horizon
+
+    def test_static_eval_recorded(self):
+        """Quiescence records its stand-pat in its frame."""
+        ctx = SearchContext()
+        self._search(ctx, 1)
+        assert ctx.stack[1].static_eval is not None
+
+
+class TestConcurrentSearches:
+    """Searches on the same MinMaxAI no longer stop each other."""
+
+    def setup_method(self):
+        self.board = Board(20, 20)
+        self.board.place_stone(10, 10, 1)
+        self.board.place_stone(11, 11, 2)
+        self.ai = MinMaxAI()
+
+    def test_cancelled_context_returns_immediately(self):
+        """negamax on a cancelled context does no work."""
+        ctx = SearchContext()
+        ctx.cancel()
+        value = self.ai.negamax(
+            self.board, 4, -constants.INFINITY, constants.INFINITY, 1, ctx
+        )
+        assert value == 0
+        assert ctx.nodes == 0
+
+    def test_cancel_one_search_only(self):
+        """Cancelling one context leaves a concurrent search running."""
+        stopped = SearchContext()
+        running = SearchContext(deadline=time.time() + 0.2)
+        thread = threading.Thread(
+            target=self.ai.negamax,
+            args=(self.board.copy(), 3, -constants.INFINITY, constants.INFINITY, 1, stopped),
+        )
+        thread.start()
+        stopped.cancel()
+        self.ai.negamax(
+            self.board.copy(), 3, -constants.INFINITY, constants.INFINITY, 1, running
+        )
+        thread.join(timeout=1.0)
+
+        assert not thread.is_alive()
+        assert running.nodes > stopped.nodes
+
+    def test_stop_pondering_spares_turn_search(self):
+        """Stopping pondering does not cancel the turn's context."""
+        ponder = PonderManager(self.ai)
+        ponder.start_pondering(self.board, (11, 11), 1)
+        ponder.stop_pondering()
+
+        assert not self.ai.ctx.stop.cancelled
+
+    def test_ai_stop_cancels_turn(self):
+        """ai.stop() (watchdog) cancels the current turn's search."""
+        ctx = self.ai.ctx
+        self.ai.stop()
+        assert ctx.stopped
+
+    def test_nodes_follow_turn_context(self):
+        """ai.nodes reads and resets the current context's counter."""
+        self.ai.nodes = 0
+        self.ai.negamax(
+            self.board, 2, -constants.INFINITY, constants.INFINITY, 1
+        )
+        assert self.ai.nodes == self.ai.ctx.nodes > 0
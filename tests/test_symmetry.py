@@ -0,0 +1,182 @@
+##
+## EPITECH PROJECT, 2025
+## Gomoku
+## File description:
+## Tests for symmetry-canonical hashing in the early game
+##
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from game.board import Board, symmetry_transforms
+from game.ai import MinMaxAI
+from game.search_context import SearchContext
+from game import constants
+
+
+# Symmetric about the board's centre (9.5, 9.5): rotation by 180 degrees
+# and both diagonal reflections map it onto itself
+SYMMETRIC = [(9, 9, 1), (10, 10, 1), (9, 10, 2), (10, 9, 2)]
+
+
+def make_board(stones, size=20):
+    board = Board(size, size)
+    for x, y, p in stones:
+        board.place_stone(x, y, p)
+    return board
+
+
+def image(stones, t, size=20):
+    transform = symmetry_transforms(size - 1)[t]
+    return [transform(x, y) + (p,) for x, y, p in stones]
+
+
+class TestSymmetricHashes:
+    """Board hashes of the 8 symmetric images."""
+
+    def test_incremental_matches_rebuild(self):
+        """Hashes kept per move equal the ones rebuilt from the stones."""
+        board = make_board([(9, 9, 1)])
+        board.enable_symmetry()
+        for x, y, p in [(10, 11, 2), (8, 12, 1), (3, 4, 2)]:
+            board.place_stone(x, y, p)
+        board.undo_stone(3, 4, 2)
+        kept = board.sym_hashes[:]
+        board.enable_symmetry()
+        assert kept == board.sym_hashes
+        assert kept[0] == board.current_hash
+
+    def test_images_share_canonical_hash(self):
+        """Every symmetric image of a position has the same canonical hash."""
+        stones = [(9, 9, 1), (10, 11, 2), (8, 12, 1)]
+        hashes = set()
+        for t in range(8):
+            board = make_board(image(stones, t))
+            board.enable_symmetry()
+            hashes.add(board.canonical_hash()[0])
+        assert len(hashes) == 1
+
+    def test_off_by_default(self):
+        """Boards do not track symmetry unless asked."""
+        board = make_board([(9, 9, 1)])
+        assert board.sym_hashes is None
+        assert board.canonical_hash() == (board.current_hash, 0)
+
+    def test_copy_keeps_tracking(self):
+        """A copy tracks its own symmetric hashes."""
+        board = make_board(SYMMETRIC)
+        board.enable_symmetry()
+        copy = board.copy()
+        copy.place_stone(0, 0, 1)
+        assert copy.sym_hashes != board.sym_hashes
+        copy.undo_stone(0, 0, 1)
+        assert copy.sym_hashes == board.sym_hashes
+
+    def test_rectangular_board(self):
+        """Only square boards have the 8 symmetries."""
+        board = Board(20, 15)
+        assert board.enable_symmetry() is False
+        assert board.stabilizer() == []
+
+
+class TestStabilizer:
+    """Symmetries mapping a position onto itself."""
+
+    def test_symmetric_position(self):
+        """The symmetric square of four stones keeps three symmetries."""
+        assert make_board(SYMMETRIC).stabilizer() == [2, 6, 7]
+
+    def test_empty_board(self):
+        """The empty board is fully symmetric."""
+        assert make_board([]).stabilizer() == list(range(1, 8))
+
+    def test_asymmetric_position(self):
+        """An off-centre stone breaks every symmetry."""
+        assert make_board([(9, 9, 1), (3, 5, 2)]).stabilizer() == []
+
+    def test_cell_maps_round_trip(self):
+        """from_symmetry undoes to_symmetry."""
+        board = make_board([])
+        board.enable_symmetry()
+        for t in range(8):
+            for cell in (0, 37, 399):
+                assert board.from_symmetry(board.to_symmetry(cell, t), t) == cell
+        assert board.to_symmetry(None, 3) is None
+
+
+class TestSymmetricSearch:
+    """Canonical TT keys and root pruning in the AI."""
+
+    def setup_method(self):
+        self.ai = MinMaxAI()
+
+    def test_switches_off_when_asymmetric(self):
+        """Tracking is on for a symmetric position and off after it."""
+        board = make_board(SYMMETRIC)
+        self.ai._set_symmetry(board)
+        assert board.sym_hashes is not None
+        board.place_stone(3, 5, 1)
+        self.ai._set_symmetry(board)
+        assert board.sym_hashes is None
+
+    def test_disabled(self):
+        """With symmetry off, nothing is tracked."""
+        self.ai.symmetry = False
+        board = make_board(SYMMETRIC)
+        self.ai._set_symmetry(board)
+        assert board.sym_hashes is None
+
+    def test_late_game_off(self):
+        """Past SYMMETRY_MAX_MOVES nothing is tracked."""
+        stones = []
+        for i in range(constants.SYMMETRY_MAX_MOVES // 4 + 1):
+            d = i + 1
+            stones += [(9 - d, 9 - d, 1), (10 + d, 10 + d, 1),
+                       (9 - d, 10 + d, 2), (10 + d, 9 - d, 2)]
+        board = make_board(stones)
+        assert board.stabilizer()
+        self.ai._set_symmetry(board)
+        assert board.sym_hashes is None
+
+    def test_unique_root_moves(self):
+        """Root moves equivalent under the position's symmetries are searched once."""
+        board = make_board(SYMMETRIC)
+        moves = board.get_valid_moves()
+        assert self.ai._unique_root_moves(board, moves) == moves
+        board.enable_symmetry()
+        unique = self.ai._unique_root_moves(board, moves)
+        assert len(moves) / 4 <= len(unique) < len(moves) / 2 + 4
+        assert (8, 8) in unique or (11, 11) in unique
+        assert not ((8, 8) in unique and (11, 11) in unique)
+
+    def test_tt_shared_by_images(self):
+        """An image of a searched position finds its entry and best move."""
+        stones = [(9, 9, 1), (10, 11, 2), (8, 12, 1)]
+        board = make_board(stones)
+        board.enable_symmetry()
+        self.ai.negamax(board, 2, -constants.INFINITY, constants.INFINITY, 2,
+                        SearchContext())
+        key, sym = board.canonical_hash()
+        best = board.from_symmetry(
+            self.ai.transposition_table[key]["best_move"], sym
+        )
+        assert board.cells[best] == 0
+
+        t = 1
+        other = make_board(image(stones, t))
+        other.enable_symmetry()
+        other_key, other_sym = other.canonical_hash()
+        assert other_key == key
+        mapped = other.from_symmetry(
+            self.ai.transposition_table[key]["best_move"], other_sym
+        )
+        assert mapped == other.to_symmetry(best, t)
+
+    def test_best_move_on_symmetric_board(self):
+        """A full turn on a symmetric position returns a legal move."""
+        board = make_board(SYMMETRIC + [(8, 11, 1), (11, 8, 1)])
+        self.ai.calibration.response_deadline = 1.0
+        move = self.ai.get_best_move(board, 2)
+        assert move in board.get_valid_moves()
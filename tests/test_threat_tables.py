@@ -0,0 +1,128 @@
+##
+## EPITECH PROJECT, 2025
+## Gomoku
+## File description:
+## Tests for the gain/cost/rest threat tables of threat-space search
+##
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from game.board import Board
+from game.ai import MinMaxAI
+from game.threats import best_kind, threats_at
+from game import constants
+
+
+def decoded(board, cells):
+    """Set of (x, y) for encoded cells."""
+    return {board.decode(cell) for cell in cells}
+
+
+class TestLineThreats:
+    """Kinds, cost squares and rest squares of single-line threats."""
+
+    def setup_method(self):
+        self.board = Board(20, 20)
+
+    def _threat(self, x, y, player=1):
+        found = threats_at(self.board, self.board.encode(x, y), player)
+        assert len(found) == 1
+        return found[0]
+
+    def test_open_three(self):
+        """..XXX..: costs on both ends, rests on the far ends."""
+        for x in (9, 10):
+            self.board.place_stone(x, 10, 1)
+        threat = self._threat(11, 10)
+        assert threat.kind == constants.THREAT_THREE
+        assert decoded(self.board, threat.costs) == {(8, 10), (12, 10)}
+        assert decoded(self.board, threat.rests) == {(7, 10), (13, 10)}
+
+    def test_three_against_a_stone(self):
+        """O.XXX..: one straight four left, three squares stop it."""
+        for x in (9, 10):
+            self.board.place_stone(x, 10, 1)
+        self.board.place_stone(7, 10, 2)
+        threat = self._threat(11, 10)
+        assert threat.kind == constants.THREAT_THREE
+        assert decoded(self.board, threat.costs) == {(8, 10), (12, 10), (13, 10)}
+
+    def test_split_three(self):
+        """.X.XX.: the gap and both ends are costs."""
+        for x in (9, 10):
+            self.board.place_stone(x, 10, 1)
+        threat = self._threat(7, 10)
+        assert threat.kind == constants.THREAT_THREE
+        assert decoded(self.board, threat.costs) == {(6, 10), (8, 10), (11, 10)}
+
+    def test_four(self):
+        """XX.X + X: the gap is the only cost."""
+        for x in (9, 10, 12):
+            self.board.place_stone(x, 10, 1)
+        threat = self._threat(13, 10)
+        assert threat.kind == constants.THREAT_FOUR
+        assert decoded(self.board, threat.costs) == {(11, 10)}
+
+    def test_straight_four_and_five(self):
+        """A straight four has both completions as costs, a five none."""
+        for y in (5, 6, 7):
+            self.board.place_stone(3, y, 2)
+        threat = self._threat(3, 8, 2)
+        assert threat.kind == constants.THREAT_STRAIGHT_FOUR
+        assert decoded(self.board, threat.costs) == {(3, 4), (3, 9)}
+        self.board.place_stone(3, 8, 2)
+        assert self._threat(3, 9, 2).kind == constants.THREAT_FIVE
+
+    def test_edge_and_diagonal(self):
+        """Next to the edge, one straight four is left; diagonals map back to cells."""
+        for i in (1, 2):
+            self.board.place_stone(i, i, 1)
+        threat = self._threat(3, 3)
+        assert threat.kind == constants.THREAT_THREE
+        assert decoded(self.board, threat.costs) == {(0, 0), (4, 4), (5, 5)}
+        assert best_kind(self.board, self.board.encode(3, 4), 1) == 0
+
+
+class TestThreatSearch:
+    """_get_threat_moves / _get_defense_moves read the tables."""
+
+    def setup_method(self):
+        self.board = Board(20, 20)
+        self.ai = MinMaxAI()
+
+    def test_threat_moves_match_tables(self):
+        """Threat moves are exactly the squares with a threat kind."""
+        for x, y, p in [(10, 10, 1), (11, 10, 1), (10, 11, 2), (12, 12, 1)]:
+            self.board.place_stone(x, y, p)
+        moves = set(self.ai._get_threat_moves(self.board, 1))
+        assert moves == {
+            self.board.decode(m) for m in self.board.get_valid_cells()
+            if best_kind(self.board, m, 1)
+        }
+        assert (12, 10) in moves
+
+    def test_exact_replies_to_a_three(self):
+        """Against a known three, only its costs and counter-fours are tried."""
+        for x in (9, 10):
+            self.board.place_stone(x, 10, 1)
+        for x in (5, 6, 7):
+            self.board.place_stone(x, 15, 2)
+        made = threats_at(self.board, self.board.encode(11, 10), 1)
+        self.board.place_stone(11, 10, 1)
+        replies = set(self.ai._get_defense_moves(self.board, 1, made))
+        assert replies == {(8, 10), (12, 10), (3, 15), (4, 15), (8, 15), (9, 15)}
+
+    def test_four_before_three(self):
+        """A move making a four and a three is answered on the four only."""
+        for x, y in [(9, 10), (10, 10), (11, 10), (12, 11), (12, 12)]:
+            self.board.place_stone(x, y, 1)
+        self.board.place_stone(8, 10, 2)
+        made = threats_at(self.board, self.board.encode(12, 10), 1)
+        assert {t.kind for t in made} == {
+            constants.THREAT_FOUR, constants.THREAT_THREE
+        }
+        self.board.place_stone(12, 10, 1)
+        assert self.ai._get_defense_moves(self.board, 1, made) == [(13, 10)]
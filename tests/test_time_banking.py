@@ -63,6 +63,26 @@ class TestTimeBanking:
         final_tt_size = len(self.ai.transposition_table)
         assert final_tt_size >= initial_tt_size
 
+    def test_counter_attack_searches_a_copy(self):
+        """The counter-attack phase never places stones on the caller's board"""
+        for i in range(3):
+            self.board.place_stone(10 + i, 10, 1)
+        self.board.place_stone(5, 5, 2)
+        boards = []
+        search = self.ai._threat_space_search
+        self.ai._threat_space_search = (
+            lambda board, *args, **kw: boards.append(board) or search(board, *args, **kw)
+        )
+        self.ai._get_top_opponent_moves = lambda *args, **kw: []  # Skip warming
+        self.ai.calibration.response_deadline = 1.0
+        before = self.board.current_hash
+        start = time.time()
+        self.ai._time_banked_return(
+            self.board, 1, (9, 10), start, self.ai.ctx
+        )
+        assert boards and all(board is not self.board for board in boards)
+        assert self.board.current_hash == before
+
     def test_get_top_opponent_moves(self):
         """Should return top N predicted opponent moves"""
         # Create a position with some stones
@@ -0,0 +1,107 @@
+##
+## EPITECH PROJECT, 2025
+## Gomoku
+## File description:
+## Tests for stability-based time management
+##
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from game import constants
+from game.time_manager import IterationTimer
+
+
+class TestIterationTimerLimits:
+    """Tests for the time limit derived from root stability."""
+
+    def setup_method(self):
+        self.timer = IterationTimer(search_start=0.0, hard_limit=4.0)
+
+    def test_hard_limit_before_min_depth(self):
+        """Shallow iterations give no stability signal: keep the full budget."""
+        self.timer.record(1, (10, 10), 100, 0.01)
+        assert self.timer.time_limit() == self.timer.hard_limit
+        assert self.timer.soft_limit < self.timer.hard_limit
+
+    def test_settled_root_uses_soft_limit(self):
+        """Past the minimum depth with no flip, the soft budget applies."""
+        for depth in range(1, constants.STABILITY_MIN_DEPTH + 1):
+            self.timer.record(depth, (10, 10), 100, 0.01 * depth)
+        self.timer.stable_iterations = 0
+        assert self.timer.time_limit() == self.timer.soft_limit
+
+    def test_stable_root_shrinks_limit(self):
+        """Same best move over several iterations stops before the soft limit."""
+        last_depth = constants.STABILITY_MIN_DEPTH + constants.STABILITY_ITERATIONS
+        for depth in range(1, last_depth):
+            self.timer.record(depth, (10, 10), 100, 0.01 * depth)
+
+        assert self.timer.stable_iterations >= constants.STABILITY_ITERATIONS
+        assert self.timer.time_limit() < self.timer.soft_limit
+
+    def test_changed_move_extends_to_hard_limit(self):
+        """A best move flip at the last depth extends into banked time."""
+        for depth in range(1, constants.STABILITY_MIN_DEPTH):
+            self.timer.record(depth, (10, 10), 100, 0.01 * depth)
+        self.timer.record(constants.STABILITY_MIN_DEPTH, (11, 11), 100, 0.5)
+
+        assert self.timer.unstable
+        assert self.timer.move_changes == 1
+        assert self.timer.time_limit() == self.timer.hard_limit
+
+    def test_score_swing_extends_to_hard_limit(self):
+        """A large score swing with the same move is also unstable."""
+        for depth in range(1, constants.STABILITY_MIN_DEPTH):
+            self.timer.record(depth, (10, 10), 100, 0.01 * depth)
+        swing = constants.STABILITY_SCORE_MARGIN + 1
+        self.timer.record(constants.STABILITY_MIN_DEPTH, (10, 10), 100 + swing, 0.5)
+
+        assert self.timer.unstable
+        assert self.timer.time_limit() == self.timer.hard_limit
+
+
+class TestIterationTimerStop:
+    """Tests for should_stop decisions."""
+
+    def test_always_stops_at_hard_limit(self):
+        """Hard limit is never exceeded, even on an unstable root."""
+        timer = IterationTimer(search_start=0.0, hard_limit=4.0)
+        assert timer.should_stop(4.0)
+        assert timer.stop_reason == "deadline"
+
+    def test_does_not_stop_early_without_iterations(self):
+        """Nothing recorded yet: keep searching past the soft limit."""
+        timer = IterationTimer(search_start=0.0, hard_limit=4.0)
+        assert not timer.should_stop(timer.soft_limit + 0.01)
+
+    def test_stable_root_stops_when_next_iteration_cannot_finish(self):
+        """Stable root stops if the next iteration would overrun the limit."""
+        timer = IterationTimer(search_start=0.0, hard_limit=4.0)
+        for depth in range(1, constants.STABILITY_MIN_DEPTH + 1):
+            timer.record(depth, (10, 10), 100, 0.5 * depth)
+
+        assert timer.should_stop(timer.last_finish)
+        assert timer.stop_reason == "stable"
+
+    def test_unstable_root_keeps_searching(self):
+        """Unstable root keeps going past the soft limit."""
+        timer = IterationTimer(search_start=0.0, hard_limit=4.0)
+        for depth in range(1, constants.STABILITY_MIN_DEPTH):
+            timer.record(depth, (10, 10), 100, 0.1 * depth)
+        timer.record(constants.STABILITY_MIN_DEPTH, (9, 9), 100, 0.5)
+
+        assert not timer.should_stop(timer.soft_limit + 0.01)
+
+    def test_stats_report_changes(self):
+        """Stats expose best-move changes for the per-turn search log."""
+        timer = IterationTimer(search_start=0.0, hard_limit=4.0)
+        timer.record(1, (10, 10), 0, 0.1)
+        timer.record(2, (11, 10), 0, 0.2)
+        timer.record(3, (10, 10), 0, 0.3)
+
+        stats = timer.stats()
+        assert stats["changes"] == 2
+        assert "stop" in stats
@@ -102,6 +102,25 @@ class TestVCTSearch:
         result = self.ai._vct_search(self.board, 1, 1, depth=0, max_depth=4)
         assert result is False
 
+    def test_single_four_can_be_blocked(self):
+        """At the defender's turn, a closed four is not a win yet"""
+        self.board.place_stone(9, 10, 2)
+        for i in range(4):
+            self.board.place_stone(10 + i, 10, 1)
+        result = self.ai._vct_search(self.board, 2, 1, depth=0, max_depth=1)
+        assert result is False
+
+    def test_defender_counter_four_refutes_three(self):
+        """An open three is no threat while the defender has a three too"""
+        for i in range(3):
+            self.board.place_stone(11, 7 + i, 2)
+        self.board.place_stone(11, 11, 1)
+        self.board.place_stone(10, 10, 1)
+        self.board.place_stone(9, 10, 1)
+        self.board.place_stone(12, 12, 1)  # Our open three on the diagonal
+        result = self.ai._vct_search(self.board, 2, 1, depth=0, max_depth=6)
+        assert result is False
+
 
 class TestThreatSpaceSearch:
     def setup_method(self):
@@ -156,7 +175,8 @@ class TestThreatSpaceSearch:
         if move is not None:
             x, y = move
             # Verify the move is adjacent to existing stones
-            assert abs(x - 10) <= 2 and abs(y - 10) <= 2
+            stones = [(10, 8), (10, 9), (9, 10), (10, 10)]
+            assert any(abs(x - sx) <= 2 and abs(y - sy) <= 2 for sx, sy in stones)
 
 
 class TestTSSIntegration:
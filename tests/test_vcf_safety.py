@@ -0,0 +1,184 @@
+##
+## EPITECH PROJECT, 2025
+## Gomoku
+## File description:
+## Tests for the opponent VCF safety check on the chosen move
+##
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from game.board import Board
+from game.ai import MinMaxAI
+from game.search_context import SearchContext
+from game import constants
+
+
+def vcf_board():
+    """
+    Player 2 wins by continuous fours: (10, 10) makes a four on row 10
+    (blocked at (11, 10)) that also completes an open-ended four on
+    column 10 with (10, 6)..(10, 9).
+    """
+    board = Board(20, 20)
+    for x, y in [(7, 10), (8, 10), (9, 10), (10, 7), (10, 8), (10, 9)]:
+        board.place_stone(x, y, 2)
+    for x, y in [(6, 10), (10, 6), (3, 3), (4, 16), (16, 4), (15, 15)]:
+        board.place_stone(x, y, 1)
+    return board
+
+
+def chain_board():
+    """Player 2 wins by a four, the forced block, then an open four."""
+    board = Board(20, 20)
+    # (8, 5) makes a four on row 5 (blocked at (9, 5)) and, with (8, 7) and
+    # (8, 8), lets (8, 6) make an open four on column 8
+    for x, y in [(5, 5), (6, 5), (7, 5), (8, 7), (8, 8)]:
+        board.place_stone(x, y, 2)
+    for x, y in [(4, 5), (15, 15), (3, 14), (14, 2), (1, 1)]:
+        board.place_stone(x, y, 1)
+    return board
+
+
+class TestVCF:
+    """_vcf: a win by continuous fours, the defender only blocking."""
+
+    def setup_method(self):
+        self.ai = MinMaxAI()
+
+    def test_double_four(self):
+        """A four-four point is found and the board left unchanged."""
+        board = vcf_board()
+        before = [row[:] for row in board.grid]
+        move = self.ai._vcf(board, 2, SearchContext())
+        assert board.decode(move) == (10, 10)
+        assert board.grid == before
+
+    def test_chain_of_fours(self):
+        """A four forcing a block, then an open four."""
+        board = chain_board()
+        move = self.ai._vcf(board, 2, SearchContext())
+        assert board.decode(move) == (8, 5)
+
+    def test_open_three(self):
+        """An open three wins by making an open four."""
+        board = Board(20, 20)
+        for x in (9, 10, 11):
+            board.place_stone(x, 10, 2)
+        board.place_stone(3, 3, 1)
+        assert board.decode(self.ai._vcf(board, 2, SearchContext())) in [
+            (8, 10), (12, 10)
+        ]
+
+    def test_no_vcf(self):
+        """A closed three only makes a four that is blocked."""
+        board = Board(20, 20)
+        for x in (9, 10, 11):
+            board.place_stone(x, 10, 2)
+        board.place_stone(8, 10, 1)
+        assert self.ai._vcf(board, 2, SearchContext()) is None
+
+    def test_defender_four_first(self):
+        """Facing a four, the attacker has no VCF."""
+        board = vcf_board()
+        for x in (3, 4, 5, 6):
+            board.place_stone(x, 1, 1)
+        assert self.ai._vcf(board, 2, SearchContext()) is None
+
+    def test_results_cached(self):
+        """Proofs are kept by position and reused on the next call."""
+        board = vcf_board()
+        self.ai._vcf(board, 2, SearchContext())
+        key = (board.current_hash, 2)
+        assert key in self.ai.vcf_cache
+        ctx = SearchContext()
+        assert self.ai._vcf(board, 2, ctx) == self.ai.vcf_cache[key][0]
+        assert ctx.nodes == 0
+
+    def test_depth_limited_refutation_not_reused_shallower(self):
+        """A 'no VCF' cut off by VCF_MAX_DEPTH does not answer a shallower probe."""
+        board = chain_board()
+        # Reached one four short of the limit: the double four is out of reach
+        limit = constants.VCF_MAX_DEPTH
+        assert self.ai._vcf(board, 2, SearchContext(), limit - 1) is None
+        assert self.ai.vcf_cache[(board.current_hash, 2)] == (None, 1)
+        # Reached again with every four left: the VCF is found
+        move = self.ai._vcf(board, 2, SearchContext())
+        assert board.decode(move) == (8, 5)
+        assert self.ai.vcf_cache[(board.current_hash, 2)] == (
+            move, constants.VCF_MAX_DEPTH
+        )
+
+    def test_refutation_reused_at_same_depth(self):
+        """A complete refutation answers later probes with as many fours left."""
+        board = Board(20, 20)
+        for x in (9, 10, 11):
+            board.place_stone(x, 10, 2)
+        board.place_stone(8, 10, 1)
+        assert self.ai._vcf(board, 2, SearchContext(), 3) is None
+        ctx = SearchContext()
+        assert self.ai._vcf(board, 2, ctx, 5) is None
+        assert ctx.nodes == 0
+
+
+class TestSafetyCheck:
+    """_vcf_safety_check on the move chosen by the search."""
+
+    def setup_method(self):
+        self.ai = MinMaxAI()
+        self.board = vcf_board()
+
+    def test_safe_move_kept(self):
+        """A move leaving no VCF is returned as is."""
+        move = self.ai._vcf_safety_check(self.board, 1, (10, 10), SearchContext())
+        assert move == (10, 10)
+
+    def test_refuted_move_replaced(self):
+        """A move ignoring the VCF is replaced by a safe alternative."""
+        ctx = SearchContext()
+        move = self.ai._vcf_safety_check(self.board, 1, (2, 17), ctx)
+        assert move != (2, 17)
+        x, y = move
+        self.board.place_stone(x, y, 1)
+        assert self.ai._vcf(self.board, 2, SearchContext()) is None
+        assert ctx.nodes > 0
+
+    def test_within_budget(self):
+        """The check stays within VCF_CHECK_BUDGET (plus slack)."""
+        start = time.time()
+        self.ai._vcf_safety_check(self.board, 1, (2, 17), SearchContext())
+        assert time.time() - start < constants.VCF_CHECK_BUDGET + 0.1
+
+    def test_disabled(self):
+        """With the check off, the move is never changed."""
+        self.ai.vcf_check = False
+        assert self.ai._vcf_safety_check(
+            self.board, 1, (2, 17), SearchContext()
+        ) == (2, 17)
+
+    def test_stopped_turn_keeps_move(self):
+        """A cancelled turn does not spend time on the check."""
+        ctx = SearchContext()
+        ctx.cancel()
+        assert self.ai._vcf_safety_check(self.board, 1, (2, 17), ctx) == (2, 17)
+
+    def test_budget_reserved(self):
+        """Search and time banking end VCF_CHECK_BUDGET before the deadline."""
+        deadline = self.ai.calibration.response_deadline
+        assert self.ai._response_deadline() == deadline - constants.VCF_CHECK_BUDGET
+        self.ai.vcf_check = False
+        assert self.ai._response_deadline() == deadline
+
+    def test_turn_within_deadline(self):
+        """A full turn with the check ends by the response deadline."""
+        board = Board(20, 20)
+        for x, y, p in [(9, 9, 1), (10, 10, 2), (9, 11, 1), (11, 9, 2)]:
+            board.place_stone(x, y, p)
+        self.ai.calibration.response_deadline = 1.0
+        start = time.time()
+        move = self.ai.get_best_move(board, 1)
+        assert time.time() - start < 1.0 + 0.05
+        assert move in board.get_valid_moves()
@@ -0,0 +1,149 @@
+##
+## EPITECH PROJECT, 2025
+## Gomoku
+## File description:
+## Tests for the parallel threat-space search over a process pool
+##
+
+import sys
+import os
+import multiprocessing
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from game.board import Board
+from game.ai import MinMaxAI
+from game.search_context import SearchContext
+from game import constants, vct_pool
+from game.vct_pool import VCTPool
+
+
+class TestPoolConfig:
+    """The pool is opt-in."""
+
+    def test_off_by_default(self):
+        """With VCT_WORKERS = 0 the search stays in-process."""
+        assert constants.VCT_WORKERS == 0
+        assert MinMaxAI().vct_pool is None
+
+    def test_worker_stop_token(self):
+        """A task stops once its generation is cancelled by the parent."""
+        vct_pool._init_worker(multiprocessing.RawValue("i", 0))
+        token = vct_pool._PoolStopToken(generation=2)
+        assert not token.cancelled
+        vct_pool._cancelled.value = 1
+        assert not token.cancelled
+        vct_pool._cancelled.value = 2
+        assert token.cancelled
+        other = vct_pool._PoolStopToken(generation=3)
+        other.cancel()
+        assert other.cancelled
+
+
+class TestPooledSearch:
+    """Root threat moves proven by worker processes."""
+
+    @classmethod
+    def setup_class(cls):
+        cls.pool = VCTPool(workers=2)
+
+    @classmethod
+    def teardown_class(cls):
+        cls.pool.close()
+
+    def setup_method(self):
+        self.board = Board(20, 20)
+        self.ai = MinMaxAI()
+        self.ai.vct_pool = self.pool
+
+    def test_finds_win(self):
+        """An open three wins by making an open four."""
+        for x in (9, 10, 11):
+            self.board.place_stone(x, 10, 1)
+        self.board.place_stone(5, 5, 2)
+        move = self.ai._threat_space_search(
+            self.board, 1, max_depth=6, time_limit=5.0, ctx=SearchContext()
+        )
+        assert move in [(8, 10), (12, 10)]
+        assert not self.pool.broken
+
+    def test_no_win(self):
+        """A lone two has no VCT, in the workers as in-process."""
+        self.board.place_stone(10, 10, 1)
+        self.board.place_stone(11, 10, 1)
+        self.board.place_stone(5, 5, 2)
+        move = self.ai._threat_space_search(
+            self.board, 1, max_depth=6, time_limit=2.0, ctx=SearchContext()
+        )
+        assert move is None
+        self.ai.vct_pool = None
+        assert self.ai._threat_space_search(
+            self.board, 1, max_depth=6, time_limit=2.0, ctx=SearchContext()
+        ) is None
+
+    def test_busy_pool_searches_in_process(self):
+        """While another search holds the pool, the search runs in-process."""
+        for x in (9, 10, 11):
+            self.board.place_stone(x, 10, 1)
+        with self.pool.lock:
+            move = self.ai._threat_space_search(
+                self.board, 1, max_depth=6, time_limit=2.0, ctx=SearchContext()
+            )
+        assert move in [(8, 10), (12, 10)]
+
+
+class TestPoolStart:
+    """Workers spawned at START."""
+
+    def test_start_spawns_workers(self):
+        """start spawns every worker before any search."""
+        pool = VCTPool(workers=2)
+        try:
+            pool.start()
+            assert len(pool._executor._processes) == 2
+            assert not pool.broken
+        finally:
+            pool.close()
+
+    def test_start_failure(self):
+        """A pool that cannot start is marked broken."""
+        pool = VCTPool(workers=1)
+
+        def fail():
+            raise OSError("cannot spawn")
+
+        pool._start = fail
+        pool.start()
+        assert pool.broken
+
+    def test_close_cancels_queued_tasks(self):
+        """close cancels tasks still queued behind the workers."""
+        pool = VCTPool(workers=1)
+        pool.start()
+        futures = list(pool._futures)
+        pool.close()
+        assert pool._executor is None
+        assert all(f.done() for f in futures)
+
+
+class TestBrokenPool:
+    """A failed pool falls back to the in-process search."""
+
+    def test_fallback(self):
+        """Tasks that cannot run mark the pool broken; the search still answers."""
+        pool = VCTPool(workers=1)
+
+        def fail():
+            raise OSError("cannot spawn")
+
+        pool._start = fail
+        board = Board(20, 20)
+        for x in (9, 10, 11):
+            board.place_stone(x, 10, 1)
+        ai = MinMaxAI()
+        ai.vct_pool = pool
+        move = ai._threat_space_search(
+            board, 1, max_depth=6, time_limit=2.0, ctx=SearchContext()
+        )
+        assert pool.broken
+        assert move in [(8, 10), (12, 10)]
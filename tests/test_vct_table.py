@@ -0,0 +1,126 @@
+##
+## EPITECH PROJECT, 2025
+## Gomoku
+## File description:
+## Tests for the VCT proof table kept across turns
+##
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from game.board import Board
+from game.ai import MinMaxAI
+from game.search_context import SearchContext
+
+
+def three_and_two():
+    """Player 1: an open three on row 10 and a two on column 14."""
+    board = Board(20, 20)
+    for x, y in [(9, 10), (10, 10), (11, 10), (14, 7), (14, 8)]:
+        board.place_stone(x, y, 1)
+    for x, y in [(3, 3), (16, 16), (3, 16), (16, 3), (5, 12)]:
+        board.place_stone(x, y, 2)
+    return board
+
+
+class TestVCTTable:
+    """Proofs and disproofs reused by later searches."""
+
+    def setup_method(self):
+        self.ai = MinMaxAI()
+        self.board = three_and_two()
+
+    def _search(self, board, player):
+        """Threat-space search; returns the move and the number of VCT nodes."""
+        calls = []
+        search = self.ai._vct_search
+        self.ai._vct_search = lambda *args, **kw: calls.append(1) or search(*args, **kw)
+        try:
+            move = self.ai._threat_space_search(
+                board, player, max_depth=10, time_limit=2.0, ctx=SearchContext()
+            )
+        finally:
+            del self.ai._vct_search
+        return move, len(calls)
+
+    def test_root_proof_stored(self):
+        """A proven root move is stored for its position."""
+        move, _ = self._search(self.board, 1)
+        assert move is not None
+        entry = self.ai.vct_table.get((self.board.current_hash, 1, 1))
+        assert entry[:2] == (True, move)
+
+    def test_proof_replayed_next_turn(self):
+        """After a defence inside the proof, the win is replayed without search."""
+        board = Board(20, 20)
+        # Two open twos crossing at (11, 10): a double three
+        for x, y in [(9, 10), (10, 10), (11, 8), (11, 9)]:
+            board.place_stone(x, y, 1)
+        for x, y in [(3, 3), (16, 16), (3, 16), (16, 3)]:
+            board.place_stone(x, y, 2)
+        move, _ = self._search(board, 1)
+        assert move == (11, 10)
+        board.place_stone(*move, 1)
+        replayed = 0
+        for reply in self.ai._get_defense_moves(board, 1):
+            board.place_stone(*reply, 2)
+            entry = self.ai.vct_table.get((board.current_hash, 1, 1))
+            if entry is not None:
+                again, nodes = self._search(board, 1)
+                assert again == entry[1]
+                assert nodes == 0
+                replayed += 1
+            board.undo_stone(*reply, 2)
+        assert replayed > 0
+
+    def test_truncated_proof_not_replayed(self):
+        """A proof that skipped defences is searched again on a later turn."""
+        move, _ = self._search(self.board, 1)
+        key = (self.board.current_hash, 1, 1)
+        self.ai.vct_table[key] = (True, move, self.ai.age - 1)
+        again, nodes = self._search(self.board, 1)
+        assert nodes > 0
+        assert again is not None
+
+        self.ai.vct_table[key] = (True, move, None)
+        again, nodes = self._search(self.board, 1)
+        assert (again, nodes) == (move, 0)
+
+    def test_complete_proof_tagged(self):
+        """A proof with every defence searched holds on any turn."""
+        board = Board(20, 20)
+        # Open four: the defender can block only one end
+        for x in (9, 10, 11, 12):
+            board.place_stone(x, 10, 1)
+        board.place_stone(3, 3, 2)
+        assert self.ai._vct_search(board, 2, 1, 0, 4, SearchContext()) is True
+        assert self.ai.vct_table.get((board.current_hash, 2, 1)) == (True, None, None)
+
+    def test_disproof_skipped(self):
+        """A refuted position is not searched again at the same depth."""
+        board = Board(20, 20)
+        board.place_stone(10, 10, 1)
+        board.place_stone(11, 10, 1)
+        board.place_stone(9, 9, 2)
+        move, first = self._search(board, 1)
+        assert move is None
+        move, again = self._search(board, 1)
+        assert move is None
+        assert again < first
+
+    def test_deeper_search_not_skipped(self):
+        """A disproof at a shallower depth does not answer a deeper search."""
+        key = (self.board.current_hash, 2, 1)
+        self.ai.vct_table[key] = (False, 2)
+        assert self.ai._vct_search(self.board, 2, 1, 0, 2, SearchContext()) is False
+        result = self.ai._vct_search(self.board, 2, 1, 0, 10, SearchContext())
+        assert self.ai.vct_table.get(key)[:2] == (result, None if result else 10)
+
+    def test_kept_across_turns(self):
+        """A new turn keeps the table."""
+        self._search(self.board, 1)
+        size = len(self.ai.vct_table)
+        self.ai.get_best_move(self.board, 2)
+        assert len(self.ai.vct_table) >= size > 0
@@ -0,0 +1,126 @@
+##
+## EPITECH PROJECT, 2025
+## Gomoku
+## File description:
+## Tests for the hard-deadline watchdog and emergency moves
+##
+
+import sys
+import os
+import time
+from io import StringIO
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from communication import CommunicationManager
+from communication.protocol.commands import Command, CommandType
+from communication.protocol.responses import ResponseType
+from game.board import Board
+from game.ai import MinMaxAI
+from game import constants as game_constants
+from main import GameContext
+
+
+class HangingContext:
+    """Context whose search never returns in time."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.emergency_calls = 0
+
+    def process_opponent_move(self, x: int, y: int) -> None:
+        pass
+
+    def get_best_move(self) -> tuple[int, int]:
+        time.sleep(self.delay)
+        return (1, 1)
+
+    def get_emergency_move(self) -> tuple[int, int]:
+        self.emergency_calls += 1
+        return (7, 7)
+
+
+class TestManagerWatchdog:
+    def setup_method(self):
+        self.original_deadline = game_constants.WATCHDOG_DEADLINE
+        game_constants.WATCHDOG_DEADLINE = 0.2
+
+    def teardown_method(self):
+        game_constants.WATCHDOG_DEADLINE = self.original_deadline
+
+    def _turn(self, context):
+        manager = CommunicationManager(
+            context, input_stream=StringIO(), output_stream=StringIO()
+        )
+        command = Command(CommandType.TURN, {"x": 5, "y": 5})
+        start = time.time()
+        responses = manager.process_command(command)
+        return responses, time.time() - start
+
+    def test_hung_search_gets_emergency_reply(self):
+        """A search past the hard deadline is answered with the emergency move."""
+        context = HangingContext(delay=2.0)
+        responses, elapsed = self._turn(context)
+
+        assert responses[0].type == ResponseType.MOVE
+        assert responses[0].to_output() == "7,7"
+        assert context.emergency_calls == 1
+        assert elapsed < 1.0
+
+    def test_fast_search_is_used(self):
+        """A search finishing in time is sent as is."""
+        context = HangingContext(delay=0.0)
+        responses, _ = self._turn(context)
+
+        assert responses[0].to_output() == "1,1"
+        assert context.emergency_calls == 0
+
+
+class TestAIEmergencyMove:
+    def setup_method(self):
+        self.board = Board(20, 20)
+        self.ai = MinMaxAI()
+
+    def test_emergency_move_always_valid(self):
+        """Without any search, the emergency move is still a legal move."""
+        self.board.place_stone(10, 10, 1)
+        move = self.ai.get_emergency_move(self.board)
+        assert move is not None
+        assert self.board.is_valid_position(move[0], move[1])
+
+    def test_critical_move_recorded(self):
+        """Fast critical checks update the emergency move for the position."""
+        for i in range(4):
+            self.board.place_stone(10 + i, 10, 2)
+        self.board.place_stone(5, 5, 1)
+
+        move = self.ai._check_immediate_critical(self.board, 1)
+        self.ai._set_emergency_move(self.board.current_hash, move)
+
+        assert self.ai.get_emergency_move(self.board) in [(9, 10), (14, 10)]
+
+    def test_stale_emergency_move_ignored(self):
+        """A recorded move that is now occupied falls back to a valid one."""
+        self.board.place_stone(10, 10, 1)
+        self.ai._set_emergency_move(self.board.current_hash, (10, 10))
+        move = self.ai.get_emergency_move(self.board)
+        assert move != (10, 10)
+        assert self.board.is_valid_position(move[0], move[1])
+
+
+class TestContextCommit:
+    def setup_method(self):
+        self.context = GameContext()
+        self.context.board = Board(20, 20)
+        self.context.ai = MinMaxAI()
+        self.context.board.place_stone(10, 10, 2)
+
+    def test_emergency_commits_once(self):
+        """After the watchdog replied, a late search result is not played."""
+        self.context._move_pending = True
+        emergency = self.context.get_emergency_move()
+        late = self.context._commit_move((3, 3))
+
+        assert late == emergency
+        assert self.context.board.grid[3][3] == 0
+        assert self.context.board.grid[emergency[1]][emergency[0]] == 1
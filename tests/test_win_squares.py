@@ -0,0 +1,181 @@
+##
+## EPITECH PROJECT, 2025
+## Gomoku
+## File description:
+## Tests for the per-player winning and four-making square sets
+##
+
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from game.board import Board
+from game.ai import MinMaxAI
+
+
+def squares(board, kind, player):
+    """Decoded squares of board.win_squares / four_squares."""
+    return {board.decode(m) for m in getattr(board, kind)[player]}
+
+
+def brute_force(board, player):
+    """Win and four squares by placing a stone on every empty cell."""
+    ai = MinMaxAI()
+    wins, fours = set(), set()
+    for y in range(board.height):
+        for x in range(board.width):
+            if board.grid[y][x]:
+                continue
+            board.place_stone(x, y, player)
+            if board.check_win(x, y, player):
+                wins.add((x, y))
+            board.undo_stone(x, y, player)
+            # Four-of-five windows, as _makes_four used to scan them
+            for dx, dy in [(1, 0), (0, 1), (1, 1), (1, -1)]:
+                for offset in range(-4, 1):
+                    cells = [(x + i * dx, y + i * dy) for i in range(offset, offset + 5)]
+                    if not all(0 <= cx < board.width and 0 <= cy < board.height
+                               for cx, cy in cells):
+                        continue
+                    stones = [board.grid[cy][cx] for cx, cy in cells]
+                    if 3 - player not in stones and stones.count(player) == 3:
+                        fours.add((x, y))
+    return wins, fours
+
+
+class TestWinSquares:
+    """Empty cells completing five."""
+
+    def setup_method(self):
+        self.board = Board(20, 20)
+
+    def test_open_four_two_wins(self):
+        """.XXXX. wins on both ends."""
+        for i in range(4):
+            self.board.place_stone(5 + i, 5, 1)
+        assert squares(self.board, "win_squares", 1) == {(4, 5), (9, 5)}
+        assert squares(self.board, "win_squares", 2) == set()
+
+    def test_split_four_gap(self):
+        """XX.XX wins in the gap."""
+        for x in (5, 6, 8, 9):
+            self.board.place_stone(x, 7, 2)
+        assert squares(self.board, "win_squares", 2) == {(7, 7)}
+
+    def test_edge_four(self):
+        """A four against the edge has one winning square."""
+        for i in range(4):
+            self.board.place_stone(0, i, 1)
+        assert squares(self.board, "win_squares", 1) == {(0, 4)}
+
+    def test_overline_wins(self):
+        """XXX.XX: the gap makes six, which check_win counts as a win."""
+        for x in (3, 4, 5, 7, 8):
+            self.board.place_stone(x, 3, 1)
+        assert (6, 3) in squares(self.board, "win_squares", 1)
+
+    def test_blocked_and_undone(self):
+        """Blocking removes the square, undoing the block restores it."""
+        for i in range(4):
+            self.board.place_stone(5 + i, 5, 1)
+        self.board.place_stone(9, 5, 2)
+        assert squares(self.board, "win_squares", 1) == {(4, 5)}
+        self.board.undo_stone(9, 5, 2)
+        assert squares(self.board, "win_squares", 1) == {(4, 5), (9, 5)}
+
+
+class TestFourSquares:
+    """Empty cells making a four."""
+
+    def test_three_makes_fours(self):
+        """.XXX. makes a four on the four cells beside it."""
+        board = Board(20, 20)
+        for i in range(3):
+            board.place_stone(10 + i, 10, 1)
+        assert squares(board, "four_squares", 1) == {(8, 10), (9, 10), (13, 10), (14, 10)}
+
+    def test_matches_makes_four(self):
+        """_makes_four reads the set."""
+        board = Board(20, 20)
+        for i in range(3):
+            board.place_stone(10, 10 + i, 2)
+        ai = MinMaxAI()
+        assert ai._makes_four(board, 10, 9, 2)
+        assert not ai._makes_four(board, 11, 9, 2)
+
+
+class TestIncrementalUpdates:
+    """The sets follow any sequence of moves, undos and copies."""
+
+    def test_random_games_match_brute_force(self):
+        """Sets equal a full scan after random moves and undos."""
+        rng = random.Random(7)
+        for size in (20, 15):
+            board = Board(size, size)
+            played = []
+            for step in range(80):
+                if played and rng.random() < 0.25:
+                    x, y, p = played.pop()
+                    board.undo_stone(x, y, p)
+                else:
+                    if played and rng.random() < 0.7:
+                        hx, hy, _ = rng.choice(played)
+                        x = min(size - 1, max(0, hx + rng.randint(-2, 2)))
+                        y = min(size - 1, max(0, hy + rng.randint(-2, 2)))
+                    else:
+                        x, y = rng.randrange(size), rng.randrange(size)
+                    p = rng.choice((1, 2))
+                    if board.place_stone(x, y, p):
+                        played.append((x, y, p))
+                if step % 10 == 9:
+                    checked = board.copy() if step % 20 == 9 else board
+                    for player in (1, 2):
+                        wins, fours = brute_force(checked, player)
+                        assert squares(checked, "win_squares", player) == wins
+                        assert squares(checked, "four_squares", player) == fours
+
+    def test_probe_cancels(self):
+        """A stone placed and taken back before a read leaves no work behind."""
+        board = Board(20, 20)
+        board.place_stone(10, 10, 1)
+        board.win_squares
+        board.place_stone(11, 10, 1)
+        board.undo_stone(11, 10, 1)
+        assert board._journal == []
+
+    def test_copy_is_independent(self):
+        """Moves on a copy do not change the original's sets."""
+        board = Board(20, 20)
+        for i in range(3):
+            board.place_stone(5 + i, 5, 1)
+        copy = board.copy()
+        copy.place_stone(8, 5, 1)
+        assert squares(copy, "win_squares", 1) == {(4, 5), (9, 5)}
+        assert squares(board, "win_squares", 1) == set()
+
+
+class TestImmediateChecks:
+    """Win and block detection in the AI are set lookups."""
+
+    def setup_method(self):
+        self.board = Board(20, 20)
+        self.ai = MinMaxAI()
+
+    def test_win_anywhere(self):
+        """A win far from the other stones is found."""
+        for i in range(12):
+            self.board.place_stone(i, 19, 2 if i % 3 else 1)
+        for i in range(4):
+            self.board.place_stone(15, 2 + i, 1)
+        assert self.ai._check_immediate_critical(self.board, 1) in [(15, 1), (15, 6)]
+        assert self.ai._has_winning_move(self.board, 1)
+        assert not self.ai._has_winning_move(self.board, 2)
+
+    def test_block(self):
+        """The opponent's only winning square is blocked."""
+        for i in range(4):
+            self.board.place_stone(3 + i, 3, 2)
+        self.board.place_stone(2, 3, 1)
+        assert self.ai._check_immediate_critical(self.board, 1) == (7, 3)